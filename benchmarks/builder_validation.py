@@ -0,0 +1,117 @@
+"""
+Cost of constructing and validating builders.
+
+For each transaction type, builds a typical request the way the
+payment method and service helpers do and validates it, without
+sending anything, and reports the time per builder.
+
+Run from the repository root:
+
+    python -m benchmarks.builder_validation [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+
+from globalpayments.api.builders import (
+    AuthorizationBuilder,
+    ManagementBuilder,
+    RecurringBuilder,
+)
+from globalpayments.api.entities import Address
+from globalpayments.api.entities.enums import TransactionType
+from globalpayments.api.payment_methods import CreditCardData, TransactionReference
+
+CARD = CreditCardData()
+CARD.number = "4111111111111111"
+CARD.exp_month = "12"
+CARD.exp_year = "2030"
+CARD.cvn = "123"
+
+ADDRESS = Address()
+ADDRESS.postal_code = "12345"
+
+REFERENCE = TransactionReference()
+REFERENCE.transaction_id = "1234567890"
+
+
+def sale():
+    return (
+        AuthorizationBuilder(TransactionType.Sale, CARD)
+        .with_amount(10)
+        .with_currency("USD")
+        .with_address(ADDRESS)
+    )
+
+
+def auth():
+    return (
+        AuthorizationBuilder(TransactionType.Auth, CARD)
+        .with_amount(10)
+        .with_currency("USD")
+    )
+
+
+def verify():
+    return AuthorizationBuilder(TransactionType.Verify, CARD)
+
+
+def refund():
+    return (
+        AuthorizationBuilder(TransactionType.Refund, CARD)
+        .with_amount(10)
+        .with_currency("USD")
+    )
+
+
+def capture():
+    return ManagementBuilder(TransactionType.Capture, REFERENCE).with_amount(10)
+
+
+def fetch():
+    return RecurringBuilder(TransactionType.Fetch).with_key("customer-1")
+
+
+CASES = (
+    ("Sale", sale),
+    ("Auth", auth),
+    ("Verify", verify),
+    ("Refund", refund),
+    ("Capture", capture),
+    ("Fetch", fetch),
+)
+
+
+def construct_and_validate(build):
+    builder = build()
+    builder.validations.validate(builder)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print("{:<8} {:>16} {:>16}".format("type", "construct us", "+ validate us"))
+    for name, build in CASES:
+        construct = min(timeit.repeat(build, number=args.iterations, repeat=5))
+        total = min(
+            timeit.repeat(
+                lambda: construct_and_validate(build),
+                number=args.iterations,
+                repeat=5,
+            )
+        )
+        print(
+            "{:<8} {:>16.2f} {:>16.2f}".format(
+                name,
+                construct / args.iterations * 1e6,
+                total / args.iterations * 1e6,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
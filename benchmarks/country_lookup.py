@@ -0,0 +1,141 @@
+"""
+Cost of resolving country spellings when setting `Address.country`.
+
+Sets the country of an address to each spelling in a corpus of names,
+abbreviations and misspellings as customers type them, and reports the
+time per address for the first pass over the corpus and for later
+passes, which repeat spellings already seen. Run it on two revisions to
+compare them.
+
+Run from the repository root:
+
+    python -m benchmarks.country_lookup [--passes N]
+"""
+
+import argparse
+import sys
+import time
+
+from globalpayments.api.entities import Address
+
+SPELLINGS = (
+    "United States",
+    "United States of America",
+    "united states",
+    "UNITED STATES",
+    "USA",
+    "U.S.A.",
+    "US",
+    "America",
+    "Canada",
+    "canada",
+    "CA",
+    "Mexico",
+    "México",
+    "United Kingdom",
+    "UK",
+    "Great Britain",
+    "England",
+    "Scotland",
+    "GB",
+    "Ireland",
+    "Republic of Ireland",
+    "Germany",
+    "Deutschland",
+    "DE",
+    "France",
+    "FR",
+    "Espana",
+    "Spain",
+    "Italy",
+    "Italia",
+    "Netherlands",
+    "The Netherlands",
+    "Holland",
+    "Belgium",
+    "Switzerland",
+    "Schweiz",
+    "Austria",
+    "Sweden",
+    "Norway",
+    "Denmark",
+    "Finland",
+    "Poland",
+    "Czech Republic",
+    "Czechia",
+    "Portugal",
+    "Greece",
+    "Turkey",
+    "Russia",
+    "Russian Federation",
+    "Ukraine",
+    "Israel",
+    "UAE",
+    "United Arab Emirates",
+    "Saudi Arabia",
+    "India",
+    "China",
+    "Hong Kong",
+    "Taiwan",
+    "Japan",
+    "South Korea",
+    "Korea",
+    "Vietnam",
+    "Viet Nam",
+    "Philippines",
+    "Phillipines",
+    "Singapore",
+    "Malaysia",
+    "Indonesia",
+    "Thailand",
+    "Australia",
+    "Austrailia",
+    "New Zealand",
+    "Brazil",
+    "Brasil",
+    "Argentina",
+    "Chile",
+    "Colombia",
+    "Columbia",
+    "Peru",
+    "Puerto Rico",
+    "Dominican Republic",
+    "Jamaica",
+    "Bahamas",
+    "The Bahamas",
+    "Ivory Coast",
+    "Cote d'Ivoire",
+    "Nigeria",
+    "South Africa",
+    "Egypt",
+    "Kenya",
+    "Morocco",
+)
+
+
+def resolve():
+    for spelling in SPELLINGS:
+        Address().country = spelling
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--passes", type=int, default=200)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    resolve()
+    first = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(args.passes):
+        resolve()
+    later = (time.perf_counter() - started) / args.passes
+
+    print("first pass   {:8.2f} us".format(first / len(SPELLINGS) * 1e6))
+    print("later passes {:8.2f} us".format(later / len(SPELLINGS) * 1e6))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Memory used by response entities.
+
+Hydrates report and transaction entities the way the gateways do and
+reports the bytes still allocated per object, children and field values
+included.
+
+Run from the repository root:
+
+    python -m benchmarks.entity_memory [--count N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from benchmarks.thread_scaling import CREDIT_SALE_RESPONSE
+from globalpayments.api.entities import Address
+from globalpayments.api.gateways import PayPlanConnector, PorticoConnector
+from globalpayments.api.payment_methods import CreditCardData, TransactionReference
+
+REPORT_ITEM = {
+    "Amt": "10.00",
+    "AuthAmt": "10.00",
+    "AuthCode": "12345A",
+    "ClientTxnId": "1",
+    "DeviceId": "1234567",
+    "RspCode": "00",
+    "RspText": "APPROVAL",
+    "MaskedCardNbr": "411111******1111",
+    "GatewayRspCode": "0",
+    "GatewayRspMsg": "Success",
+    "RefNbr": "123456789012",
+    "ServiceName": "CreditSale",
+    "TxnStatus": "A",
+    "TxnUtcDT": "2026-01-01T00:00:00",
+    "GatewayTxnId": "1234567890",
+}
+
+CUSTOMER = {
+    "customerKey": "1",
+    "firstName": "John",
+    "lastName": "Doe",
+    "addressLine1": "1 Heartland Way",
+    "city": "Jeffersonville",
+    "stateProvince": "IN",
+    "zipPostalCode": "47130",
+    "country": "United States of America",
+}
+
+
+def new_address():
+    address = Address()
+    address.street_address_1 = "1 Heartland Way"
+    address.city = "Jeffersonville"
+    address.state = "IN"
+    address.postal_code = "47130"
+    address.country_code = "US"
+    return address
+
+
+def new_card():
+    card = CreditCardData()
+    card.number = "4111111111111111"
+    card.exp_month = "12"
+    card.exp_year = "2025"
+    card.cvn = "123"
+    return card
+
+
+def bytes_per_object(create, count):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [create() for _ in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    #  the list holding the objects is not part of their cost
+    used -= sys.getsizeof(objects)
+    return used / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    portico = PorticoConnector()
+    payplan = PayPlanConnector()
+    card = CreditCardData()
+    cases = (
+        (
+            "TransactionSummary",
+            lambda: portico._hydrate_transaction_summary(REPORT_ITEM),
+        ),
+        (
+            "Transaction",
+            lambda: portico._map_response(CREDIT_SALE_RESPONSE, card),
+        ),
+        ("TransactionReference", TransactionReference),
+        ("CreditCardData", new_card),
+        ("Address", new_address),
+        ("Customer + Address", lambda: payplan._hydrate_customer(CUSTOMER)),
+    )
+    print("{:<22} {:>14}".format("entity", "bytes/object"))
+    for name, create in cases:
+        print("{:<22} {:>14.0f}".format(name, bytes_per_object(create, args.count)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Cost of building a typical credit sale with the fluent `with_*` setters.
+
+Builds the request the way an integration would, from
+`CreditCardData.charge(...)` through a chain of `with_*` calls, without
+executing it, and reports the time per builder and per setter call.
+Run it on two revisions to compare them.
+
+Run from the repository root:
+
+    python -m benchmarks.fluent_builder [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+
+from globalpayments.api.entities import Address
+from globalpayments.api.entities.enums import TransactionType
+from globalpayments.api.builders import AuthorizationBuilder
+from globalpayments.api.payment_methods import CreditCardData
+
+CARD = CreditCardData()
+CARD.number = "4111111111111111"
+CARD.exp_month = "12"
+CARD.exp_year = "2030"
+CARD.cvn = "123"
+
+ADDRESS = Address()
+ADDRESS.postal_code = "12345"
+
+#  Setter calls made by `sale`
+SETTERS = 7
+
+
+def sale():
+    return (
+        CARD.charge(10)
+        .with_currency("USD")
+        .with_allow_duplicates(True)
+        .with_invoice_number("1234")
+        .with_client_transaction_id("order-1")
+        .with_customer_id("customer-1")
+        .with_description("Order 1")
+        .with_address(ADDRESS)
+    )
+
+
+def construct():
+    return AuthorizationBuilder(TransactionType.Sale, CARD)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    built = min(timeit.repeat(sale, number=args.iterations, repeat=5))
+    constructed = min(timeit.repeat(construct, number=args.iterations, repeat=5))
+    print("sale builder      {:8.2f} us".format(built / args.iterations * 1e6))
+    print(
+        "per setter call   {:8.2f} us".format(
+            (built - constructed) / args.iterations / SETTERS * 1e6
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Cost of serializing each payment method into a Portico authorization.
+
+For a sale with each built-in payment method class, reports the time
+spent in the class's registered serializer on its own and in the whole
+`_build_authorization` call. Nothing is sent. Run it on two revisions
+to compare them, or after registering a serializer of your own.
+
+Run from the repository root:
+
+    python -m benchmarks.payment_method_serializers [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+import xml.etree.cElementTree as et
+
+from globalpayments.api.builders import AuthorizationBuilder
+from globalpayments.api.entities import RecurringPaymentMethod
+from globalpayments.api.entities.enums import TransactionType
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.portico_serializers import (
+    get_payment_method_serializer,
+)
+from globalpayments.api.payment_methods import (
+    CreditCardData,
+    CreditTrackData,
+    DebitTrackData,
+    EBTCardData,
+    EBTTrackData,
+    ECheck,
+    GiftCard,
+)
+
+TRACK = "%B4012002000060016^VI TEST CREDIT^251210118039000000000396?"
+PIN_BLOCK = "32539F50C245A6A93D123412324000AA"
+
+
+def payment_methods():
+    card = CreditCardData()
+    card.number = "4111111111111111"
+    card.exp_month = "12"
+    card.exp_year = "2030"
+    card.cvn = "123"
+    yield card
+
+    track = CreditTrackData()
+    track.value = TRACK
+    yield track
+
+    debit = DebitTrackData()
+    debit.value = TRACK
+    debit.pin_block = PIN_BLOCK
+    yield debit
+
+    ebt_card = EBTCardData()
+    ebt_card.number = "4012002000060016"
+    ebt_card.exp_month = "12"
+    ebt_card.exp_year = "2030"
+    ebt_card.pin_block = PIN_BLOCK
+    yield ebt_card
+
+    ebt_track = EBTTrackData()
+    ebt_track.value = TRACK
+    ebt_track.pin_block = PIN_BLOCK
+    yield ebt_track
+
+    gift = GiftCard()
+    gift.value = "5022440000000000098"
+    gift.value_type = "CardNbr"
+    yield gift
+
+    check = ECheck()
+    check.routing_number = "122000030"
+    check.account_number = "1357902468"
+    check.check_holder_name = "John Doe"
+    yield check
+
+    recurring = RecurringPaymentMethod("customer-1", "payment-1")
+    yield recurring
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    connector = PorticoConnector()
+    connector.secret_api_key = "skapi_cert_benchmark"
+
+    print("{:<24} {:>12} {:>12}".format("", "serializer", "request"))
+    for payment_method in payment_methods():
+        builder = AuthorizationBuilder(TransactionType.Sale, payment_method)
+        builder.with_amount(10).with_allow_duplicates(True)
+        serializer = get_payment_method_serializer(type(payment_method))
+        serialized = min(
+            timeit.repeat(
+                lambda: serializer(connector, et.Element("Block1"), builder),
+                number=args.iterations,
+                repeat=5,
+            )
+        )
+        built = min(
+            timeit.repeat(
+                lambda: connector._build_authorization(builder),
+                number=args.iterations,
+                repeat=5,
+            )
+        )
+        print(
+            "{:<24} {:9.2f} us {:9.2f} us".format(
+                type(payment_method).__name__,
+                serialized / args.iterations * 1e6,
+                built / args.iterations * 1e6,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
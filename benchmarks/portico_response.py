@@ -0,0 +1,115 @@
+"""
+Parse time and allocations of Portico responses.
+
+Compares the xmltodict conversion `PorticoConnector._map_response` used
+to run with `PorticoResponse.parse`, converting every field or only the
+fields the connector maps, and times the complete mapping to a
+`Transaction`.
+
+Run from the repository root:
+
+    python -m benchmarks.portico_response [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+
+import xmltodict
+
+from benchmarks.thread_scaling import CREDIT_SALE_RESPONSE
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.portico_response import PorticoResponse
+from globalpayments.api.gateways.portico_results import (
+    PORTICO_HEADER_SELECTOR,
+    PORTICO_TRANSACTION_SELECTOR,
+)
+from globalpayments.api.payment_methods import CreditCardData
+
+NAMESPACES = {
+    "http://Hps.Exchange.PosGateway": None,
+    "http://schemas.xmlsoap.org/soap/envelope/": None,
+}
+
+
+def parse_xmltodict(raw_response):
+    root = xmltodict.parse(
+        raw_response, process_namespaces=True, namespaces=NAMESPACES
+    )["Envelope"]["Body"]["PosResponse"]["Ver1.0"]
+    return root["Header"], list(root["Transaction"].items())[0][1]
+
+
+def parse_all(raw_response):
+    response = PorticoResponse.parse(raw_response)
+    return response.header, response.transaction
+
+
+def parse_selected(raw_response):
+    response = PorticoResponse.parse(
+        raw_response, PORTICO_HEADER_SELECTOR, PORTICO_TRANSACTION_SELECTOR
+    )
+    return response.header, response.transaction
+
+
+def allocations(parse, raw_response, count=1000):
+    """
+    Measures memory used while parsing.
+
+    :return: (peak bytes of one parse, bytes allocated per parse)
+    """
+
+    tracemalloc.start()
+    try:
+        parse(raw_response)
+        peak = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        # keep the results alive so every allocation is still counted
+        results = [parse(raw_response) for _ in range(count)]
+        retained = (tracemalloc.get_traced_memory()[0] - before) / count
+    finally:
+        tracemalloc.stop()
+    del results
+    return peak, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    connector = PorticoConnector()
+    card = CreditCardData()
+    print("{} byte CreditSale response".format(len(CREDIT_SALE_RESPONSE)))
+    print(
+        "{:<12} {:>10} {:>12} {:>14}".format(
+            "parser", "us/parse", "peak bytes", "retained bytes"
+        )
+    )
+    for name, parse in (
+        ("xmltodict", parse_xmltodict),
+        ("all fields", parse_all),
+        ("selected", parse_selected),
+    ):
+        seconds = timeit.timeit(
+            lambda: parse(CREDIT_SALE_RESPONSE), number=args.iterations
+        )
+        peak, retained = allocations(parse, CREDIT_SALE_RESPONSE)
+        print(
+            "{:<12} {:>10.1f} {:>12} {:>14.0f}".format(
+                name, seconds / args.iterations * 1e6, peak, retained
+            )
+        )
+
+    seconds = timeit.timeit(
+        lambda: connector._map_response(CREDIT_SALE_RESPONSE, card),
+        number=args.iterations,
+    )
+    print("_map_response: {:.1f} us/response".format(seconds / args.iterations * 1e6))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
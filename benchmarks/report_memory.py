@@ -0,0 +1,117 @@
+"""
+Memory held by Activity report results.
+
+Maps a synthetic Portico Activity report to a list of
+`TransactionSummary` objects and to a `TransactionSummaryTable`, and
+streams it row by row, and reports the bytes retained per row and the
+peak while mapping. The table and the stream parse the response
+incrementally, so only the list's peak grows with the number of rows.
+
+Run from the repository root:
+
+    python -m benchmarks.report_memory [--rows N]
+"""
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+
+import urllib3
+
+from globalpayments.api.entities.enums import ReportType
+from globalpayments.api.gateways import PorticoConnector
+
+DETAILS = (
+    "<Details><GatewayTxnId>{id}</GatewayTxnId><DeviceId>{device}</DeviceId>"
+    "<TxnStatus>{status}</TxnStatus><ServiceName>{service}</ServiceName>"
+    "<Amt>{amount}</Amt><AuthAmt>{amount}</AuthAmt><SettlementAmt>{amount}"
+    "</SettlementAmt><AuthCode>{auth}</AuthCode><RspCode>00</RspCode>"
+    "<RspText>APPROVAL</RspText><GatewayRspCode>0</GatewayRspCode>"
+    "<GatewayRspMsg>Success</GatewayRspMsg><MaskedCardNbr>411111******{last4}"
+    "</MaskedCardNbr><RefNbr>{ref}</RefNbr><ClientTxnId>{client}</ClientTxnId>"
+    "<TxnUtcDT>2026-01-01T10:{minute:02d}:00.000Z</TxnUtcDT></Details>"
+)
+
+SERVICES = ("CreditSale", "CreditAuth", "CreditReturn", "CreditVoid")
+
+
+def activity_report(rows):
+    details = "".join(
+        DETAILS.format(
+            id=1000000000 + index,
+            device=1520000 + index % 8,
+            status="A" if index % 10 else "V",
+            service=SERVICES[index % len(SERVICES)],
+            amount="{}.{:02d}".format(index % 500, index % 100),
+            auth="{:06d}".format(index),
+            last4="{:04d}".format(index % 10000),
+            ref="{:012d}".format(index),
+            client="order-{}".format(index),
+            minute=index % 60,
+        )
+        for index in range(rows)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+        '<soap:Body><PosResponse xmlns="http://Hps.Exchange.PosGateway">'
+        "<Ver1.0><Header><GatewayRspCode>0</GatewayRspCode>"
+        "<GatewayRspMsg>Success</GatewayRspMsg></Header>"
+        "<Transaction><ReportActivity>{}</ReportActivity></Transaction>"
+        "</Ver1.0></PosResponse></soap:Body></soap:Envelope>".format(details)
+    ).encode()
+
+
+def stream(connector, raw_response):
+    response = urllib3.HTTPResponse(
+        body=io.BytesIO(raw_response), preload_content=False
+    )
+    count = 0
+    for _ in connector._stream_report_response(response, "ReportActivity", "Details"):
+        count += 1
+    return [None] * count
+
+
+def measure(raw_response, rows, mode):
+    connector = PorticoConnector()
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        if mode == "stream":
+            result = stream(connector, raw_response)
+        else:
+            result = connector._map_report_response(
+                raw_response, ReportType.Activity, mode == "table"
+            )
+        elapsed = time.perf_counter() - started
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(result) == rows
+    return retained / rows, peak / rows, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    raw_response = activity_report(args.rows)
+    print("{} rows, {} byte response".format(args.rows, len(raw_response)))
+    print(
+        "{:<8} {:>16} {:>16} {:>10}".format(
+            "result", "retained B/row", "peak B/row", "seconds"
+        )
+    )
+    for mode in ("list", "table", "stream"):
+        retained, peak, elapsed = measure(raw_response, args.rows, mode)
+        print(
+            "{:<8} {:>16.0f} {:>16.0f} {:>10.2f}".format(mode, retained, peak, elapsed)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
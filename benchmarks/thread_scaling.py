@@ -0,0 +1,139 @@
+"""
+Multi-threaded throughput of the Portico authorization path.
+
+Runs `CreditCardData.charge(...).execute()` from an increasing number of
+threads against an in-process transport that returns a canned response,
+so only the SDK's own work (building, validating and serializing the
+request, then parsing and mapping the response) is measured. On a
+free-threaded (no-GIL) build, throughput should grow near-linearly with
+the thread count up to the number of cores.
+
+Run from the repository root:
+
+    python -m benchmarks.thread_scaling [--iterations N] [--max-threads N]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.payment_methods import CreditCardData
+
+CREDIT_SALE_RESPONSE = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    b'<soap:Body><PosResponse xmlns="http://Hps.Exchange.PosGateway">'
+    b"<Ver1.0><Header><LicenseId>1</LicenseId><SiteId>1</SiteId><DeviceId>1</DeviceId>"
+    b"<GatewayTxnId>1234567890</GatewayTxnId><GatewayRspCode>0</GatewayRspCode>"
+    b"<GatewayRspMsg>Success</GatewayRspMsg></Header>"
+    b"<Transaction><CreditSale><RspCode>00</RspCode><RspText>APPROVAL</RspText>"
+    b"<AuthCode>12345A</AuthCode><AVSRsltCode>0</AVSRsltCode><CVVRsltCode>M</CVVRsltCode>"
+    b"<RefNbr>123456789012</RefNbr><CardType>Visa</CardType>"
+    b"<AVSRsltText>AVS Not Requested.</AVSRsltText><CVVRsltText>Match.</CVVRsltText>"
+    b"</CreditSale></Transaction></Ver1.0></PosResponse></soap:Body></soap:Envelope>"
+)
+
+
+class CannedResponse(object):
+    status = 200
+    data = CREDIT_SALE_RESPONSE
+
+
+class CannedPool(object):
+    """
+    Stands in for `ConnectionPool`, answering every request immediately
+    """
+
+    def request(self, method, url, **kwargs):
+        return CannedResponse()
+
+
+def configure():
+    config = PorticoConfig()
+    config.secret_api_key = "skapi_cert_benchmark"
+    config.service_url = "https://cert.api2.heartlandportico.com"
+    ServicesContainer.configure(config, "benchmark")
+    ServicesContainer.instance().get_client("benchmark").connection_pool = CannedPool()
+
+
+def authorize(iterations):
+    card = CreditCardData()
+    card.number = "4111111111111111"
+    card.exp_month = "12"
+    card.exp_year = "2025"
+    card.cvn = "123"
+
+    for _ in range(iterations):
+        response = card.charge(10).with_currency("USD").execute("benchmark")
+        assert response.response_code == "00"
+
+
+def measure(threads, iterations):
+    """
+    Runs `iterations` authorizations on each of `threads` threads.
+
+    :return: Authorizations per second
+    """
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        authorize(iterations)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    configure()
+    authorize(100)  # warm up
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        "Python {} (GIL {}), {} cores".format(
+            sys.version.split()[0],
+            "enabled" if gil_enabled else "disabled",
+            os.cpu_count(),
+        )
+    )
+    print(
+        "{:>8} {:>12} {:>8} {:>11}".format("threads", "auth/s", "speedup", "efficiency")
+    )
+
+    counts = [1]
+    while counts[-1] * 2 < args.max_threads:
+        counts.append(counts[-1] * 2)
+    if counts[-1] < args.max_threads:
+        counts.append(args.max_threads)
+
+    baseline = None
+    for threads in counts:
+        throughput = measure(threads, args.iterations)
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(
+            "{:>8} {:>12.0f} {:>7.2f}x {:>10.0%}".format(
+                threads, throughput, speedup, speedup / threads
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
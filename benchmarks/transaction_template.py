@@ -0,0 +1,74 @@
+"""
+Cost of preparing identical sales with and without a `TransactionTemplate`.
+
+Builds, validates and serializes a Portico credit sale carrying a
+currency, duplicate flag, billing address, e-commerce info and
+descriptor, either from `CreditCardData.charge(...)` or from a template
+holding those fields, and reports the time per request. Nothing is
+sent.
+
+Run from the repository root:
+
+    python -m benchmarks.transaction_template [--iterations N]
+"""
+
+import argparse
+import sys
+import timeit
+
+from globalpayments.api.builders import TransactionTemplate
+from globalpayments.api.entities import Address, ECommerceInfo
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.payment_methods import CreditCardData
+
+CARD = CreditCardData()
+CARD.number = "4111111111111111"
+CARD.exp_month = "12"
+CARD.exp_year = "2030"
+CARD.cvn = "123"
+
+ADDRESS = Address()
+ADDRESS.street_address_1 = "1 Main St"
+ADDRESS.city = "Springfield"
+ADDRESS.province = "NY"
+ADDRESS.postal_code = "12345"
+
+
+def sale(amount):
+    return (
+        CARD.charge(amount)
+        .with_currency("USD")
+        .with_allow_duplicates(True)
+        .with_address(ADDRESS)
+        .with_ecommerce_info(ECommerceInfo())
+        .with_invoice_number("kiosk-12")
+        .with_dynamic_descriptor("KIOSK 12")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    connector = PorticoConnector()
+    connector.secret_api_key = "skapi_cert_benchmark"
+    template = TransactionTemplate(sale(None))
+
+    def plain():
+        builder = sale(10)
+        builder.validations.validate(builder)
+        return connector._build_authorization(builder)
+
+    def templated():
+        return connector._build_authorization(template._create_checked(CARD, 10, None))
+
+    assert plain() == templated()
+    for name, prepare in (("builder", plain), ("template", templated)):
+        elapsed = min(timeit.repeat(prepare, number=args.iterations, repeat=5))
+        print("{:<10} {:8.2f} us".format(name, elapsed / args.iterations * 1e6))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
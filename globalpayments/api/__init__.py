@@ -1,6 +1,9 @@
 """
 """
 
+import threading
+from types import MappingProxyType
+
 from globalpayments.api.entities.enums import (
     FraudFilterMode,
     HppVersion,
@@ -8,10 +11,19 @@ from globalpayments.api.entities.enums import (
 )
 from globalpayments.api.entities.exceptions import ConfigurationException
 from globalpayments.api.gateways import (
+    CIRCUIT_BREAKERS,
+    ConnectionPool,
+    EndpointSelector,
     PayPlanConnector,
     PorticoConnector,
     RealexConnector,
+    RetryPolicy,
     TableServiceConnector,
+    TimeoutReversalEngine,
+)
+from globalpayments.api.gateways.response_fields import (
+    PORTICO_HEADER_FIELDS,
+    PORTICO_TRANSACTION_FIELDS,
 )
 
 
@@ -93,11 +105,68 @@ class GatewayConfig(object):
     reservation_provider = None
     #  Gateway Service URL
     service_url = None
+    #  Gateway Service URLs in order of preference
+    #  Takes precedence over `service_url` when set
+    service_urls = None
+    #  Send a duplicate of slow read-only calls after the endpoint's
+    #  p95 latency, keeping whichever response arrives first
+    hedging_enabled = None
     #  Timeout value for gateway communication (in milliseconds)
     timeout = None
+    #  Timeout for establishing the TCP connection (in milliseconds)
+    #  Defaults to `timeout` when not set
+    connect_timeout = None
+    #  Timeout for completing the TLS handshake (in milliseconds)
+    #  Defaults to `timeout` when not set
+    tls_timeout = None
+    #  Timeout for reading the gateway's response (in milliseconds)
+    #  Defaults to `timeout` when not set
+    read_timeout = None
+    #  Maximum number of pooled connections per gateway host
+    max_connections = None
+    #  Wait for a pooled connection when all are in use instead of
+    #  opening a temporary one
+    pool_block = None
+    #  Close pooled connections left idle longer than this (in milliseconds)
+    pool_idle_timeout = None
+    #  Enable TCP keep-alive probes on pooled connections
+    tcp_keep_alive = None
+    #  Reverse Portico credit sales and authorizations that time out
+    timeout_reversal_enabled = None
+    #  Maximum reversal attempts per timed out transaction
+    timeout_reversal_attempts = None
+    #  Delay between reversal attempts (in milliseconds)
+    timeout_reversal_retry_delay = None
+    #  Called with a `TimeoutReversalResult` once a reversal finishes
+    timeout_reversal_callback = None
+    #  `RetryPolicy` applied to gateway requests
+    #  A default policy is created for each configuration when not set
+    retry_policy = None
+    #  Fail fast while a gateway endpoint is unhealthy
+    circuit_breaker_enabled = None
+    #  `CircuitBreakerRegistry` holding the endpoint breakers
+    #  Defaults to a registry shared by all configurations
+    circuit_breaker_registry = None
+    #  `TrafficLimiter` enforcing rate limits and bulkheads for this
+    #  configuration
+    traffic_limiter = None
+    #  Names of the Portico `Transaction` fields to map from responses
+    #  Fields not listed are left unset; all are mapped when not set
+    response_fields = None
+    #  Map Portico results from the response on first access; call
+    #  `materialize()` on a result to load all of it at once
+    lazy_responses = False
 
     def __init__(self):
         self.timeout = 65000
+        self.max_connections = 10
+        self.pool_block = False
+        self.tcp_keep_alive = True
+        self.timeout_reversal_enabled = False
+        self.timeout_reversal_attempts = 3
+        self.timeout_reversal_retry_delay = 1000
+        self.circuit_breaker_enabled = False
+        self.hedging_enabled = False
 
     def validate(self):
         #  portico api key
@@ -145,12 +214,23 @@ class GatewayConfig(object):
                     "shared_secret is required for this configuration."
                 )
 
+        #  response fields
+        if self.response_fields is not None:
+            unknown = set(self.response_fields) - (
+                PORTICO_TRANSACTION_FIELDS.attributes | PORTICO_HEADER_FIELDS.attributes
+            )
+            if unknown:
+                raise ConfigurationException(
+                    "Unknown response fields: {}".format(", ".join(sorted(unknown)))
+                )
+
         #  service url
         if self.service_url is None:
             pass
 
 
 class ConfiguredServices(object):
+    connection_pool = None
     gateway_connector = None
     recurring_connector = None
     device_interface = None
@@ -159,6 +239,8 @@ class ConfiguredServices(object):
 
 
 SERVICE_CONTAINER_INSTANCE = None
+#  Serializes writers; readers use immutable snapshots and never lock
+_CONFIGURE_LOCK = threading.Lock()
 
 
 class PorticoConfig(GatewayConfig):
@@ -194,6 +276,17 @@ class ServicesContainer(object):
         config.validate()
 
         cs = ConfiguredServices()
+        connection_pool = ConnectionPool(
+            max_connections=config.max_connections,
+            block=config.pool_block,
+            idle_timeout=config.pool_idle_timeout,
+            tcp_keep_alive=config.tcp_keep_alive,
+        )
+        cs.connection_pool = connection_pool
+        retry_policy = config.retry_policy or RetryPolicy()
+        circuit_breakers = None
+        if config.circuit_breaker_enabled:
+            circuit_breakers = config.circuit_breaker_registry or CIRCUIT_BREAKERS
 
         #  configure devices
         # if config.device_connection_config is not None:
@@ -222,7 +315,14 @@ class ServicesContainer(object):
             cs.gateway_connector.refund_password = config.refund_password
             cs.gateway_connector.shared_secret = config.shared_secret
             cs.gateway_connector.timeout = config.timeout
-            cs.gateway_connector.service_url = config.service_url
+            cs.gateway_connector.connect_timeout = config.connect_timeout
+            cs.gateway_connector.tls_timeout = config.tls_timeout
+            cs.gateway_connector.read_timeout = config.read_timeout
+            cs.gateway_connector.connection_pool = connection_pool
+            cs.gateway_connector.retry_policy = retry_policy
+            cs.gateway_connector.circuit_breakers = circuit_breakers
+            cs.gateway_connector.traffic_limiter = config.traffic_limiter
+            ServicesContainer._configure_endpoints(cs.gateway_connector, config, None)
             cs.gateway_connector.hosted_payment_config = config.hosted_payment_config
             cs.recurring_connector = cs.gateway_connector
         else:
@@ -236,49 +336,100 @@ class ServicesContainer(object):
             cs.gateway_connector.developer_id = config.developer_id
             cs.gateway_connector.version_number = config.version_number
             cs.gateway_connector.timeout = config.timeout
-            cs.gateway_connector.service_url = (
-                config.service_url + "/Hps.Exchange.PosGateway/PosGatewayService.asmx"
+            cs.gateway_connector.connect_timeout = config.connect_timeout
+            cs.gateway_connector.tls_timeout = config.tls_timeout
+            cs.gateway_connector.read_timeout = config.read_timeout
+            cs.gateway_connector.connection_pool = connection_pool
+            cs.gateway_connector.retry_policy = retry_policy
+            cs.gateway_connector.circuit_breakers = circuit_breakers
+            cs.gateway_connector.traffic_limiter = config.traffic_limiter
+            if config.response_fields is not None:
+                cs.gateway_connector.response_fields = frozenset(config.response_fields)
+            cs.gateway_connector.lazy_responses = config.lazy_responses
+            ServicesContainer._configure_endpoints(
+                cs.gateway_connector,
+                config,
+                "/Hps.Exchange.PosGateway/PosGatewayService.asmx",
             )
+            if config.timeout_reversal_enabled:
+                cs.gateway_connector.timeout_reversal = TimeoutReversalEngine(
+                    max_attempts=config.timeout_reversal_attempts,
+                    retry_delay=config.timeout_reversal_retry_delay,
+                    callback=config.timeout_reversal_callback,
+                )
 
             cs.recurring_connector = PayPlanConnector()
             cs.recurring_connector.secret_api_key = config.secret_api_key
             cs.recurring_connector.timeout = config.timeout
-            cs.recurring_connector.service_url = (
-                config.service_url + "/Portico.PayPlan.v2/"
+            cs.recurring_connector.connect_timeout = config.connect_timeout
+            cs.recurring_connector.tls_timeout = config.tls_timeout
+            cs.recurring_connector.read_timeout = config.read_timeout
+            cs.recurring_connector.connection_pool = connection_pool
+            cs.recurring_connector.retry_policy = retry_policy
+            cs.recurring_connector.circuit_breakers = circuit_breakers
+            cs.recurring_connector.traffic_limiter = config.traffic_limiter
+            ServicesContainer._configure_endpoints(
+                cs.recurring_connector, config, "/Portico.PayPlan.v2/"
             )
 
-        if SERVICE_CONTAINER_INSTANCE is None:
-            SERVICE_CONTAINER_INSTANCE = ServicesContainer()
+        with _CONFIGURE_LOCK:
+            if SERVICE_CONTAINER_INSTANCE is None:
+                SERVICE_CONTAINER_INSTANCE = ServicesContainer()
 
-        SERVICE_CONTAINER_INSTANCE.add_configuration(config_name, cs)
+        replaced = SERVICE_CONTAINER_INSTANCE.add_configuration(config_name, cs)
+        # requests already holding the old connectors finish on their
+        # connections, which are closed as they are released
+        if replaced is not None and replaced.connection_pool is not None:
+            replaced.connection_pool.close()
+
+    @staticmethod
+    def _configure_endpoints(connector, config, path):
+        service_urls = [
+            service_url + path if path else service_url
+            for service_url in config.service_urls or [config.service_url]
+        ]
+        connector.service_url = service_urls[0]
+        connector.hedging_enabled = config.hedging_enabled
+        if len(service_urls) > 1 or config.hedging_enabled:
+            connector.endpoints = EndpointSelector(service_urls)
 
     def __init__(self):
-        self._configurations = {}
+        self._configurations = MappingProxyType({})
+        self._lock = threading.Lock()
 
     def add_configuration(self, config_name, config):
-        self._configurations[config_name] = config
+        """
+        Adds or replaces a named configuration.
+
+        :param config_name: The configuration name
+        :param config: The ConfiguredServices
+        :return: The ConfiguredServices replaced, or None
+        """
+
+        # copy-on-write: readers keep using the snapshot they already hold
+        with self._lock:
+            configurations = dict(self._configurations)
+            replaced = configurations.get(config_name)
+            configurations[config_name] = config
+            self._configurations = MappingProxyType(configurations)
+        return replaced
 
     def get_client(self, config_name):
-        if config_name in self._configurations:
-            return self._configurations[config_name].gateway_connector
-        return None
+        services = self._configurations.get(config_name)
+        return None if services is None else services.gateway_connector
 
     def get_device_interface(self, config_name):
-        if config_name in self._configurations:
-            return self._configurations[config_name].device_interface
-        return None
+        services = self._configurations.get(config_name)
+        return None if services is None else services.device_interface
 
     def get_device_controller(self, config_name):
-        if config_name in self._configurations:
-            return self._configurations[config_name].device_controller
-        return None
+        services = self._configurations.get(config_name)
+        return None if services is None else services.device_controller
 
     def get_recurring_client(self, config_name):
-        if config_name in self._configurations:
-            return self._configurations[config_name].recurring_connector
-        return None
+        services = self._configurations.get(config_name)
+        return None if services is None else services.recurring_connector
 
     def get_reservation_service(self, config_name):
-        if config_name in self._configurations:
-            return self._configurations[config_name].reservation_connector
-        return None
+        services = self._configurations.get(config_name)
+        return None if services is None else services.reservation_connector
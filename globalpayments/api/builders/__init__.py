@@ -1,6 +1,9 @@
 """
 """
 
+import copy
+import time
+
 from globalpayments.api import ServicesContainer
 from globalpayments.api.builders.validations import Validations
 from globalpayments.api.entities import (
@@ -19,30 +22,60 @@ from globalpayments.api.entities.exceptions import BuilderException
 from globalpayments.api.payment_methods import EBTCardData
 
 
+def _property_setter(builder_class, name):
+    def setter(self, value):
+        setattr(self, name, value)
+        return self
+
+    setter.__name__ = "with_" + name
+    setter.__qualname__ = "{}.with_{}".format(builder_class.__qualname__, name)
+    setter.__doc__ = "Sets `{}`.\n:return: The builder".format(name)
+    return setter
+
+
+def _is_settable(name, value):
+    if name[:1] == "_":
+        return False
+    if isinstance(value, property):
+        return value.fset is not None
+    return not callable(value) and not isinstance(value, (staticmethod, classmethod))
+
+
 class BaseBuilder(object):
     validations = None
+    deadline = None
 
-    def __init__(self):
-        self.validations = Validations()
-        self.setup_validations()
-
-    def __getattr__(self, name):
-        def wrapper(*args):
-            if name[:5] == "with_":
-                self.set_property_if_exists(name[5:], args[0])
-                return self
+    def __init_subclass__(cls, **kwargs):
+        """
+        Adds a fluent `with_<name>` setter for each public attribute the
+        builder class declares, unless the class already defines one.
+        """
 
-            return False
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if _is_settable(name, value) and not hasattr(cls, "with_" + name):
+                setattr(cls, "with_" + name, _property_setter(cls, name))
 
-        return wrapper
+    def __init__(self):
+        self.validations = Validations.for_builder(self)
 
-    def execute(self, config_name=None):
+    def execute(self, config_name=None, deadline=None):
+        self._set_deadline(deadline)
         self.validations.validate(self)
         return None
 
     def setup_validations(self):
         pass
 
+    def _set_deadline(self, deadline):
+        """
+        Converts a per-call time budget (in milliseconds) into an absolute
+        deadline shared by every gateway request made for this call.
+        """
+
+        if deadline is not None:
+            self.deadline = time.monotonic() + deadline / 1000.0
+
     def set_property_if_exists(self, *args):
         if hasattr(self, args[0]):
             setattr(self, args[0], args[1])
@@ -107,6 +140,15 @@ class AuthorizationBuilder(TransactionBuilder):
     timestamp = None
     transaction_initiator = None
     card_brand_transaction_id = None
+    _template = None
+
+    @property
+    def template(self):
+        """
+        The `TransactionTemplate` the builder was created from, if any
+        """
+
+        return self._template
 
     def with_address(self, address, address_type=AddressType.Billing):
         if not isinstance(address, Address):
@@ -198,20 +240,39 @@ class AuthorizationBuilder(TransactionBuilder):
     def __init__(self, transaction_type, payment_method=None):
         TransactionBuilder.__init__(self, transaction_type, payment_method)
 
-    def execute(self, config_name=None):
+    def execute(self, config_name=None, deadline=None):
         """
         Executes the authorization builder against the gateway.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
         :return: Transaction
         """
 
         if config_name is None:
             config_name = "default"
 
-        TransactionBuilder.execute(self)
+        TransactionBuilder.execute(self, config_name, deadline)
 
         client = ServicesContainer.instance().get_client(config_name)
         return client.process_authorization(self)
 
+    async def execute_async(self, config_name=None, deadline=None):
+        """
+        Executes the authorization builder against the gateway without
+        blocking the running event loop.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
+        :return: Transaction
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        TransactionBuilder.execute(self, config_name, deadline)
+
+        client = ServicesContainer.instance().get_client(config_name)
+        return await client.process_authorization_async(self)
+
     def serialize(self, config_name=None):
         """
         Serializes an authorization builder for hosted payment page requests.
@@ -283,6 +344,114 @@ class AuthorizationBuilder(TransactionBuilder):
         ).check("billing_address").is_not_none()
 
 
+class TransactionTemplate(object):
+    """
+    Sends authorizations that differ only by payment method and amount.
+
+    The template copies the fields of an `AuthorizationBuilder` when
+    created and validates them once. Its builders are never handed out,
+    so the fields cannot change afterwards, and gateways may serialize
+    the request elements built from them only once per template.
+    """
+
+    #  Request fragments serialized by gateways, keyed by gateway type and
+    #  fragment name
+    fragments = None
+
+    def __init__(self, builder):
+        """
+        :param builder: The `AuthorizationBuilder` holding the constant
+            fields; its payment method and amount, when set, are used
+            when a call does not supply them
+        """
+
+        if not isinstance(builder, AuthorizationBuilder):
+            raise BuilderException("builder must be of type AuthorizationBuilder")
+
+        prototype = copy.copy(builder)
+        for name, value in vars(builder).items():
+            if name not in ("validations", "payment_method", "deadline"):
+                setattr(prototype, name, copy.deepcopy(value))
+        prototype.deadline = None
+        prototype._template = self
+        self._prototype = prototype
+        self.fragments = {}
+
+        #  validate the constant fields once, and find which of the
+        #  variable fields each call has to supply
+        probe = self._create(TransactionReference(), 0)
+        probe.validations.validate(probe)
+        self._payment_method_required = self._is_required("payment_method")
+        self._amount_required = self._is_required("amount")
+
+    def execute(
+        self, payment_method=None, amount=None, config_name=None, deadline=None
+    ):
+        """
+        Executes an authorization with the given variable fields.
+        :param payment_method: The payment method; defaults to the template's
+        :param amount: The amount; defaults to the template's
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
+        :return: Transaction
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        builder = self._create_checked(payment_method, amount, deadline)
+        client = ServicesContainer.instance().get_client(config_name)
+        return client.process_authorization(builder)
+
+    async def execute_async(
+        self, payment_method=None, amount=None, config_name=None, deadline=None
+    ):
+        """
+        Executes an authorization with the given variable fields without
+        blocking the running event loop.
+        :param payment_method: The payment method; defaults to the template's
+        :param amount: The amount; defaults to the template's
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
+        :return: Transaction
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        builder = self._create_checked(payment_method, amount, deadline)
+        client = ServicesContainer.instance().get_client(config_name)
+        return await client.process_authorization_async(builder)
+
+    def _create(self, payment_method, amount):
+        builder = copy.copy(self._prototype)
+        if payment_method is not None:
+            builder.payment_method = payment_method
+        if amount is not None:
+            builder.amount = amount
+        return builder
+
+    def _create_checked(self, payment_method, amount, deadline):
+        builder = self._create(payment_method, amount)
+        for name, required in (
+            ("payment_method", self._payment_method_required),
+            ("amount", self._amount_required),
+        ):
+            if required and getattr(builder, name) is None:
+                raise BuilderException("property `{}` is None".format(name))
+        builder._set_deadline(deadline)
+        return builder
+
+    def _is_required(self, name):
+        builder = self._create(TransactionReference(), 0)
+        setattr(builder, name, None)
+        try:
+            builder.validations.validate(builder)
+        except BuilderException:
+            return True
+        return False
+
+
 class ManagementBuilder(TransactionBuilder):
     """
     Used to follow up transactions for the supported
@@ -295,6 +464,7 @@ class ManagementBuilder(TransactionBuilder):
     description = None
     gratuity = None
     po_number = None
+    payer_authentication_response = None
     reason_code = None
     tax_amount = None
     tax_type = None
@@ -341,20 +511,39 @@ class ManagementBuilder(TransactionBuilder):
     def __init__(self, transaction_type, payment_method=None):
         TransactionBuilder.__init__(self, transaction_type, payment_method)
 
-    def execute(self, config_name=None):
+    def execute(self, config_name=None, deadline=None):
         """
         Executes the builder against the gateway.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
         :return: Transaction
         """
 
         if config_name is None:
             config_name = "default"
 
-        TransactionBuilder.execute(self)
+        TransactionBuilder.execute(self, config_name, deadline)
 
         client = ServicesContainer.instance().get_client(config_name)
         return client.manage_transaction(self)
 
+    async def execute_async(self, config_name=None, deadline=None):
+        """
+        Executes the builder against the gateway without blocking the
+        running event loop.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
+        :return: Transaction
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        TransactionBuilder.execute(self, config_name, deadline)
+
+        client = ServicesContainer.instance().get_client(config_name)
+        return await client.manage_transaction_async(self)
+
     def setup_validations(self):
         self.validations.of(
             TransactionType.Capture
@@ -377,6 +566,7 @@ class RecurringBuilder(TransactionBuilder):
     order_id = None
     entity = None
     search_criteria = None
+    force = False
 
     def add_search_criteria(self, key, value):
         self.search_criteria[key] = value
@@ -389,20 +579,39 @@ class RecurringBuilder(TransactionBuilder):
             self.key = entity.key
         self.search_criteria = {}
 
-    def execute(self, config_name=None):
+    def execute(self, config_name=None, deadline=None):
         """
         Executes the builder against the gateway.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
         :return: RecurringEntity
         """
 
         if config_name is None:
             config_name = "default"
 
-        TransactionBuilder.execute(self)
+        TransactionBuilder.execute(self, config_name, deadline)
 
         client = ServicesContainer.instance().get_recurring_client(config_name)
         return client.process_recurring(self)
 
+    async def execute_async(self, config_name=None, deadline=None):
+        """
+        Executes the builder against the gateway without blocking the
+        running event loop.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
+        :return: RecurringEntity
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        TransactionBuilder.execute(self, config_name, deadline)
+
+        client = ServicesContainer.instance().get_recurring_client(config_name)
+        return await client.process_recurring_async(self)
+
     def setup_validations(self):
         self.validations.of(
             TransactionType.Edit | TransactionType.Delete | TransactionType.Fetch
@@ -416,7 +625,8 @@ class RecurringBuilder(TransactionBuilder):
 class ReportBuilder(BaseBuilder):
     report_type = None
     timezone_conversion = None
-    search_criteria = {}
+    search_criteria = None
+    columnar = False
 
     def add_search_criteria(self, key, value):
         self.search_criteria[key] = value
@@ -425,29 +635,87 @@ class ReportBuilder(BaseBuilder):
     def __init__(self, report_type):
         BaseBuilder.__init__(self)
         self.report_type = report_type
+        self.search_criteria = {}
 
-    def execute(self, config_name=None):
+    def execute(self, config_name=None, deadline=None):
         """
         Executes the builder against the gateway.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
         :return: Report
         """
 
         if config_name is None:
             config_name = "default"
 
+        self._set_deadline(deadline)
+
         client = ServicesContainer.instance().get_client(config_name)
         return client.process_report(self)
 
+    async def execute_async(self, config_name=None, deadline=None):
+        """
+        Executes the builder against the gateway without blocking the
+        running event loop.
+        :param deadline: Optional time budget for the call (in milliseconds),
+            including any retries
+        :return: Report
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        self._set_deadline(deadline)
+
+        client = ServicesContainer.instance().get_client(config_name)
+        return await client.process_report_async(self)
+
 
 class TransactionReportBuilder(ReportBuilder):
     device_id = None
     end_date = None
     start_date = None
     transaction_id = None
+    #  Number of date windows of an Activity report requested at once
+    parallel_windows = None
+    #  Number of rows each date window should return
+    rows_per_window = None
 
     def __init__(self, report_type):
         ReportBuilder.__init__(self, report_type)
 
+    def with_parallel_windows(self, count, rows_per_window=None):
+        """
+        Splits an Activity report's `start_date`..`end_date` into windows,
+        requesting up to `count` of them at once. Window sizes adapt to
+        the rows returned by earlier windows.
+        :param count: Maximum number of windows requested at once
+        :param rows_per_window: Number of rows each window should return
+        :return: TransactionReportBuilder
+        """
+
+        self.parallel_windows = count
+        self.rows_per_window = rows_per_window
+        return self
+
+    def stream(self, config_name=None, deadline=None):
+        """
+        Executes the builder against the gateway, yielding the report rows
+        as they are read from the response instead of loading the whole
+        report first. Supported for Activity and FindTransactions reports.
+        :param deadline: Optional time budget for sending the request (in
+            milliseconds), including any retries
+        :return: Generator of TransactionSummary
+        """
+
+        if config_name is None:
+            config_name = "default"
+
+        self._set_deadline(deadline)
+
+        client = ServicesContainer.instance().get_client(config_name)
+        return client.stream_report(self)
+
     def setup_validations(self):
         self.validations.of(ReportType.TransactionDetail).check(
             "transaction_id"
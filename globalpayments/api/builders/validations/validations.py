@@ -1,12 +1,39 @@
 import globalpayments.api
 from globalpayments.api.builders.validations.validation_target import ValidationTarget
 
+#  Rules shared by every instance of a builder class
+_BUILDER_VALIDATIONS = {}
+
 
 class Validations(object):
     rules = None
+    #  Rules applying to each transaction type seen, in definition order
+    _index = None
 
     def __init__(self):
         self.rules = {}
+        self._index = {}
+
+    @staticmethod
+    def for_builder(builder):
+        """
+        Gets the validation rules of a builder's class. The rules are set
+        up by `setup_validations` for the first instance of the class and
+        shared by every later one.
+
+        :type builder: BaseBuilder
+        :param builder: The builder
+        :rtype: Validations
+        """
+
+        builder_class = type(builder)
+        validations = _BUILDER_VALIDATIONS.get(builder_class)
+        if validations is None:
+            validations = Validations()
+            builder.validations = validations
+            builder.setup_validations()
+            validations = _BUILDER_VALIDATIONS.setdefault(builder_class, validations)
+        return validations
 
     def of(self, type_name):
         """
@@ -23,6 +50,7 @@ class Validations(object):
 
         target = ValidationTarget(self, type_name)
         self.rules[type_name].append(target)
+        self._index = {}
         return target
 
     def validate(self, builder):
@@ -33,33 +61,49 @@ class Validations(object):
         :param builder: The builder
         """
 
-        for key in self.rules:
-            value = self._get_property_value(builder, "transaction_type")
+        value = self._get_property_value(builder, "transaction_type")
+        rules = self._index.get(value)
+        if rules is None:
+            rules = self._index.setdefault(value, self._compile(value))
+
+        for constraint_name, constraint_value, precondition, clause in rules:
+            #  modifier
+            if constraint_name is not None:
+                modifier = self._get_property_value(builder, constraint_name)
+                if constraint_value is not modifier:
+                    continue
 
-            if value != key & value:
+            # check precondition
+            if precondition is not None and not precondition(builder):
                 continue
 
-            for validation in self.rules[key]:
-                if validation.clause is None:
-                    continue
+            if not clause.callback(builder):
+                raise globalpayments.api.entities.exceptions.BuilderException(
+                    clause.message
+                )
+
+    def _compile(self, value):
+        """
+        Collects the rules applying to a transaction type: those whose
+        mask includes it and that check something.
+        """
 
-                #  modifier
-                if validation.constraint_name is not None:
-                    modifier = self._get_property_value(
-                        builder, validation.constraint_name
-                    )
-                    if validation.constraint_value is not modifier:
-                        continue
-
-                # check precondition
-                if validation.precondition is not None:
-                    if not validation.precondition.callback(builder):
-                        continue
-
-                if not validation.clause.callback(builder):
-                    raise globalpayments.api.entities.exceptions.BuilderException(
-                        validation.clause.message
-                    )
+        return tuple(
+            (
+                validation.constraint_name,
+                validation.constraint_value,
+                (
+                    validation.precondition.callback
+                    if validation.precondition is not None
+                    else None
+                ),
+                validation.clause,
+            )
+            for key, validations in self.rules.items()
+            if value == key & value
+            for validation in validations
+            if validation.clause is not None
+        )
 
     @staticmethod
     def _get_property_value(obj, comp):
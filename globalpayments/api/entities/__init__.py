@@ -14,6 +14,10 @@ from globalpayments.api.entities.exceptions import (
 )
 from globalpayments.api.entities.three_d_secure import ThreeDSecure
 from globalpayments.api.entities.transaction_summary import TransactionSummary
+from globalpayments.api.entities.transaction_summary_table import (
+    TransactionSummaryRow,
+    TransactionSummaryTable,
+)
 from globalpayments.api.payment_methods import TransactionReference
 from globalpayments.api.services import RecurringService
 
@@ -23,6 +27,9 @@ class Transaction(object):
     Transaction Response
     """
 
+    #  Not slotted: a response sets about a third of these fields, and the
+    #  instance dictionary holding only those is smaller than a slot for
+    #  every field. `LazyTransaction` also caches loaded fields in it.
     authorized_amount = None
     available_balance = None
     avs_response_code = None
@@ -42,13 +49,16 @@ class Transaction(object):
     reference_number = None
     response_code = None
     response_message = None
-    response_values = {}
+    response_values = None
     timestamp = None
     transaction_descriptor = None
     token = None
     gift_card = None
     transaction_reference = None
 
+    def __init__(self):
+        self.response_values = {}
+
     @property
     def authorization_code(self):
         if self.transaction_reference is not None:
@@ -109,6 +119,14 @@ class Transaction(object):
             self.transaction_reference = TransactionReference()
         self.transaction_reference.transaction_id = value
 
+    def materialize(self):
+        """
+        Loads any fields not yet mapped from the gateway response.
+        Results are fully mapped unless lazy responses are enabled.
+        :return: Transaction
+        """
+        return self
+
     @staticmethod
     def from_id(
         transaction_id, payment_method_type=PaymentMethodType.Credit, order_id=None
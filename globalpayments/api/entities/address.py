@@ -1,5 +1,74 @@
 # -*- coding: utf-8 -*-
 
+import functools
+from types import MappingProxyType
+
+
+def _char_positions(text):
+    positions = {}
+    for index, char in enumerate(text):
+        positions.setdefault(char, []).append(index)
+    return positions
+
+
+def _score(positions, query):
+    # same walk as `CountryUtils.fuzzy_score`, visiting only the
+    # term positions that match each query character
+    score = 0
+    previous = -1
+    for char in query:
+        for index in positions.get(char, ()):
+            score += 3 if index == previous + 1 else 1
+            previous = index
+    return score
+
+
+class _FuzzyIndex(object):
+    """
+    Finds `CountryUtils.fuzzy_match` results for one table, scoring only
+    the keys that share a character with the query and remembering the
+    results of recent queries.
+    """
+
+    #  Number of recent queries whose results are kept
+    cache_size = 1024
+
+    def __init__(self, dictionary):
+        self._entries = [
+            (value, _char_positions(key.lower())) for key, value in dictionary.items()
+        ]
+        self._entries_by_char = {}
+        for number, (_value, positions) in enumerate(self._entries):
+            for char in positions:
+                self._entries_by_char.setdefault(char, []).append(number)
+        self.match = functools.lru_cache(maxsize=self.cache_size)(self._match)
+
+    def _match(self, query, significant_match):
+        """
+        :param query: The lower case query
+        :param significant_match: Score a key must beat to match
+        :return: The value of the only best matching key, or None
+        """
+
+        candidates = set()
+        for char in set(query):
+            candidates.update(self._entries_by_char.get(char, ()))
+
+        rvalue = None
+        high_score = significant_match
+        ties = 0
+        for number in candidates:
+            value, positions = self._entries[number]
+            score = _score(positions, query)
+            if score > high_score:
+                rvalue = value
+                high_score = score
+                ties = 1
+            elif score == high_score and rvalue is not None:
+                ties += 1
+
+        return None if ties > 1 else rvalue
+
 
 class CountryUtils(object):
     significant_country_match = 6
@@ -261,6 +330,15 @@ class CountryUtils(object):
     country_map_by_country_code = dict()
     for country in list(country_code_map_by_country.keys()):
         country_map_by_country_code[country_code_map_by_country[country]] = country
+    del country
+
+    #  lookups share these tables across threads; expose them read-only
+    country_code_map_by_country = MappingProxyType(country_code_map_by_country)
+    country_map_by_country_code = MappingProxyType(country_map_by_country_code)
+
+    #  fuzzy lookups against the tables above
+    _country_index = _FuzzyIndex(country_code_map_by_country)
+    _country_code_index = _FuzzyIndex(country_map_by_country_code)
 
     @staticmethod
     def is_country(address, country_code):
@@ -288,10 +366,8 @@ class CountryUtils(object):
         if len(country_code) > 3:
             return None
 
-        return CountryUtils.fuzzy_match(
-            CountryUtils.country_map_by_country_code,
-            country_code,
-            CountryUtils.significant_code_match,
+        return CountryUtils._country_code_index.match(
+            country_code.lower(), CountryUtils.significant_code_match
         )
 
     @staticmethod
@@ -302,10 +378,8 @@ class CountryUtils(object):
         if country in CountryUtils.country_code_map_by_country:
             return CountryUtils.country_code_map_by_country[country]
 
-        match = CountryUtils.fuzzy_match(
-            CountryUtils.country_code_map_by_country,
-            country,
-            CountryUtils.significant_country_match,
+        match = CountryUtils._country_index.match(
+            country.lower(), CountryUtils.significant_country_match
         )
 
         if match is not None:
@@ -314,10 +388,8 @@ class CountryUtils(object):
         if len(country) > 3:
             return None
 
-        match = CountryUtils.fuzzy_match(
-            CountryUtils.country_map_by_country_code,
-            country,
-            CountryUtils.significant_code_match,
+        match = CountryUtils._country_code_index.match(
+            country.lower(), CountryUtils.significant_code_match
         )
 
         if match is not None:
@@ -354,33 +426,7 @@ class CountryUtils(object):
         if term is None or query is None:
             return None
 
-        term_lower_case = term.lower()
-        query_lower_case = query.lower()
-
-        score = 0
-        term_index = 0
-        previous_matching_character_index = -1
-
-        for query_index in range(len(query_lower_case)):
-            query_char = query_lower_case[query_index]
-
-            term_character_match_found = False
-            for term_index in range(len(term_lower_case)):
-                if term_character_match_found:
-                    pass
-
-                term_char = term_lower_case[term_index]
-
-                if query_char == term_char:
-                    score = score + 1
-
-                    if previous_matching_character_index + 1 == term_index:
-                        score = score + 2
-
-                    previous_matching_character_index = term_index
-                    term_character_match_found = True
-
-        return score
+        return _score(_char_positions(term.lower()), query.lower())
 
 
 class Address(object):
@@ -388,15 +434,28 @@ class Address(object):
     Represents a billing or shipping address for the consumer.
     """
 
-    address_type = None
-    street_address_1 = None
-    street_address_2 = None
-    street_address_3 = None
-    city = None
-    province = None
-    postal_code = None
-    _country = None
-    _country_code = None
+    __slots__ = (
+        "address_type",
+        "street_address_1",
+        "street_address_2",
+        "street_address_3",
+        "city",
+        "province",
+        "postal_code",
+        "_country",
+        "_country_code",
+    )
+
+    def __init__(self):
+        self.address_type = None
+        self.street_address_1 = None
+        self.street_address_2 = None
+        self.street_address_3 = None
+        self.city = None
+        self.province = None
+        self.postal_code = None
+        self._country = None
+        self._country_code = None
 
     @property
     def state(self):
@@ -3,7 +3,15 @@ class BatchSummary(object):
     Details a closed batch.
     """
 
-    id = None
-    transaction_count = None
-    total_amount = None
-    sequence_number = None
+    __slots__ = (
+        "id",
+        "transaction_count",
+        "total_amount",
+        "sequence_number",
+    )
+
+    def __init__(self):
+        self.id = None
+        self.transaction_count = None
+        self.total_amount = None
+        self.sequence_number = None
@@ -1,9 +1,21 @@
 class DebitMac(object):
-    transaction_code = None
-    transmission_number = None
-    bank_response_code = None
-    mac_key = None
-    pin_key = None
-    field_key = None
-    trace_number = None
-    message_authentication_code = None
+    __slots__ = (
+        "transaction_code",
+        "transmission_number",
+        "bank_response_code",
+        "mac_key",
+        "pin_key",
+        "field_key",
+        "trace_number",
+        "message_authentication_code",
+    )
+
+    def __init__(self):
+        self.transaction_code = None
+        self.transmission_number = None
+        self.bank_response_code = None
+        self.mac_key = None
+        self.pin_key = None
+        self.field_key = None
+        self.trace_number = None
+        self.message_authentication_code = None
@@ -509,3 +509,16 @@ class ThreeDSecureVersion(Enum):
     One = "One"
     Two = "Two"
     Any = "Any"
+
+
+class CircuitBreakerState(Enum):
+    """
+    State of a gateway endpoint's circuit breaker
+    """
+
+    #  Requests flow normally
+    Closed = "Closed"
+    #  Requests fail fast without contacting the endpoint
+    Open = "Open"
+    #  A limited number of trial requests probe the endpoint
+    HalfOpen = "HalfOpen"
@@ -36,13 +36,62 @@ class GatewayException(ApiException):
     response_code = None
     #  the gateway response message
     response_message = None
+    #  False when the request never left the SDK (e.g. connect failures)
+    request_sent = True
 
     def __init__(
-        self, message, response_code=None, response_message=None, inner_exception=None
+        self,
+        message,
+        response_code=None,
+        response_message=None,
+        inner_exception=None,
+        request_sent=True,
     ):
         ApiException.__init__(self, message, inner_exception)
         self.response_code = response_code
         self.response_message = response_message
+        self.request_sent = request_sent
+
+
+class GatewayTimeoutException(GatewayException):
+    """
+    Communication with the gateway exceeded a configured timeout or the
+    caller's deadline. Unless `request_sent` is False, the outcome of the
+    transaction is unknown.
+    """
+
+    def __init__(self, message, inner_exception=None, request_sent=True):
+        GatewayException.__init__(
+            self, message, inner_exception=inner_exception, request_sent=request_sent
+        )
+
+
+class CircuitBreakerOpenException(GatewayException):
+    """
+    The circuit breaker for the gateway endpoint is open, so the request
+    was rejected without being sent.
+    """
+
+    #  the endpoint whose circuit breaker rejected the request
+    service_url = None
+
+    def __init__(self, message, service_url=None):
+        GatewayException.__init__(self, message)
+        self.service_url = service_url
+
+
+class RateLimitException(GatewayException):
+    """
+    A client-side rate limit or concurrency limit was reached, so the
+    request was rejected without being sent.
+    """
+
+    #  the traffic lane that rejected the request
+    lane = None
+
+    def __init__(self, message, lane=None):
+        GatewayException.__init__(self, message)
+        self.lane = lane
 
 
 class MessageException(ApiException):
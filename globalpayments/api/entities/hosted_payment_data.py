@@ -9,4 +9,7 @@ class HostedPaymentData(object):
     offer_to_save_card = None
     payment_key = None
     product_id = None
-    supplementary_data = {}
+    supplementary_data = None
+
+    def __init__(self):
+        self.supplementary_data = {}
@@ -3,22 +3,61 @@ class TransactionSummary(object):
     Transaction-level report data
     """
 
-    amount = None
-    convenience_amount = None
-    shipping_amount = None
-    auth_code = None
-    authorized_amount = None
-    client_transaction_id = None
-    device_id = None
-    issuer_response_code = None
-    issuer_response_message = None
-    masked_card_number = None
-    original_transaction_id = None
-    gateway_response_code = None
-    gateway_response_message = None
-    reference_number = None
-    service_name = None
-    settlement_amount = None
-    status = None
-    transaction_date = None
-    transaction_id = None
+    __slots__ = (
+        "amount",
+        "convenience_amount",
+        "shipping_amount",
+        "auth_code",
+        "authorized_amount",
+        "client_transaction_id",
+        "device_id",
+        "issuer_response_code",
+        "issuer_response_message",
+        "masked_card_number",
+        "original_transaction_id",
+        "gateway_response_code",
+        "gateway_response_message",
+        "reference_number",
+        "service_name",
+        "settlement_amount",
+        "status",
+        "transaction_date",
+        "transaction_id",
+    )
+
+    def __init__(self):
+        self.amount = None
+        self.convenience_amount = None
+        self.shipping_amount = None
+        self.auth_code = None
+        self.authorized_amount = None
+        self.client_transaction_id = None
+        self.device_id = None
+        self.issuer_response_code = None
+        self.issuer_response_message = None
+        self.masked_card_number = None
+        self.original_transaction_id = None
+        self.gateway_response_code = None
+        self.gateway_response_message = None
+        self.reference_number = None
+        self.service_name = None
+        self.settlement_amount = None
+        self.status = None
+        self.transaction_date = None
+        self.transaction_id = None
+
+    @property
+    def authorizated_amount(self):
+        return self.authorized_amount
+
+    @authorizated_amount.setter
+    def authorizated_amount(self, value):
+        self.authorized_amount = value
+
+    def materialize(self):
+        """
+        Loads any fields not yet mapped from the gateway response.
+        Results are fully mapped unless lazy responses are enabled.
+        :return: TransactionSummary
+        """
+        return self
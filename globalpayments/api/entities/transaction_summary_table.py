@@ -0,0 +1,316 @@
+import re
+from array import array
+
+from globalpayments.api.entities.exceptions import ApiException
+from globalpayments.api.entities.transaction_summary import TransactionSummary
+
+_VALUE = 0
+_NONE = 1
+_OTHER = 2
+
+_AMOUNT = re.compile(r"-?[0-9]+\.[0-9]{2}")
+
+
+class _Column(object):
+    """
+    Storage for one field of every row.
+
+    `flags` records per row whether the value is held in the typed
+    storage, is None, or is kept as-is in `other` because the typed
+    storage cannot represent it.
+    """
+
+    def __init__(self):
+        self.flags = bytearray()
+        self.other = {}
+
+    def __len__(self):
+        return len(self.flags)
+
+    def append(self, value):
+        if value is None:
+            self.flags.append(_NONE)
+            self._append_placeholder()
+        elif self._append(value):
+            self.flags.append(_VALUE)
+        else:
+            self.other[len(self.flags)] = value
+            self.flags.append(_OTHER)
+            self._append_placeholder()
+
+    def get(self, index):
+        flag = self.flags[index]
+        if flag == _VALUE:
+            return self._get(index)
+        if flag == _NONE:
+            return None
+        return self.other[index]
+
+    def _append(self, value):
+        raise NotImplementedError
+
+    def _append_placeholder(self):
+        raise NotImplementedError
+
+    def _get(self, index):
+        raise NotImplementedError
+
+
+class _TextColumn(_Column):
+    """
+    Strings stored back to back as UTF-8 with their end offsets
+    """
+
+    def __init__(self):
+        _Column.__init__(self)
+        self.data = bytearray()
+        self.ends = array("Q")
+
+    def _append(self, value):
+        if not isinstance(value, str):
+            return False
+        self.data += value.encode("utf-8")
+        self.ends.append(len(self.data))
+        return True
+
+    def _append_placeholder(self):
+        self.ends.append(len(self.data))
+
+    def _get(self, index):
+        start = self.ends[index - 1] if index else 0
+        return self.data[start : self.ends[index]].decode("utf-8")
+
+
+class _CategoryColumn(_Column):
+    """
+    Dictionary-encoded strings, for fields with few distinct values.
+    Codes are widened from one to two or four bytes as values are added.
+    """
+
+    def __init__(self):
+        _Column.__init__(self)
+        self.codes = array("B")
+        self.values = [None]
+        self.index = {}
+
+    def _append(self, value):
+        if not isinstance(value, str):
+            return False
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.index[value] = code
+            if code >= 1 << (8 * self.codes.itemsize):
+                self.codes = array("H" if code < 1 << 16 else "I", self.codes)
+        self.codes.append(code)
+        return True
+
+    def _append_placeholder(self):
+        self.codes.append(0)
+
+    def _get(self, index):
+        return self.values[self.codes[index]]
+
+
+class _AmountColumn(_Column):
+    """
+    Amounts of the form `123.45` stored as integer cents
+    """
+
+    def __init__(self):
+        _Column.__init__(self)
+        self.cents = array("q")
+
+    def _append(self, value):
+        if not isinstance(value, str) or not _AMOUNT.fullmatch(value):
+            return False
+        cents = int(value.replace(".", ""))
+        #  `-0.00` would come back as `0.00`
+        if cents == 0 and value[0] == "-":
+            return False
+        self.cents.append(cents)
+        return True
+
+    def _append_placeholder(self):
+        self.cents.append(0)
+
+    def _get(self, index):
+        value = self.cents[index]
+        units, cents = divmod(abs(value), 100)
+        return "{}{}.{:02d}".format("-" if value < 0 else "", units, cents)
+
+
+_COLUMN_TYPES = {
+    "amount": _AmountColumn,
+    "authorized_amount": _AmountColumn,
+    "convenience_amount": _AmountColumn,
+    "settlement_amount": _AmountColumn,
+    "shipping_amount": _AmountColumn,
+    "device_id": _CategoryColumn,
+    "gateway_response_code": _CategoryColumn,
+    "gateway_response_message": _CategoryColumn,
+    "issuer_response_code": _CategoryColumn,
+    "issuer_response_message": _CategoryColumn,
+    "service_name": _CategoryColumn,
+    "status": _CategoryColumn,
+}
+
+
+class TransactionSummaryRow(object):
+    """
+    Read-only view of one row of a `TransactionSummaryTable`, with the
+    attributes of `TransactionSummary`
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    def to_summary(self):
+        """
+        Copies the row into a `TransactionSummary`.
+        :return: TransactionSummary
+        """
+
+        summary = TransactionSummary()
+        for name in TransactionSummaryTable.columns:
+            setattr(summary, name, self._columns[name].get(self._index))
+        return summary
+
+
+def _row_property(name):
+    return property(lambda row: row._columns[name].get(row._index))
+
+
+class TransactionSummaryTable(object):
+    """
+    Column-oriented collection of report rows.
+
+    Returned in place of a list of `TransactionSummary` objects by
+    reports built with `with_columnar(True)`. Rows are read as
+    `TransactionSummaryRow` proxies; slicing returns a view sharing the
+    same storage.
+    """
+
+    #  Names of the stored `TransactionSummary` fields
+    columns = TransactionSummary.__slots__
+
+    def __init__(self, summaries=None):
+        """
+        :param summaries: Optional `TransactionSummary` objects to add
+        """
+
+        self._columns = {
+            name: _COLUMN_TYPES.get(name, _TextColumn)() for name in self.columns
+        }
+        self._start = 0
+        self._stop = None
+        if summaries is not None:
+            self.extend(summaries)
+
+    def __len__(self):
+        if self._stop is None:
+            return len(self._columns[self.columns[0]])
+        return self._stop - self._start
+
+    def __iter__(self):
+        columns = self._columns
+        for index in range(self._start, self._start + len(self)):
+            yield TransactionSummaryRow(columns, index)
+
+    def __getitem__(self, index):
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            view = TransactionSummaryTable.__new__(TransactionSummaryTable)
+            view._columns = self._columns
+            view._start = self._start + start
+            view._stop = self._start + max(start, stop)
+            return view
+
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Row index out of range")
+        return TransactionSummaryRow(self._columns, self._start + index)
+
+    def append(self, summary):
+        """
+        Adds a row.
+        :param summary: The `TransactionSummary` holding the row values
+        :return: None
+        """
+
+        if self._stop is not None:
+            raise ApiException("Rows cannot be added to a table view")
+        for name, column in self._columns.items():
+            column.append(getattr(summary, name))
+
+    def extend(self, summaries):
+        """
+        Adds rows.
+        :param summaries: `TransactionSummary` objects
+        :return: None
+        """
+
+        for summary in summaries:
+            self.append(summary)
+
+    def column(self, name):
+        """
+        Gets the values of one field.
+        :param name: The field name
+        :return: List of values, one per row
+        """
+
+        column = self._columns[name]
+        return [
+            column.get(index) for index in range(self._start, self._start + len(self))
+        ]
+
+    def to_numpy(self):
+        """
+        Exports the rows to a NumPy structured array. Amounts become
+        float64 fields, NaN when missing or not numeric, and other fields
+        fixed-width strings, empty when missing. Requires NumPy.
+        :return: numpy.ndarray
+        """
+
+        try:
+            import numpy
+        except ImportError:
+            raise ApiException("NumPy is required to export report tables")
+
+        fields = []
+        values = {}
+        for name in self.columns:
+            data = self.column(name)
+            if _COLUMN_TYPES.get(name) is _AmountColumn:
+                fields.append((name, "f8"))
+                values[name] = [_to_float(value) for value in data]
+            else:
+                data = ["" if value is None else str(value) for value in data]
+                fields.append((name, "U{}".format(max(map(len, data), default=0) or 1)))
+                values[name] = data
+
+        result = numpy.empty(len(self), dtype=fields)
+        for name, data in values.items():
+            result[name] = data
+        return result
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+for _name in TransactionSummaryTable.columns:
+    setattr(TransactionSummaryRow, _name, _row_property(_name))
+del _name
@@ -1,13 +1,18 @@
 """
 """
 
+import asyncio
 import base64
+import copy
 import datetime
+import functools
 import re
+import threading
+import time
 import xml.etree.cElementTree as et
+from concurrent import futures
 from importlib.metadata import version
 
-import certifi
 import jsonpickle
 import urllib3.contrib.pyopenssl
 import xmltodict
@@ -15,22 +20,18 @@ import xmltodict
 import globalpayments as gp
 from globalpayments.api.entities import (
     Address,
-    BatchSummary,
     Customer,
-    DebitMac,
     RecurringPaymentMethod,
     Schedule,
     ThreeDSecure,
     Transaction,
     TransactionSummary,
-    ECommerceInfo,
+    TransactionSummaryTable,
 )
 from globalpayments.api.entities.enums import (
     AccountType,
     AddressType,
-    AliasAction,
     CheckType,
-    EntryMethod,
     FraudFilterMode,
     HppVersion,
     PaymentMethodType,
@@ -39,58 +40,597 @@ from globalpayments.api.entities.enums import (
     SecCode,
     TransactionType,
     TransactionModifier,
-    ThreeDSecureVersion,
 )
 from globalpayments.api.entities.exceptions import (
     ApiException,
     BuilderException,
+    CircuitBreakerOpenException,
     GatewayException,
+    GatewayTimeoutException,
     UnsupportedTransactionException,
 )
+from globalpayments.api.gateways.async_http import (
+    ConnectError,
+    ConnectTimeoutError,
+    ResponseInterruptedError,
+)
+from globalpayments.api.gateways.circuit_breaker import CIRCUIT_BREAKERS
+from globalpayments.api.gateways.connection_pool import (
+    ConnectionPool,
+    register_after_fork,
+)
+from globalpayments.api.gateways.endpoint_selector import EndpointSelector
 from globalpayments.api.gateways.gateway_response import GatewayResponse
+from globalpayments.api.gateways.portico_response import (
+    PorticoResponse,
+    iter_report_items,
+)
+from globalpayments.api.gateways.portico_results import (
+    PORTICO_HEADER_SELECTOR,
+    PORTICO_TRANSACTION_SELECTOR,
+    LazyTransaction,
+    LazyTransactionSummary,
+    map_batch_summary,
+    map_debit_mac,
+    map_gift_card,
+    map_transaction_reference,
+)
+from globalpayments.api.gateways.portico_serializers import write_payment_method
+from globalpayments.api.gateways.portico_transaction_types import (
+    map_transaction_type,
+)
+from globalpayments.api.gateways.report_windows import ReportWindows
+from globalpayments.api.gateways.response_fields import (
+    PAYPLAN_ADDRESS_FIELDS,
+    PAYPLAN_CUSTOMER_FIELDS,
+    PAYPLAN_PAYMENT_METHOD_FIELDS,
+    PAYPLAN_SCHEDULE_FIELDS,
+    PORTICO_HEADER_FIELDS,
+    PORTICO_TRANSACTION_FIELDS,
+    PORTICO_TRANSACTION_SUMMARY_FIELDS,
+    normalize_response_code,
+)
+from globalpayments.api.gateways.retry_policy import RetryPolicy
 from globalpayments.api.gateways.table_service_connector import TableServiceConnector
+from globalpayments.api.gateways.timeout_reversal import TimeoutReversalEngine
 from globalpayments.api.payment_methods import (
     Credit,
     CreditCardData,
     ECheck,
     Encryptable,
-    GiftCard,
     TrackData,
     TransactionReference,
 )
 from globalpayments.api.utils import GenerationUtils
+from globalpayments.api.utils.xml_writer import XmlWriter, tostring
 
 urllib3.contrib.pyopenssl.inject_into_urllib3()
-HTTP = urllib3.PoolManager(cert_reqs="CERT_REQUIRED", ca_certs=certifi.where())
+HTTP = ConnectionPool()
+_HEDGE_EXECUTOR_LOCK = threading.Lock()
+
+#  Row element names of the Portico reports returned as rows
+_PORTICO_REPORT_ITEMS = {
+    ReportType.Activity: "Details",
+    ReportType.FindTransactions: "Transactions",
+}
+
+#  Fixed parts of the Portico SOAP envelope around the header and transaction
+_PORTICO_ENVELOPE_OPEN = (
+    b'<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    b'<soap:Body><PosRequest xmlns="http://Hps.Exchange.PosGateway">'
+    b"<Ver1.0><Header>"
+)
+_PORTICO_ENVELOPE_CLOSE = (
+    b"</Transaction></Ver1.0></PosRequest></soap:Body></soap:Envelope>"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_release_version():
+    if "site-packages" in __file__:
+        return version("GlobalPayments.Api")
+    return "0.0.0"
 
 
 class Gateway(object):
     _content_type = None
-    headers = {}
+    headers = None
     timeout = None
+    connect_timeout = None
+    tls_timeout = None
+    read_timeout = None
     service_url = None
+    connection_pool = None
+    retry_policy = None
+    circuit_breakers = None
+    endpoints = None
+    hedging_enabled = False
+    traffic_limiter = None
+    _hedge_executor = None
 
     def __init__(self, content_type):
         self._content_type = content_type
+        self.headers = {}
+
+    def send_request(
+        self,
+        verb,
+        endpoint,
+        data=None,
+        query_string_params=None,
+        builder=None,
+        stream=False,
+    ):
+        """
+        Sends a request, applying the configured traffic limits, retries,
+        failover and hedging.
+
+        With `stream` set, a successful response is returned with its
+        body unread in `GatewayResponse.stream`, and is never hedged. The
+        traffic lane is then held in `GatewayResponse.lane` until the
+        caller releases it with the body.
+        """
+
+        tried = set()
+
+        def send():
+            return self._send_request(
+                verb, endpoint, data, query_string_params, builder, tried, stream
+            )
+
+        lane = None
+        if self.traffic_limiter is not None:
+            lane = self.traffic_limiter.acquire(builder)
+        try:
+            if self.retry_policy is None:
+                response = send()
+            else:
+                response = self.retry_policy.execute(send, verb, builder)
+            if response.stream is not None:
+                response.lane, lane = lane, None
+            return response
+        finally:
+            if lane is not None:
+                lane.release()
+
+    async def send_request_async(
+        self, verb, endpoint, data=None, query_string_params=None, builder=None
+    ):
+        tried = set()
+
+        def send():
+            return self._send_request_async(
+                verb, endpoint, data, query_string_params, builder, tried
+            )
+
+        lane = None
+        if self.traffic_limiter is not None:
+            lane = await self.traffic_limiter.acquire_async(builder)
+        try:
+            if self.retry_policy is None:
+                return await send()
+            return await self.retry_policy.execute_async(send, verb, builder)
+        finally:
+            if lane is not None:
+                lane.release()
+
+    def _send_request(
+        self, verb, endpoint, data, query_string_params, builder, tried, stream=False
+    ):
+        service_urls = self._rank_service_urls(tried)
+        delay = None if stream else self._get_hedge_delay(service_urls[0], builder)
+        if delay is None:
+            return self._send_with_failover(
+                service_urls,
+                verb,
+                endpoint,
+                data,
+                query_string_params,
+                builder,
+                tried,
+                stream,
+            )
+
+        executor = self._get_hedge_executor()
+        primary = executor.submit(
+            self._send_with_failover,
+            service_urls,
+            verb,
+            endpoint,
+            data,
+            query_string_params,
+            builder,
+            tried,
+        )
+        done, _ = futures.wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = executor.submit(
+            self._send_to,
+            service_urls[1 % len(service_urls)],
+            verb,
+            endpoint,
+            data,
+            query_string_params,
+            builder,
+        )
+        pending = {primary, hedge}
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+        return primary.result()
+
+    async def _send_request_async(
+        self, verb, endpoint, data, query_string_params, builder, tried
+    ):
+        service_urls = self._rank_service_urls(tried)
+        delay = self._get_hedge_delay(service_urls[0], builder)
+        if delay is None:
+            return await self._send_with_failover_async(
+                service_urls, verb, endpoint, data, query_string_params, builder, tried
+            )
+
+        primary = asyncio.ensure_future(
+            self._send_with_failover_async(
+                service_urls, verb, endpoint, data, query_string_params, builder, tried
+            )
+        )
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            tasks.append(
+                asyncio.ensure_future(
+                    self._send_to_async(
+                        service_urls[1 % len(service_urls)],
+                        verb,
+                        endpoint,
+                        data,
+                        query_string_params,
+                        builder,
+                    )
+                )
+            )
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _send_with_failover(
+        self,
+        service_urls,
+        verb,
+        endpoint,
+        data,
+        query_string_params,
+        builder,
+        tried,
+        stream=False,
+    ):
+        for index, service_url in enumerate(service_urls):
+            tried.add(service_url)
+            try:
+                return self._send_to(
+                    service_url,
+                    verb,
+                    endpoint,
+                    data,
+                    query_string_params,
+                    builder,
+                    stream,
+                )
+            except GatewayException as exc:
+                if index + 1 == len(service_urls) or not self._can_fail_over(exc):
+                    raise
+
+    async def _send_with_failover_async(
+        self, service_urls, verb, endpoint, data, query_string_params, builder, tried
+    ):
+        for index, service_url in enumerate(service_urls):
+            tried.add(service_url)
+            try:
+                return await self._send_to_async(
+                    service_url, verb, endpoint, data, query_string_params, builder
+                )
+            except GatewayException as exc:
+                if index + 1 == len(service_urls) or not self._can_fail_over(exc):
+                    raise
+
+    def _send_to(
+        self,
+        service_url,
+        verb,
+        endpoint,
+        data,
+        query_string_params,
+        builder,
+        stream=False,
+    ):
+        query_string = self._build_query_string(query_string_params)
+        url = service_url + endpoint + query_string
+        request_headers = self._build_headers()
+        connect, tls, read, total = self._get_timeout(self._get_remaining_time(builder))
+        breaker = self._acquire_circuit_breaker(service_url)
+        started = time.monotonic()
+
+        try:
+            request = (self.connection_pool or HTTP).request(
+                verb,
+                url,
+                headers=request_headers,
+                body=data,
+                timeout=urllib3.Timeout(
+                    # urllib3 applies the connect timeout to each socket
+                    # operation of the TLS handshake as well
+                    connect=self._add_timeouts(connect, tls),
+                    read=read,
+                    total=total,
+                ),
+                pool_timeout=total,
+                # the retry policy decides which failures are safe to repeat
+                retries=False if self.retry_policy is not None else None,
+                preload_content=not stream,
+            )
+        except Exception as exc:
+            self._record_outcome(service_url, breaker, started)
+            if self._is_connect_failure(exc):
+                raise GatewayException(
+                    "Error occurred while communicating with gateway.",
+                    inner_exception=exc,
+                    request_sent=False,
+                )
+            if self._is_timeout(exc):
+                raise GatewayTimeoutException(
+                    "Timed out while communicating with gateway.",
+                    exc,
+                    request_sent=not self._is_unsent_timeout(exc),
+                )
+            raise GatewayException(
+                "Error occurred while communicating with gateway.", exc
+            )
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        self._record_outcome(service_url, breaker, started, request.status)
+        response = GatewayResponse()
+        response.status_code = request.status
+        if stream and request.status == 200:
+            response.stream = request
+        else:
+            response.raw_response = request.data
+            if stream:
+                request.release_conn()
+        return response
 
-    def send_request(self, verb, endpoint, data=None, query_string_params=None):
+    async def _send_to_async(
+        self, service_url, verb, endpoint, data, query_string_params, builder
+    ):
         query_string = self._build_query_string(query_string_params)
-        url = self.service_url + endpoint + query_string
-        request_headers = {"Content-Type": self._content_type}
-        for key in self.headers:
-            request_headers[key] = self.headers[key]
+        url = service_url + endpoint + query_string
+        request_headers = self._build_headers()
+        connect, tls, read, total = self._get_timeout(self._get_remaining_time(builder))
+        breaker = self._acquire_circuit_breaker(service_url)
+        started = time.monotonic()
 
         try:
-            request = HTTP.request(verb, url, headers=request_headers, body=data)
-            raw_response = request.data
-            response = GatewayResponse()
-            response.status_code = request.status
-            response.raw_response = raw_response
-            return response
+            response = await (self.connection_pool or HTTP).request_async(
+                verb,
+                url,
+                headers=request_headers,
+                body=data,
+                connect_timeout=connect,
+                tls_timeout=tls,
+                read_timeout=read,
+                total_timeout=total,
+            )
         except Exception as exc:
+            self._record_outcome(service_url, breaker, started)
+            if isinstance(exc, ResponseInterruptedError):
+                # the request was delivered, so its outcome is unknown
+                raise GatewayTimeoutException(
+                    "Connection closed while reading the gateway response.",
+                    exc,
+                    request_sent=True,
+                )
+            if self._is_connect_failure(exc):
+                raise GatewayException(
+                    "Error occurred while communicating with gateway.",
+                    inner_exception=exc,
+                    request_sent=False,
+                )
+            if self._is_timeout(exc):
+                raise GatewayTimeoutException(
+                    "Timed out while communicating with gateway.",
+                    exc,
+                    request_sent=not self._is_unsent_timeout(exc),
+                )
             raise GatewayException(
                 "Error occurred while communicating with gateway.", exc
             )
+        except BaseException:
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        self._record_outcome(service_url, breaker, started, response.status_code)
+        return response
+
+    def _rank_service_urls(self, tried):
+        if self.endpoints is None:
+            return [self.service_url]
+        return self.endpoints.rank(tried)
+
+    def _get_hedge_delay(self, service_url, builder):
+        if (
+            not self.hedging_enabled
+            or self.endpoints is None
+            or not self.endpoints.is_hedgeable(builder)
+        ):
+            return None
+        return self.endpoints.hedge_delay(service_url)
+
+    def _get_hedge_executor(self):
+        executor = self._hedge_executor
+        if executor is None:
+            with _HEDGE_EXECUTOR_LOCK:
+                executor = self._hedge_executor
+                if executor is None:
+                    executor = futures.ThreadPoolExecutor(
+                        max_workers=16, thread_name_prefix="gp-hedge"
+                    )
+                    self._hedge_executor = executor
+                    register_after_fork(self)
+        return executor
+
+    def _after_fork(self):
+        global _HEDGE_EXECUTOR_LOCK
+
+        # the executor's threads stayed in the parent; a new one is
+        # created on the next hedged request
+        _HEDGE_EXECUTOR_LOCK = threading.Lock()
+        self._hedge_executor = None
+
+    @staticmethod
+    def _can_fail_over(exc):
+        # only requests the endpoint never received can move to another one
+        return isinstance(exc, CircuitBreakerOpenException) or not exc.request_sent
+
+    def _acquire_circuit_breaker(self, service_url):
+        if self.circuit_breakers is None:
+            return None
+        breaker = self.circuit_breakers.get(service_url)
+        breaker.acquire()
+        return breaker
+
+    def _record_outcome(self, service_url, breaker, started, status_code=None):
+        duration = time.monotonic() - started
+        success = status_code is not None and status_code < 500
+        if breaker is not None:
+            if success:
+                breaker.record_success(duration)
+            else:
+                breaker.record_failure(duration)
+        if self.endpoints is not None:
+            self.endpoints.record(service_url, duration, success)
+
+    def _build_headers(self):
+        request_headers = {"Content-Type": self._content_type}
+        for key in self.headers:
+            request_headers[key] = self.headers[key]
+        return request_headers
+
+    def _get_timeout(self, remaining=None):
+        """
+        Resolves the connect, TLS, read and total budgets (in seconds)
+        for a single request. Unset phase budgets fall back to `timeout`.
+        """
+
+        total = self._to_seconds(self.timeout)
+        connect = self._to_seconds(self.connect_timeout)
+        tls = self._to_seconds(self.tls_timeout)
+        read = self._to_seconds(self.read_timeout)
+
+        if remaining is not None:
+            if remaining <= 0:
+                raise GatewayTimeoutException(
+                    "Deadline exceeded before the request could be sent.",
+                    request_sent=False,
+                )
+            total = remaining if total is None else min(total, remaining)
+
+        return (
+            total if connect is None else connect,
+            total if tls is None else tls,
+            total if read is None else read,
+            total,
+        )
+
+    @staticmethod
+    def _get_remaining_time(builder):
+        deadline = getattr(builder, "deadline", None)
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    @staticmethod
+    def _to_seconds(milliseconds):
+        if milliseconds is None:
+            return None
+        return milliseconds / 1000.0
+
+    @staticmethod
+    def _add_timeouts(first, second):
+        if first is None or second is None:
+            return None
+        return first + second
+
+    @staticmethod
+    def _is_connect_failure(exc):
+        """
+        Determines if a connection to the gateway could not be opened, so
+        no request data was sent
+        """
+
+        if isinstance(exc, urllib3.exceptions.MaxRetryError):
+            exc = exc.reason
+        return isinstance(
+            exc,
+            (
+                # also covers DNS failures and refused connections
+                urllib3.exceptions.NewConnectionError,
+                ConnectError,
+            ),
+        )
+
+    @staticmethod
+    def _is_timeout(exc):
+        if isinstance(exc, urllib3.exceptions.MaxRetryError):
+            exc = exc.reason
+        return isinstance(
+            exc,
+            (
+                urllib3.exceptions.ConnectTimeoutError,
+                urllib3.exceptions.ReadTimeoutError,
+                # raised when a blocking pool has no free connection in time
+                urllib3.exceptions.EmptyPoolError,
+                asyncio.TimeoutError,
+                TimeoutError,
+            ),
+        )
+
+    @staticmethod
+    def _is_unsent_timeout(exc):
+        """
+        Determines if a timeout happened before any request data was sent
+        to the gateway
+        """
+
+        if isinstance(exc, urllib3.exceptions.MaxRetryError):
+            exc = exc.reason
+        return isinstance(
+            exc,
+            (
+                urllib3.exceptions.ConnectTimeoutError,
+                urllib3.exceptions.EmptyPoolError,
+                ConnectTimeoutError,
+            ),
+        )
 
     @staticmethod
     def _build_query_string(query_string_params):
@@ -103,9 +643,23 @@ class RestGateway(Gateway):
     def __init__(self):
         Gateway.__init__(self, "application/json")
 
-    def do_transaction(self, verb, endpoint, data=None, query_string_params=None):
-        response = self.send_request(verb, endpoint, data, query_string_params)
-        if response.status_code is not 200 and response.status_code is not 204:
+    def do_transaction(
+        self, verb, endpoint, data=None, query_string_params=None, builder=None
+    ):
+        response = self.send_request(verb, endpoint, data, query_string_params, builder)
+        return self._check_response_status(response)
+
+    async def do_transaction_async(
+        self, verb, endpoint, data=None, query_string_params=None, builder=None
+    ):
+        response = await self.send_request_async(
+            verb, endpoint, data, query_string_params, builder
+        )
+        return self._check_response_status(response)
+
+    @staticmethod
+    def _check_response_status(response):
+        if response.status_code != 200 and response.status_code != 204:
             parsed = jsonpickle.decode(response.raw_response)
             error = parsed if "error" not in parsed else parsed["error"]
             raise GatewayException(
@@ -118,9 +672,30 @@ class XmlGateway(Gateway):
     def __init__(self):
         Gateway.__init__(self, "text/xml")
 
-    def do_transaction(self, request):
-        response = self.send_request("POST", "", request)
-        if response.status_code is not 200:
+    def do_transaction(self, request, builder=None):
+        response = self.send_request("POST", "", request, builder=builder)
+        return self._check_response_status(response)
+
+    async def do_transaction_async(self, request, builder=None):
+        response = await self.send_request_async("POST", "", request, builder=builder)
+        return self._check_response_status(response)
+
+    def do_transaction_stream(self, request, builder=None):
+        """
+        Sends a request and returns the response without reading its body.
+
+        :return: GatewayResponse holding the urllib3 response in `stream`;
+            the caller reads the body, releases the connection and then
+            releases `lane`, if set
+        """
+
+        response = self.send_request("POST", "", request, builder=builder, stream=True)
+        self._check_response_status(response)
+        return response
+
+    @staticmethod
+    def _check_response_status(response):
+        if response.status_code != 200:
             raise GatewayException(
                 "Unexpected http status code [{}]".format(response.status_code)
             )
@@ -140,9 +715,11 @@ class PayPlanConnector(RestGateway):
 
         if value is not None:
             encoded_value = base64.b64encode(bytearray(value.encode()))
-            self.headers["Authorization"] = "Basic {}".format(
-                encoded_value.decode("ascii")
-            )
+            # replaced rather than mutated so in-flight requests never see
+            # a partially updated mapping
+            headers = dict(self.headers)
+            headers["Authorization"] = "Basic {}".format(encoded_value.decode("ascii"))
+            self.headers = headers
 
     @property
     def supports_retrieval(self):
@@ -156,6 +733,24 @@ class PayPlanConnector(RestGateway):
         RestGateway.__init__(self)
 
     def process_recurring(self, builder):
+        response = self.do_transaction(
+            self._map_method(builder.transaction_type),
+            self._map_url(builder),
+            jsonpickle.encode(self._build_request(builder), False, False, False),
+            builder=builder,
+        )
+        return self._map_response(response, builder)
+
+    async def process_recurring_async(self, builder):
+        response = await self.do_transaction_async(
+            self._map_method(builder.transaction_type),
+            self._map_url(builder),
+            jsonpickle.encode(self._build_request(builder), False, False, False),
+            builder=builder,
+        )
+        return self._map_response(response, builder)
+
+    def _build_request(self, builder):
         request = {}
 
         if (
@@ -174,12 +769,7 @@ class PayPlanConnector(RestGateway):
             for key, value in list(builder.search_criteria.items()):
                 request[key] = value
 
-        response = self.do_transaction(
-            self._map_method(builder.transaction_type),
-            self._map_url(builder),
-            jsonpickle.encode(request, False, False, False),
-        )
-        return self._map_response(response, builder)
+        return request
 
     def _map_response(self, raw_response, builder):
         if raw_response is None or raw_response == "":
@@ -550,189 +1140,17 @@ class PayPlanConnector(RestGateway):
         return request
 
     def _hydrate_customer(self, response):
-        customer = Customer()
-
-        customer.key = response["customerKey"] if "customerKey" in response else None
-        customer.id = (
-            response["customerIdentifier"] if "customerIdentifier" in response else None
-        )
-        customer.first_name = response["firstName"] if "firstName" in response else None
-        customer.last_name = response["lastName"] if "lastName" in response else None
-        customer.company = response["company"] if "company" in response else None
-        customer.status = (
-            response["customerStatus"] if "customerStatus" in response else None
-        )
-        customer.title = response["title"] if "title" in response else None
-        customer.department = (
-            response["department"] if "department" in response else None
-        )
-        customer.email = (
-            response["primaryEmail"] if "primaryEmail" in response else None
-        )
-        customer.home_phone = (
-            response["phoneEvening"] if "phoneEvening" in response else None
-        )
-        customer.work_phone = response["phoneDay"] if "phoneDay" in response else None
-        customer.mobile_phone = (
-            response["phoneMobile"] if "phoneMobile" in response else None
-        )
-        customer.fax = response["fax"] if "fax" in response else None
-        customer.address = Address()
-        customer.address.street_address_1 = (
-            response["addressLine1"] if "addressLine1" in response else None
-        )
-        customer.address.street_address_2 = (
-            response["addressLine2"] if "addressLine2" in response else None
-        )
-        customer.address.city = response["city"] if "city" in response else None
-        customer.address.province = (
-            response["stateProvince"] if "stateProvince" in response else None
-        )
-        customer.address.postal_code = (
-            response["zipPostalCode"] if "zipPostalCode" in response else None
-        )
-        customer.address.country = (
-            response["country"] if "country" in response else None
-        )
-
+        customer = PAYPLAN_CUSTOMER_FIELDS.apply(Customer(), response)
+        customer.address = PAYPLAN_ADDRESS_FIELDS.apply(Address(), response)
         return customer
 
     def _hydrate_payment_method(self, response):
-        method = RecurringPaymentMethod()
-
-        method.key = (
-            response["paymentMethodKey"] if "paymentMethodKey" in response else None
-        )
-        method.id = (
-            response["paymentMethodIdentifier"]
-            if "paymentMethodIdentifier" in response
-            else None
-        )
-        method.payment_type = (
-            response["paymentMethodType"] if "paymentMethodType" in response else None
-        )
-        method.preferred_payment = (
-            response["preferredPayment"] == "true"
-            if "preferredPayment" in response
-            else None
-        )
-        method.status = (
-            response["paymentStatus"] if "paymentStatus" in response else None
-        )
-        method.customer_key = (
-            response["customerKey"] if "customerKey" in response else None
-        )
-        method.name_on_account = (
-            response["nameOnAccount"] if "nameOnAccount" in response else None
-        )
-        method.commercial_indicator = (
-            response["commercialIndicator"]
-            if "commercialIndicator" in response
-            else None
-        )
-        method.tax_type = response["taxType"] if "taxType" in response else None
-        method.expiration_date = (
-            response["expirationDate"] if "expirationDate" in response else None
-        )
-        method.address = Address()
-        method.address.street_address_1 = (
-            response["addressLine1"] if "addressLine1" in response else None
-        )
-        method.address.street_address_2 = (
-            response["addressLine2"] if "addressLine2" in response else None
-        )
-        method.address.city = response["city"] if "city" in response else None
-        method.address.province = (
-            response["stateProvince"] if "stateProvince" in response else None
-        )
-        method.address.postal_code = (
-            response["zipPostalCode"] if "zipPostalCode" in response else None
-        )
-        method.address.country = response["country"] if "country" in response else None
-
+        method = PAYPLAN_PAYMENT_METHOD_FIELDS.apply(RecurringPaymentMethod(), response)
+        method.address = PAYPLAN_ADDRESS_FIELDS.apply(Address(), response)
         return method
 
     def _hydrate_schedule(self, response):
-        schedule = Schedule()
-
-        schedule.key = response["scheduleKey"] if "scheduleKey" in response else None
-        schedule.id = (
-            response["scheduleIdentifier"] if "scheduleIdentifier" in response else None
-        )
-        schedule.customer_key = (
-            response["customerKey"] if "customerKey" in response else None
-        )
-        schedule.name = response["scheduleName"] if "scheduleName" in response else None
-        schedule.status = (
-            response["scheduleStatus"] if "scheduleStatus" in response else None
-        )
-        schedule.payment_key = (
-            response["paymentMethodKey"] if "paymentMethodKey" in response else None
-        )
-
-        if "subtotalAmount" in response:
-            subtotal = response["subtotalAmount"]
-            schedule.amount = int(subtotal["value"]) / 100
-            schedule.currency = subtotal["currency"]
-
-        if "taxAmount" in response:
-            tax = response["taxAmount"]
-            schedule.tax_amount = tax["value"]
-
-        schedule.device_id = response["deviceId"] if "deviceId" in response else None
-        schedule.start_date = response["startDate"] if "startDate" in response else None
-
-        if "processingDateInfo" in response:
-            schedule.payment_schedule = PaymentSchedule.Dynamic
-            if response["processingDateInfo"] == "Last":
-                schedule.payment_schedule = PaymentSchedule.LastDayOfTheMonth
-            elif response["processingDateInfo"] == "First":
-                schedule.payment_schedule = PaymentSchedule.FirstDayOfTheMonth
-            else:
-                schedule.payment_schedule = PaymentSchedule.Dynamic
-        else:
-            schedule.payment_schedule = PaymentSchedule.Dynamic
-
-        schedule.frequency = response["frequency"] if "frequency" in response else None
-        schedule.end_date = response["endDate"] if "endDate" in response else None
-        schedule.reprocessing_count = (
-            response["reprocessingCount"] if "reprocessingCount" in response else None
-        )
-        schedule.email_receipt = (
-            response["emailReceipt"] if "emailReceipt" in response else None
-        )
-        schedule.email_notification = (
-            response["emailNotification"] == "Yes"
-            if "emailNotification" in response
-            else None
-        )
-        schedule.invoice_number = (
-            response["invoiceNbr"] if "invoiceNbr" in response else None
-        )
-        schedule.po_number = response["poNumber"] if "poNumber" in response else None
-        schedule.description = (
-            response["description"] if "description" in response else None
-        )
-        # statusSetDate
-        schedule.next_processing_date = (
-            response["nextProcessingDate"] if "nextProcessingDate" in response else None
-        )
-        # previousProcessingDate
-        # approvedTransactionCount
-        # failureCount
-        # totalApprovedAmountToDate
-        # numberOfPaymentsRemaining
-        schedule.cancellation_date = (
-            response["cancellationDate"] if "cancellationDate" in response else None
-        )
-        # creationDate
-        schedule.has_started = (
-            response["scheduleStarted"] == "true"
-            if "scheduleStarted" in response
-            else None
-        )
-
-        return schedule
+        return PAYPLAN_SCHEDULE_FIELDS.apply(Schedule(), response)
 
     def _has_token(self, payment_method):
         if self._has_attr(payment_method, "token") and payment_method.token is not None:
@@ -759,6 +1177,16 @@ class PorticoConnector(XmlGateway):
     developer_id = None
     version_number = None
     sdkNameVersion = None
+    timeout_reversal = None
+    #  Names of the `Transaction` fields to map from responses, or None
+    #  to map them all
+    response_fields = None
+    #  Whether results are mapped from the response on first access
+    #  instead of when the response arrives
+    lazy_responses = False
+    #  Bytes read from the connection at a time when streaming reports
+    stream_chunk_size = 64 * 1024
+    _envelope_header = None
 
     @property
     def supports_hosted_payments(self):
@@ -768,8 +1196,46 @@ class PorticoConnector(XmlGateway):
         XmlGateway.__init__(self)
 
     def process_authorization(self, builder):
-        transaction = et.Element(self._map_transaction_type(builder))
-        block1 = et.SubElement(transaction, "Block1")
+        reversible = self._prepare_timeout_reversal(builder)
+        try:
+            response = self.do_transaction(self._build_authorization(builder), builder)
+        except GatewayTimeoutException as exc:
+            if reversible and exc.request_sent:
+                self.timeout_reversal.submit(self, builder)
+            raise
+        return self._map_response(response, builder.payment_method)
+
+    async def process_authorization_async(self, builder):
+        reversible = self._prepare_timeout_reversal(builder)
+        try:
+            response = await self.do_transaction_async(
+                self._build_authorization(builder), builder
+            )
+        except GatewayTimeoutException as exc:
+            if reversible and exc.request_sent:
+                self.timeout_reversal.submit(self, builder)
+            raise
+        return self._map_response(response, builder.payment_method)
+
+    def _prepare_timeout_reversal(self, builder):
+        """
+        Ensures reversible authorizations carry a client transaction id when
+        timeout reversals are enabled
+        """
+
+        if self.timeout_reversal is None or not self.timeout_reversal.supports(builder):
+            return False
+        if builder.client_transaction_id is None:
+            builder.client_transaction_id = (
+                GenerationUtils.generate_client_transaction_id()
+            )
+        return True
+
+    def _build_authorization(self, builder):
+        name = self._map_transaction_type(builder)
+        writer = self._start_envelope(builder.client_transaction_id)
+        writer.start(name)
+        writer.start("Block1")
 
         # build request
         if (
@@ -787,9 +1253,7 @@ class PorticoConnector(XmlGateway):
                 ):
                     pass
                 else:
-                    et.SubElement(block1, "AllowDup").text = (
-                        "Y" if builder.allow_duplicates else "N"
-                    )
+                    writer.element("AllowDup", "Y" if builder.allow_duplicates else "N")
                     if (
                         builder.transaction_type != TransactionType.Refund
                         and (
@@ -802,66 +1266,85 @@ class PorticoConnector(XmlGateway):
                         and builder.payment_method.payment_method_type
                         != PaymentMethodType.Recurring
                     ):
-                        et.SubElement(block1, "AllowPartialAuth").text = (
-                            "Y" if builder.allow_partial_auth else "N"
+                        writer.element(
+                            "AllowPartialAuth",
+                            "Y" if builder.allow_partial_auth else "N",
                         )
 
         if builder.amount is not None:
-            et.SubElement(block1, "Amt").text = str(builder.amount)
+            writer.element("Amt", str(builder.amount))
 
         if builder.gratuity:
-            et.SubElement(block1, "GratuityAmtInfo").text = str(builder.gratuity)
+            writer.element("GratuityAmtInfo", str(builder.gratuity))
 
         if builder.convenience_amt:
-            et.SubElement(block1, "ConvenienceAmtInfo").text = str(
-                builder.convenience_amt
-            )
+            writer.element("ConvenienceAmtInfo", str(builder.convenience_amt))
 
         if builder.shipping_amt:
-            et.SubElement(block1, "ShippingAmtInfo").text = str(builder.shipping_amt)
+            writer.element("ShippingAmtInfo", str(builder.shipping_amt))
 
         # because plano
         if builder.cash_back_amount is not None:
-            et.SubElement(
-                block1,
+            writer.element(
                 (
                     "CashbackAmtInfo"
                     if builder.payment_method.payment_method_type
                     == PaymentMethodType.Debit
                     else "CashBackAmount"
                 ),
-            ).text = str(builder.cash_back_amount)
+                str(builder.cash_back_amount),
+            )
 
         # offline auth code
         if builder.offline_auth_code:
-            et.SubElement(block1, "OfflineAuthCode").text = builder.offline_auth_code
+            writer.element("OfflineAuthCode", builder.offline_auth_code)
 
         # alias action
         if builder.transaction_type == TransactionType.Alias:
-            et.SubElement(block1, "Action").text = builder.alias_action.value
-            et.SubElement(block1, "Alias").text = builder.alias
+            writer.element("Action", builder.alias_action.value)
+            writer.element("Alias", builder.alias)
 
         # card holder
+        if builder.payment_method.payment_method_type == PaymentMethodType.ACH:
+            self._build_card_holder(writer, builder)
+        elif builder.billing_address is not None:
+            self._append_constant(
+                writer, builder, "card_holder", self._build_card_holder
+            )
+
+        # payment method
+        write_payment_method(self, writer, builder)
+
+        self._append_constant(
+            writer, builder, "details", self._build_authorization_details
+        )
+
+        writer.end("Block1")
+        writer.end(name)
+        return self._end_envelope(writer)
+
+    def _build_card_holder(self, writer, builder):
         is_check = builder.payment_method.payment_method_type == PaymentMethodType.ACH
         if is_check or builder.billing_address is not None:
-            holder = et.SubElement(
-                block1, "ConsumerInfo" if is_check else "CardHolderData"
-            )
+            holder = "ConsumerInfo" if is_check else "CardHolderData"
+            writer.start(holder)
 
             if builder.billing_address is not None:
-                et.SubElement(
-                    holder, "Address1" if is_check else "CardHolderAddr"
-                ).text = builder.billing_address.street_address_1
-                et.SubElement(holder, "City" if is_check else "CardHolderCity").text = (
-                    builder.billing_address.city
+                writer.element(
+                    "Address1" if is_check else "CardHolderAddr",
+                    builder.billing_address.street_address_1,
+                )
+                writer.element(
+                    "City" if is_check else "CardHolderCity",
+                    builder.billing_address.city,
                 )
-                et.SubElement(
-                    holder, "State" if is_check else "CardHolderState"
-                ).text = (
-                    builder.billing_address.province or builder.billing_address.state
+                writer.element(
+                    "State" if is_check else "CardHolderState",
+                    builder.billing_address.province or builder.billing_address.state,
                 )
-                et.SubElement(holder, "Zip" if is_check else "CardHolderZip").text = (
-                    builder.billing_address.postal_code
+                writer.element(
+                    "Zip" if is_check else "CardHolderZip",
+                    builder.billing_address.postal_code,
                 )
 
             if is_check:
@@ -869,329 +1352,30 @@ class PorticoConnector(XmlGateway):
 
                 if check.check_holder_name is not None:
                     names = check.check_holder_name.split(" ", 2)
-                    et.SubElement(holder, "FirstName").text = names[0]
-                    et.SubElement(holder, "LastName").text = names[1]
+                    writer.element("FirstName", names[0])
+                    writer.element("LastName", names[1])
 
-                et.SubElement(holder, "CheckName").text = check.check_name
-                et.SubElement(holder, "PhoneNumber").text = check.phone_number
-                et.SubElement(holder, "DLNumber").text = check.drivers_license_number
-                et.SubElement(holder, "DLState").text = check.drivers_license_state
+                writer.element("CheckName", check.check_name)
+                writer.element("PhoneNumber", check.phone_number)
+                writer.element("DLNumber", check.drivers_license_number)
+                writer.element("DLState", check.drivers_license_state)
 
                 if check.ssn_last_4 is not None or check.birth_year is not None:
-                    identity = et.SubElement(holder, "IdentityInfo")
-                    et.SubElement(identity, "SSNL4").text = check.ssn_last_4
-                    et.SubElement(identity, "DOBYear").text = check.birth_year
+                    writer.start("IdentityInfo")
+                    writer.element("SSNL4", check.ssn_last_4)
+                    writer.element("DOBYear", check.birth_year)
+                    writer.end("IdentityInfo")
 
-        # card data
-        has_token, token_value = self._has_token(builder.payment_method)
-
-        # because debit
-        card_data = None
-        if (
-            builder.payment_method.payment_method_type == PaymentMethodType.Debit
-            or builder.payment_method.payment_method_type == PaymentMethodType.ACH
-        ):
-            card_data = block1
-        else:
-            card_data = et.Element("CardData")
-
-        if (
-            self._has_attr(builder.payment_method, "is_card_data")
-            and builder.payment_method.is_card_data
-        ):
-            card = builder.payment_method
-
-            manual_entry = et.SubElement(
-                card_data, "TokenData" if has_token else "ManualEntry"
-            )
-            if self._should_include_credential_on_file(builder) and (
-                hasattr(builder, "card_brand_transaction_id")
-                and builder.card_brand_transaction_id
-                or hasattr(builder, "transaction_initiator")
-                and builder.transaction_initiator
-            ):
-                block1.append(self._hydrate_credential_on_file(builder))
-
-            et.SubElement(
-                manual_entry, "TokenValue" if has_token else "CardNbr"
-            ).text = (token_value or card.number)
-
-            if card.exp_month is not None:
-                et.SubElement(manual_entry, "ExpMonth").text = str(card.exp_month)
-            if card.exp_year is not None:
-                et.SubElement(manual_entry, "ExpYear").text = str(card.exp_year)
-            if card.cvn is not None:
-                et.SubElement(manual_entry, "CVV2").text = str(card.cvn)
-
-            et.SubElement(manual_entry, "ReaderPresent").text = (
-                "Y" if card.reader_present else "N"
-            )
-            et.SubElement(manual_entry, "CardPresent").text = (
-                "Y" if card.card_present else "N"
-            )
-
-            block1.append(card_data)
-
-            if isinstance(card, CreditCardData):
-                secure_ecom = card.three_d_secure
-
-                if (secure_ecom is not None) and (
-                    isinstance(secure_ecom, ECommerceInfo)
-                ):
-                    secure_ecommerce = et.SubElement(block1, "SecureECommerce")
-                    et.SubElement(secure_ecommerce, "PaymentDataSource").text = (
-                        secure_ecom.payment_data_source
-                    )
-                    et.SubElement(secure_ecommerce, "TypeOfPaymentData").text = (
-                        secure_ecom.payment_data_type
-                    )
-                    et.SubElement(secure_ecommerce, "PaymentData").text = (
-                        secure_ecom.cavv
-                    )
-                    et.SubElement(secure_ecommerce, "ECommerceIndicator").text = (
-                        secure_ecom.eci
-                    )
-                    et.SubElement(secure_ecommerce, "XID").text = secure_ecom.xid
-                elif (card.three_d_secure is not None) and (
-                    isinstance(card.three_d_secure, ThreeDSecure)
-                ):
-                    mpi = et.SubElement(block1, "Secure3D")
-                    et.SubElement(mpi, "Version").text = (
-                        "2"
-                        if card.three_d_secure.version == ThreeDSecureVersion.Two
-                        else "1"
-                    )
-                    et.SubElement(mpi, "AuthenticationValue").text = (
-                        card.three_d_secure.cavv
-                    )
-                    et.SubElement(mpi, "DirectoryServerTxnId").text = (
-                        card.three_d_secure.xid
-                    )
-                    et.SubElement(mpi, "ECI").text = str(card.three_d_secure.eci)
-
-            if builder.transaction_modifier == TransactionModifier.Recurring:
-                recurring = et.SubElement(block1, "RecurringData")
-                et.SubElement(recurring, "ScheduleID").text = builder.schedule_id
-                et.SubElement(recurring, "OneTime").text = (
-                    "Y" if builder.one_time_payment else "N"
-                )
-
-        elif (
-            self._has_attr(builder.payment_method, "is_track_data")
-            and builder.payment_method.is_track_data
-        ):
-            track = builder.payment_method
-
-            track_data = et.SubElement(
-                card_data, "TokenData" if has_token else "TrackData"
-            )
-            if not has_token:
-                track_data.text = str(track.value)
-                track_data.set(
-                    "method",
-                    (
-                        "proximity"
-                        if self._has_attr(track, "entry_method")
-                        and track.entry_method == EntryMethod.Proximity
-                        else "swipe"
-                    ),
-                )
-
-                # if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                #     if builder.tag_data is not None:
-                #         tag_data = et.SubElement(block1, 'EMVData')
-                #         et.SubElement(tag_data, 'EMVTagData').text = builder.tag_data
-
-                # if builder.payment_method.payment_method_type == PaymentMethodType.Debit:
-                #     chip_condition = None
-                #     if builder.chip_condition is not None:
-                #         chip_condition = 'CHIP_FAILED_PREV_SUCCESS' \
-                #             if builder.chip_condition == EmvChipCondition.ChipFailedPreviousSuccess \
-                #             else 'CHIP_FAILED_PREV_FAILED'
-
-                #     et.SubElement(block1, 'AccountType').text = builder.account_type
-                #     et.SubElement(block1, 'EMVChipCondition').text = chip_condition
-                #     et.SubElement(block1, 'MessageAuthenticationCode').text = \
-                #         builder.message_authentication_code
-                #     et.SubElement(block1, 'PosSequenceNbr').text = builder.pos_sequence_number
-                #     et.SubElement(block1, 'ReversalReasonCode').text = builder.reversal_reason_code
-
-                #     if builder.tag_data is not None:
-                #         tag_data = et.SubElement(block1, 'TagData')
-                #         et.SubElement(tag_data, 'TagValues', {'source': 'chip'}).text = builder.tag_data
-                # else:
-                if track.payment_method_type != PaymentMethodType.Debit:
-                    block1.append(card_data)
-            else:
-                et.SubElement(track_data, "TokenValue").text = token_value
-
-        elif isinstance(builder.payment_method, GiftCard):
-            card = builder.payment_method
-
-            # currency
-            if builder.currency:
-                et.SubElement(block1, "Currency").text = builder.currency.upper()
-
-            # if it's replace, add the new card, and change the card data name to be old card data
-            if builder.transaction_type == TransactionType.Replace:
-                new_card_data = et.SubElement(block1, "NewCardData")
-                et.SubElement(
-                    new_card_data, builder.replacement_card.value_type
-                ).text = builder.replacement_card.value
-                if builder.replacement_card.pin:
-                    et.SubElement(new_card_data, "PIN").text = (
-                        builder.replacement_card.pin
-                    )
-
-                card_data = et.Element("OldCardData")
-
-            et.SubElement(card_data, card.value_type).text = card.value
-            if card.pin:
-                et.SubElement(card_data, "PIN").text = card.pin
-
-            if builder.alias_action != AliasAction.Create:
-                block1.append(card_data)
-
-        elif isinstance(builder.payment_method, ECheck):
-            check = builder.payment_method
-
-            # check action
-            et.SubElement(block1, "CheckAction").text = "SALE"
-
-            if not has_token:
-                account_info = et.SubElement(block1, "AccountInfo")
-                if check.routing_number:
-                    et.SubElement(account_info, "RoutingNumber").text = (
-                        check.routing_number
-                    )
-                if check.account_number:
-                    et.SubElement(account_info, "AccountNumber").text = (
-                        check.account_number
-                    )
-                if check.check_number:
-                    et.SubElement(account_info, "CheckNumber").text = check.check_number
-                if check.micr_number:
-                    et.SubElement(account_info, "MICRData").text = check.micr_number
-                if check.account_type:
-                    et.SubElement(account_info, "AccountType").text = (
-                        check.account_type.value
-                    )
-            else:
-                et.SubElement(block1, "TokenValue").text = token_value
-                account_info = et.SubElement(block1, "AccountInfo")
-                if check.check_number:
-                    et.SubElement(account_info, "CheckNumber").text = check.check_number
-                if check.micr_number:
-                    et.SubElement(account_info, "MICRData").text = check.micr_number
-                if check.account_type:
-                    et.SubElement(account_info, "AccountType").text = (
-                        check.account_type.value
-                    )
-
-            if check.entry_mode:
-                et.SubElement(block1, "DataEntryMode").text = (
-                    check.entry_mode.value.upper()
-                )
-            if check.check_type:
-                et.SubElement(block1, "CheckType").text = check.check_type.value
-            if check.sec_code:
-                et.SubElement(block1, "SECCode").text = check.sec_code.value
-
-            # verify info
-            verify = et.SubElement(block1, "VerifyInfo")
-            et.SubElement(verify, "CheckVerify").text = (
-                "Y" if check.check_verify else "N"
-            )
-            et.SubElement(verify, "ACHVerify").text = "Y" if check.ach_verify else "N"
-
-        if isinstance(builder.payment_method, TransactionReference):
-            reference = builder.payment_method
-            et.SubElement(block1, "GatewayTxnId").text = reference.transaction_id
-            if reference.client_transaction_id:
-                et.SubElement(block1, "ClientTxnId").text = (
-                    reference.client_transaction_id
-                )
-
-        if isinstance(builder.payment_method, RecurringPaymentMethod):
-            method = builder.payment_method
-
-            # check action
-            if method.payment_type == "ACH":
-                et.SubElement(block1, "CheckAction").text = "SALE"
-                if builder.payment_method.sec_code is not None:
-                    et.SubElement(block1, "SECCode").text = (
-                        builder.payment_method.sec_code.value
-                    )
-
-            # payment method stuff
-            et.SubElement(block1, "PaymentMethodKey").text = method.key
-            if method.payment_method is not None and isinstance(
-                method.payment_method, CreditCardData
-            ):
-                card = method.payment_method
-                data = et.SubElement(block1, "PaymentMethodKeyData")
-                et.SubElement(data, "ExpMonth").text = str(card.exp_month)
-                et.SubElement(data, "ExpYear").text = str(card.exp_year)
-                et.SubElement(data, "CVV2").text = str(card.cvn)
-
-                # Add the credential on file logic
-                if self._should_include_credential_on_file(builder) and (
-                    hasattr(builder, "card_brand_transaction_id")
-                    and builder.card_brand_transaction_id
-                    or hasattr(builder, "transaction_initiator")
-                    and builder.transaction_initiator
-                ):
-                    block1.append(self._hydrate_credential_on_file(builder))
-
-            # recurring data
-            recurring = et.SubElement(block1, "RecurringData")
-            et.SubElement(recurring, "ScheduleID").text = builder.schedule_id
-            et.SubElement(recurring, "OneTime").text = (
-                "Y" if builder.one_time_payment else "N"
-            )
-
-        # pin block
-        if self._has_attr(builder.payment_method, "pin_block"):
-            if builder.transaction_type != TransactionType.Reversal:
-                et.SubElement(block1, "PinBlock").text = (
-                    builder.payment_method.pin_block
-                )
-
-        # encryption
-        if self._has_attr(builder.payment_method, "encryption_data"):
-            encryption_data = builder.payment_method.encryption_data
-
-            if encryption_data is not None:
-                enc = et.SubElement(card_data, "EncryptionData")
-                if encryption_data.version:
-                    et.SubElement(enc, "Version").text = encryption_data.version
-                if encryption_data.track_number:
-                    et.SubElement(enc, "EncryptedTrackNumber").text = (
-                        encryption_data.track_number
-                    )
-                if encryption_data.ktb:
-                    et.SubElement(enc, "KTB").text = encryption_data.ktb
-                if encryption_data.ktb:
-                    et.SubElement(enc, "KSN").text = encryption_data.ksn
-
-        # set token flag
-        if (
-            self._has_attr(builder.payment_method, "tokenizable")
-            and builder.payment_method.tokenizable
-        ):
-            et.SubElement(card_data, "TokenRequest").text = (
-                "Y" if builder.request_multi_use_token else "N"
-            )
+            writer.end(holder)
 
+    def _build_authorization_details(self, writer, builder):
         # balance inquiry type
         if self._has_attr(builder, "balance_inquiry_type"):
-            et.SubElement(block1, "BalanceInquiryType").text = (
-                builder.balance_inquiry_type.value
-            )
+            writer.element("BalanceInquiryType", builder.balance_inquiry_type.value)
 
         # cpc request
         if builder.level_2_request is not None:
-            et.SubElement(block1, "CPCReq").text = "Y"
+            writer.element("CPCReq", "Y")
 
         # details
         if (
@@ -1199,40 +1383,51 @@ class PorticoConnector(XmlGateway):
             or builder.description is not None
             or builder.invoice_number is not None
         ):
-            addons = et.SubElement(block1, "AdditionalTxnFields")
-            et.SubElement(addons, "CustomerID").text = builder.customer_id
-            et.SubElement(addons, "Description").text = builder.description
-            et.SubElement(addons, "InvoiceNbr").text = builder.invoice_number
+            writer.start("AdditionalTxnFields")
+            writer.element("CustomerID", builder.customer_id)
+            writer.element("Description", builder.description)
+            writer.element("InvoiceNbr", builder.invoice_number)
+            writer.end("AdditionalTxnFields")
 
         # ecommerce info
         if builder.ecommerce_info is not None:
-            et.SubElement(block1, "Ecommerce").text = (
-                builder.ecommerce_info.channel.value
-            )
+            writer.element("Ecommerce", builder.ecommerce_info.channel.value)
 
             if (
                 builder.invoice_number is not None
                 or builder.ecommerce_info.ship_month is not None
             ):
-                direct = et.SubElement(block1, "DirectMktData")
-                et.SubElement(direct, "DirectMktInvoiceNbr").text = (
-                    builder.invoice_number
-                )
-                et.SubElement(direct, "DirectMktShipDay").text = str(
-                    builder.ecommerce_info.ship_day
-                )
-                et.SubElement(direct, "DirectMktShipMonth").text = str(
-                    builder.ecommerce_info.ship_month
+                writer.start("DirectMktData")
+                writer.element("DirectMktInvoiceNbr", builder.invoice_number)
+                writer.element("DirectMktShipDay", str(builder.ecommerce_info.ship_day))
+                writer.element(
+                    "DirectMktShipMonth", str(builder.ecommerce_info.ship_month)
                 )
+                writer.end("DirectMktData")
 
         # dynamic descriptor
         if builder.dynamic_descriptor:
-            et.SubElement(block1, "TxnDescriptor").text = builder.dynamic_descriptor
-
-        response = self.do_transaction(
-            self._build_envelope(transaction, builder.client_transaction_id)
-        )
-        return self._map_response(response, builder.payment_method)
+            writer.element("TxnDescriptor", builder.dynamic_descriptor)
+
+    def _append_constant(self, writer, builder, name, build):
+        """
+        Writes elements built only from fields that a `TransactionTemplate`
+        holds constant. For builders created by a template, they are built
+        and serialized once per template and connector type.
+        """
+
+        template = builder.template
+        if template is None:
+            build(writer, builder)
+            return
+
+        key = (type(self), name)
+        fragment = template.fragments.get(key)
+        if fragment is None:
+            scratch = XmlWriter()
+            build(scratch, builder)
+            fragment = template.fragments.setdefault(key, scratch.getvalue())
+        writer.raw(fragment)
 
     def serialize_request(self, _builder):
         raise UnsupportedTransactionException(
@@ -1240,102 +1435,210 @@ class PorticoConnector(XmlGateway):
         )
 
     def manage_transaction(self, builder):
-        transaction = et.Element(self._map_transaction_type(builder))
+        response = self.do_transaction(self._build_management(builder), builder)
+        return self._map_management_response(response, builder)
 
-        if builder.transaction_type != TransactionType.BatchClose:
-            root = None
+    async def manage_transaction_async(self, builder):
+        response = await self.do_transaction_async(
+            self._build_management(builder), builder
+        )
+        return self._map_management_response(response, builder)
 
-            if (
+    def _build_management(self, builder):
+        name = self._map_transaction_type(builder)
+        writer = self._start_envelope(builder.client_transaction_id)
+        writer.start(name)
+
+        if builder.transaction_type != TransactionType.BatchClose:
+            block1 = (
                 builder.transaction_type == TransactionType.Reversal
                 or builder.transaction_type == TransactionType.Refund
                 or builder.payment_method.payment_method_type == PaymentMethodType.Gift
                 or builder.payment_method.payment_method_type == PaymentMethodType.ACH
-            ):
-                root = et.SubElement(transaction, "Block1")
-            else:
-                root = transaction
+            )
+            if block1:
+                writer.start("Block1")
 
             # amount
             if builder.amount is not None:
-                et.SubElement(root, "Amt").text = str(builder.amount)
+                writer.element("Amt", str(builder.amount))
 
             if builder.auth_amount is not None:
-                et.SubElement(root, "AuthAmt").text = str(builder.auth_amount)
+                writer.element("AuthAmt", str(builder.auth_amount))
 
             # gratuity
             if builder.gratuity is not None:
-                et.SubElement(root, "GratuityAmtInfo").text = str(builder.gratuity)
+                writer.element("GratuityAmtInfo", str(builder.gratuity))
 
             # transaction id
             if (
                 builder.transaction_type != TransactionType.TokenUpdate
                 and builder.transaction_type != TransactionType.TokenDelete
             ):
-                et.SubElement(root, "GatewayTxnId").text = builder.transaction_id
+                writer.element("GatewayTxnId", builder.transaction_id)
 
             # client transaction id
             if (
                 builder.transaction_type == TransactionType.Reversal
                 and builder.client_transaction_id
             ):
-                et.SubElement(root, "ClientTxnId").text = builder.client_transaction_id
+                writer.element("ClientTxnId", builder.client_transaction_id)
 
             # cpc data
             if (
                 builder.transaction_type == TransactionType.Edit
                 and builder.transaction_modifier == TransactionModifier.LevelII
             ):
-                cpc = et.SubElement(root, "CPCData")
+                writer.start("CPCData")
                 if builder.po_number:
-                    et.SubElement(cpc, "CardHolderPONbr").text = builder.po_number
+                    writer.element("CardHolderPONbr", builder.po_number)
                 if builder.tax_type:
-                    et.SubElement(cpc, "TaxType").text = builder.tax_type.value
+                    writer.element("TaxType", builder.tax_type.value)
                 if builder.tax_amount:
-                    et.SubElement(cpc, "TaxAmt").text = str(builder.tax_amount)
+                    writer.element("TaxAmt", str(builder.tax_amount))
+                writer.end("CPCData")
+
+            if block1:
+                writer.end("Block1")
 
         if builder.transaction_type == TransactionType.TokenUpdate:
-            et.SubElement(transaction, "TokenValue").text = builder.payment_method.token
+            writer.element("TokenValue", builder.payment_method.token)
+            writer.start("TokenActions")
+            writer.start("Set")
+            writer.start("Attribute")
+            writer.element("Name", "ExpMonth")
+            writer.element("Value", builder.payment_method.exp_month)
+            writer.end("Attribute")
+            writer.start("Attribute")
+            writer.element("Name", "ExpYear")
+            writer.element("Value", builder.payment_method.exp_year)
+            writer.end("Attribute")
+            writer.end("Set")
+            writer.end("TokenActions")
 
-            token_actions = et.SubElement(transaction, "TokenActions")
+        if builder.transaction_type == TransactionType.TokenDelete:
+            writer.element("TokenValue", builder.payment_method.token)
+            writer.start("TokenActions")
+            writer.element("Delete")
+            writer.end("TokenActions")
 
-            set = et.SubElement(token_actions, "Set")
+        writer.end(name)
+        return self._end_envelope(writer)
 
-            set_month_attribute = et.SubElement(set, "Attribute")
+    def _map_management_response(self, response, builder):
+        if (
+            builder.transaction_type == TransactionType.TokenUpdate
+            or builder.transaction_type == TransactionType.TokenDelete
+        ):
+            return True
 
-            et.SubElement(set_month_attribute, "Name").text = "ExpMonth"
+        return self._map_response(response, builder.payment_method)
 
-            et.SubElement(set_month_attribute, "Value").text = (
-                builder.payment_method.exp_month
+    def process_report(self, builder):
+        windows = self._get_report_windows(builder)
+        if windows is not None:
+            results = windows.run(
+                lambda window: self._process_report_window(builder, window)
             )
+            return self._merge_report_windows(results, builder.columnar)
 
-            set_year_attribute = et.SubElement(set, "Attribute")
-
-            et.SubElement(set_year_attribute, "Name").text = "ExpYear"
+        response = self.do_transaction(self._build_report(builder), builder)
+        return self._map_report_response(
+            response, builder.report_type, builder.columnar
+        )
 
-            et.SubElement(set_year_attribute, "Value").text = (
-                builder.payment_method.exp_year
+    async def process_report_async(self, builder):
+        windows = self._get_report_windows(builder)
+        if windows is not None:
+            results = await windows.run_async(
+                lambda window: self._process_report_window_async(builder, window)
             )
+            return self._merge_report_windows(results, builder.columnar)
 
-        if builder.transaction_type == TransactionType.TokenDelete:
-            et.SubElement(transaction, "TokenValue").text = builder.payment_method.token
-
-            token_actions = et.SubElement(transaction, "TokenActions")
-
-            et.SubElement(token_actions, "Delete")
-
-        response = self.do_transaction(
-            self._build_envelope(transaction, builder.client_transaction_id)
+        response = await self.do_transaction_async(self._build_report(builder), builder)
+        return self._map_report_response(
+            response, builder.report_type, builder.columnar
         )
 
+    @staticmethod
+    def _get_report_windows(builder):
         if (
-            builder.transaction_type == TransactionType.TokenUpdate
-            or builder.transaction_type == TransactionType.TokenDelete
+            not isinstance(builder, gp.api.builders.TransactionReportBuilder)
+            or builder.report_type != ReportType.Activity
+            or not builder.parallel_windows
+            or builder.start_date is None
+            or builder.end_date is None
         ):
-            return True
+            return None
 
-        return self._map_response(response, builder.payment_method)
+        return ReportWindows(
+            builder.start_date,
+            builder.end_date,
+            builder.parallel_windows,
+            builder.rows_per_window,
+        )
 
-    def process_report(self, builder):
+    @staticmethod
+    def _get_window_builder(builder, window):
+        window_builder = copy.copy(builder)
+        window_builder.start_date, window_builder.end_date = window
+        return window_builder
+
+    def _process_report_window(self, builder, window):
+        builder = self._get_window_builder(builder, window)
+        response = self.do_transaction(self._build_report(builder), builder)
+        return self._map_report_response(response, builder.report_type)
+
+    async def _process_report_window_async(self, builder, window):
+        builder = self._get_window_builder(builder, window)
+        response = await self.do_transaction_async(self._build_report(builder), builder)
+        return self._map_report_response(response, builder.report_type)
+
+    def _merge_report_windows(self, results, columnar):
+        rows = ReportWindows.merge(results)
+        if columnar:
+            return TransactionSummaryTable(rows)
+        return rows
+
+    def stream_report(self, builder):
+        item_name = _PORTICO_REPORT_ITEMS.get(builder.report_type)
+        if item_name is None:
+            raise UnsupportedTransactionException(
+                "Only Activity and FindTransactions reports can be streamed."
+            )
+
+        response = self.do_transaction_stream(self._build_report(builder), builder)
+        return self._stream_report_response(
+            response.stream,
+            self._map_report_type(builder.report_type),
+            item_name,
+            response.lane,
+        )
+
+    def _stream_report_response(self, response, report_name, item_name, lane=None):
+        exhausted = False
+        try:
+            chunks = response.stream(self.stream_chunk_size)
+            parsed = PorticoResponse()
+            checked = False
+            for item in iter_report_items(chunks, report_name, item_name, parsed):
+                if not checked:
+                    self._check_gateway_response(parsed)
+                    checked = True
+                yield self._hydrate_transaction_summary(item)
+            exhausted = True
+            if not checked:
+                self._check_gateway_response(parsed)
+        finally:
+            # a partly read body leaves the connection unusable
+            if not exhausted:
+                response.close()
+            response.release_conn()
+            # long downloads count against the bulkhead until they end
+            if lane is not None:
+                lane.release()
+
+    def _build_report(self, builder):
         transaction = et.Element(self._map_report_type(builder.report_type))
         if builder.timezone_conversion:
             et.SubElement(transaction, "TzConversion").text = (
@@ -1366,53 +1669,80 @@ class PorticoConnector(XmlGateway):
             if builder.transaction_id:
                 et.SubElement(transaction, "TxnId").text = builder.transaction_id
 
-        response = self.do_transaction(self._build_envelope(transaction))
-        return self._map_report_response(response, builder.report_type)
+        return self._build_envelope(transaction)
 
     def _build_envelope(self, transaction, client_transaction_id=None):
-        envelope = et.Element(
-            "soap:Envelope",
-            {
-                "xmlns:soap": "http://schemas.xmlsoap.org/soap/envelope/",
-            },
-        )
-        body = et.SubElement(envelope, "soap:Body")
-        request = et.SubElement(
-            body, "PosRequest", {"xmlns": "http://Hps.Exchange.PosGateway"}
-        )
-        version1 = et.SubElement(request, "Ver1.0")
-
-        # header
-        header = et.SubElement(version1, "Header")
-        if self.secret_api_key is not None:
-            et.SubElement(header, "SecretAPIKey").text = self.secret_api_key
-        if self.site_id is not None:
-            et.SubElement(header, "SiteId").text = str(self.site_id)
-        if self.license_id is not None:
-            et.SubElement(header, "LicenseId").text = str(self.license_id)
-        if self.device_id is not None:
-            et.SubElement(header, "DeviceId").text = str(self.device_id)
-        if self.username is not None:
-            et.SubElement(header, "UserName").text = str(self.username)
-        if self.password is not None:
-            et.SubElement(header, "Password").text = self.password
-        if self.developer_id is not None:
-            et.SubElement(header, "DeveloperID").text = str(self.developer_id)
-        if self.version_number is not None:
-            et.SubElement(header, "VersionNbr").text = str(self.version_number)
+        writer = self._start_envelope(client_transaction_id)
+        writer.tree(transaction)
+        return self._end_envelope(writer)
+
+    def _start_envelope(self, client_transaction_id=None):
+        """
+        Gets a writer holding the envelope up to the transaction element
+        """
+
+        head, tail = self._get_envelope_header()
+        writer = XmlWriter()
+        writer.raw(head)
         if client_transaction_id is not None:
-            et.SubElement(header, "ClientTxnId").text = str(client_transaction_id)
+            writer.element("ClientTxnId", client_transaction_id)
+        writer.raw(tail)
+        return writer
+
+    def _end_envelope(self, writer):
+        writer.raw(_PORTICO_ENVELOPE_CLOSE)
+        return writer.getvalue()
+
+    def _get_envelope_header(self):
+        """
+        Gets the serialized envelope up to and after the `ClientTxnId`
+        position of the header. The credentials are identical for every
+        request on a connector, so the bytes are rendered once and only
+        re-rendered when a credential changes.
+        """
+
+        credentials = (
+            self.secret_api_key,
+            self.site_id,
+            self.license_id,
+            self.device_id,
+            self.username,
+            self.password,
+            self.developer_id,
+            self.version_number,
+            self.sdkNameVersion,
+        )
+        cached = self._envelope_header
+        if cached is None or cached[0] != credentials:
+            cached = (credentials,) + self._render_envelope_header()
+            self._envelope_header = cached
+        return cached[1], cached[2]
+
+    def _render_envelope_header(self):
+        head = XmlWriter()
+        head.raw(_PORTICO_ENVELOPE_OPEN)
+        for tag, value in (
+            ("SecretAPIKey", self.secret_api_key),
+            ("SiteId", self.site_id),
+            ("LicenseId", self.license_id),
+            ("DeviceId", self.device_id),
+            ("UserName", self.username),
+            ("Password", self.password),
+            ("DeveloperID", self.developer_id),
+            ("VersionNbr", self.version_number),
+        ):
+            if value is not None:
+                head.element(tag, value)
+
+        tail = XmlWriter()
         if self.sdkNameVersion is not None:
-            et.SubElement(header, "SDKNameVersion").text = str(self.sdkNameVersion)
+            tail.element("SDKNameVersion", self.sdkNameVersion)
         else:
-            et.SubElement(header, "SDKNameVersion").text = str("python;version=") + str(
-                self._get_release_version()
+            tail.element(
+                "SDKNameVersion", "python;version=" + str(self._get_release_version())
             )
-
-        trans = et.SubElement(version1, "Transaction")
-        trans.append(transaction)
-
-        return et.tostring(envelope)
+        tail.raw("</Header><Transaction>")
+        return head.getvalue(), tail.getvalue()
 
     def _should_include_credential_on_file(self, builder):
 
@@ -1448,18 +1778,54 @@ class PorticoConnector(XmlGateway):
         return cof
 
     def _map_response(self, raw_response, payment_method):
+        response = PorticoResponse.parse(
+            raw_response, PORTICO_HEADER_SELECTOR, PORTICO_TRANSACTION_SELECTOR
+        )
+        header = response.header
+        gateway_rsp_code, gateway_rsp_text = self._check_gateway_response(response)
+
+        if self.lazy_responses:
+            return LazyTransaction(response, payment_method, self.response_fields)
+
         result = Transaction()
+        item = response.transaction
+
+        result.response_code = gateway_rsp_code
+        result.response_message = gateway_rsp_text
+        PORTICO_TRANSACTION_FIELDS.apply(result, item, self.response_fields)
+        PORTICO_HEADER_FIELDS.apply(result, header, self.response_fields)
+
+        if payment_method is not None:
+            result.transaction_reference = map_transaction_reference(
+                header, item, payment_method
+            )
+
+        # gift card create data
+        if "CardData" in item:
+            result.gift_card = map_gift_card(item)
+
+        # batch information
+        if "BatchId" in item:
+            result.batch_summary = map_batch_summary(item)
+
+        # debit mac
+        if "DebitMac" in item:
+            result.debit_mac = map_debit_mac(item)
+
+        return result
+
+    def _check_gateway_response(self, response):
+        """
+        Raises `GatewayException` unless the gateway accepted the request
+        and returned a `Transaction` element.
+
+        :param response: The parsed `PorticoResponse`
+        :return: Tuple of the normalized gateway response code and message
+        """
 
-        namespaces = {
-            "http://Hps.Exchange.PosGateway": None,
-            "http://schemas.xmlsoap.org/soap/envelope/": None,
-        }
-        root = xmltodict.parse(
-            raw_response, process_namespaces=True, namespaces=namespaces
-        )["Envelope"]["Body"]["PosResponse"]["Ver1.0"]
         accepted_codes = ["00", "0", "85", "10"]
 
-        header = root["Header"]
+        header = response.header
 
         #  check gateway response
         gateway_rsp_code = self._normalize_response(header["GatewayRspCode"])
@@ -1474,7 +1840,7 @@ class PorticoConnector(XmlGateway):
                 gateway_rsp_text,
             )
 
-        if "Transaction" not in root:
+        if not response.has_transaction:
             raise GatewayException(
                 "Unexpected Response: {} - {}".format(
                     gateway_rsp_code, gateway_rsp_text
@@ -1483,116 +1849,12 @@ class PorticoConnector(XmlGateway):
                 gateway_rsp_text,
             )
 
-        items = list(root["Transaction"].items())
-        item = items[0] if items[0] is not None else {}
-        item = item[1] if item[1] is not None else item
-
-        if "AuthAmt" in item:
-            result.authorized_amount = str(item["AuthAmt"])
-        if "AvailableBalance" in item:
-            result.available_balance = str(item["AvailableBalance"])
-        if "AVSRsltCode" in item:
-            result.avs_response_code = str(item["AVSRsltCode"])
-        if "AVSRsltText" in item:
-            result.avs_response_message = str(item["AVSRsltText"])
-        if "BalanceAmt" in item:
-            result.balance_amount = str(item["BalanceAmt"])
-        if "CardType" in item:
-            result.card_type = str(item["CardType"])
-        if "TokenPANLast4" in item:
-            result.card_last4 = str(item["TokenPANLast4"])
-        if "CAVVResultCode" in item:
-            result.cavv_response_code = str(item["CAVVResultCode"])
-        if "CPCInd" in item:
-            result.commercial_indicator = str(item["CPCInd"])
-        if "CVVRsltCode" in item:
-            result.cvn_response_code = str(item["CVVRsltCode"])
-        if "CVVRsltText" in item:
-            result.cvn_response_message = str(item["CVVRsltText"])
-        if "EMVIssuerResp" in item:
-            result.emv_issuer_response = str(item["EMVIssuerResp"])
-        if "PointsBalanceAmt" in item:
-            result.points_balance_amount = str(item["PointsBalanceAmt"])
-        if "RecurringDataCode" in item:
-            result.recurring_data_code = str(item["RecurringDataCode"])
-        if "RefNbr" in item:
-            result.reference_number = str(item["RefNbr"])
-        result.response_code = gateway_rsp_code
-        if "RspCode" in item:
-            result.response_code = self._normalize_response(str(item["RspCode"]))
-        result.response_message = gateway_rsp_text
-        if "RspText" in item:
-            result.response_message = str(item["RspText"])
-        elif "RspMessage" in item:
-            result.response_message = str(item["RspMessage"])
-        if "TxnDescriptor" in item:
-            result.transaction_descriptor = str(item["TxnDescriptor"])
-        if "HostRspDT" in item:
-            result.host_response_date = str(item["HostRspDT"])
-        if "CardBrandTxnId" in item:
-            result.card_brand_transaction_id = str(item["CardBrandTxnId"])
+        return gateway_rsp_code, gateway_rsp_text
 
-        if payment_method is not None:
-            result.transaction_reference = TransactionReference()
-            result.transaction_reference.payment_method_type = (
-                payment_method.payment_method_type
-            )
-            if "GatewayTxnId" in header:
-                result.transaction_reference.transaction_id = header["GatewayTxnId"]
-            if "AuthCode" in item:
-                result.transaction_reference.auth_code = item["AuthCode"]
-
-        # gift card create data
-        if "CardData" in item:
-            result.gift_card = GiftCard()
-            if "CardNbr" in item["CardData"]:
-                result.gift_card.number = item["CardData"]["CardNbr"]
-            if "Alias" in item["CardData"]:
-                result.gift_card.alias = item["CardData"]["Alias"]
-            if "PIN" in item["CardData"]:
-                result.gift_card.pin = item["CardData"]["PIN"]
-
-        # token data
-        if "TokenData" in header:
-            if "TokenValue" in header["TokenData"]:
-                result.token = header["TokenData"]["TokenValue"]
-
-        # batch information
-        if "BatchId" in item:
-            result.batch_summary = BatchSummary()
-            result.batch_summary.id = item["BatchId"]
-            if "TxnCnt" in item:
-                result.batch_summary.transaction_count = item["TxnCnt"]
-            if "TotalAmt" in item:
-                result.batch_summary.total_amount = item["TotalAmt"]
-            if "BatchSeqNbr" in item:
-                result.batch_summary.sequence_number = item["BatchSeqNbr"]
-
-        # debit mac
-        if "DebitMac" in item:
-            result.debit_mac = DebitMac()
-            if "TransactionCode" in item:
-                result.debit_mac.transaction_code = item["TransactionCode"]
-            if "TransmissionNumber" in item:
-                result.debit_mac.transmission_number = item["TransmissionNumber"]
-            if "BankResponseCode" in item:
-                result.debit_mac.bank_response_code = item["BankResponseCode"]
-            if "MacKey" in item:
-                result.debit_mac.mac_key = item["MacKey"]
-            if "PinKey" in item:
-                result.debit_mac.pin_key = item["PinKey"]
-            if "FieldKey" in item:
-                result.debit_mac.field_key = item["FieldKey"]
-            if "TraceNumber" in item:
-                result.debit_mac.trace_number = item["TraceNumber"]
-            if "MessageAuthenticationCode" in item:
-                result.debit_mac.message_authentication_code = item[
-                    "MessageAuthenticationCode"
-                ]
-
-        return result
+    def _map_report_response(self, raw_response, report_type, columnar=False):
+        if columnar and report_type in _PORTICO_REPORT_ITEMS:
+            return self._map_report_table(raw_response, report_type)
 
-    def _map_report_response(self, raw_response, report_type):
         namespaces = {
             "http://Hps.Exchange.PosGateway": None,
             "http://schemas.xmlsoap.org/soap/envelope/": None,
@@ -1603,172 +1865,60 @@ class PorticoConnector(XmlGateway):
         root = root["Envelope"]["Body"]["PosResponse"]["Ver1.0"]["Transaction"]
         doc = root[self._map_report_type(report_type)]
 
-        if report_type == ReportType.Activity and doc["Details"] is not None:
-            response = []
-
-            for value in doc["Details"]:
-                response.append(self._hydrate_transaction_summary(value))
-
-            return response
+        if report_type == ReportType.Activity:
+            details = doc.get("Details") if doc else None
+            if details is None:
+                details = []
+            elif isinstance(details, dict):
+                details = [details]
+            return self._hydrate_transaction_summaries(details)
 
         if report_type == ReportType.FindTransactions and len(doc) > 0:
-            response = []
-
             if isinstance(doc["Transactions"], dict):
+                return self._hydrate_transaction_summaries(list(doc.values()))
 
-                for key, value in list(doc.items()):
-                    response.append(self._hydrate_transaction_summary(value))
-
-                return response
-
-            for value in doc["Transactions"]:
-                response.append(self._hydrate_transaction_summary(value))
-
-            return response
+            return self._hydrate_transaction_summaries(doc["Transactions"])
 
         if report_type == ReportType.TransactionDetail:
             return self._hydrate_transaction_summary(doc)
 
         return None
 
+    def _map_report_table(self, raw_response, report_type):
+        """
+        Maps the rows of a report straight from the pull parser into a
+        `TransactionSummaryTable`, without building the whole response
+        tree first.
+        """
+
+        # fed in chunks, so only the rows of one chunk are parsed at a time
+        size = self.stream_chunk_size
+        chunks = (
+            raw_response[start : start + size]
+            for start in range(0, len(raw_response), size)
+        )
+
+        response = PorticoResponse()
+        table = TransactionSummaryTable()
+        for item in iter_report_items(
+            chunks,
+            self._map_report_type(report_type),
+            _PORTICO_REPORT_ITEMS[report_type],
+            response,
+        ):
+            table.append(
+                PORTICO_TRANSACTION_SUMMARY_FIELDS.apply(TransactionSummary(), item)
+            )
+        self._check_gateway_response(response)
+        return table
+
     @staticmethod
     def _normalize_response(original_response):
-        if original_response == "0" or original_response == "85":
-            return "00"
-        return original_response
+        return normalize_response_code(original_response)
 
     @staticmethod
     def _map_transaction_type(builder):
-        ret = None
-
-        if builder.transaction_type == TransactionType.BatchClose:
-            ret = "BatchClose"
-        elif builder.transaction_type == TransactionType.Decline:
-            if builder.transaction_modifier == TransactionModifier.ChipDecline:
-                ret = "ChipCardDecline"
-            elif builder.transaction_modifier == TransactionModifier.FraudDecline:
-                ret = "OverrideFraudDecline"
-        elif builder.transaction_type == TransactionType.Verify:
-            ret = "CreditAccountVerify"
-        elif builder.transaction_type == TransactionType.Capture:
-            ret = "CreditAddToBatch"
-        elif builder.transaction_type == TransactionType.Auth:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                if builder.transaction_modifier == TransactionModifier.Additional:
-                    ret = "CreditAdditionalAuth"
-                elif builder.transaction_modifier == TransactionModifier.Incremental:
-                    ret = "CreditIncrementalAuth"
-                elif builder.transaction_modifier == TransactionModifier.Offline:
-                    ret = "CreditOfflineAuth"
-                elif builder.transaction_modifier == TransactionModifier.Recurring:
-                    ret = "RecurringBillingAuth"
-                else:
-                    ret = "CreditAuth"
-            elif (
-                builder.payment_method.payment_method_type
-                == PaymentMethodType.Recurring
-            ):
-                ret = "RecurringBillingAuth"
-        elif builder.transaction_type == TransactionType.Sale:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                if builder.transaction_modifier == TransactionModifier.Offline:
-                    ret = "CreditOfflineSale"
-                elif builder.transaction_modifier == TransactionModifier.Recurring:
-                    ret = "RecurringBilling"
-                else:
-                    ret = "CreditSale"
-            elif (
-                builder.payment_method.payment_method_type
-                == PaymentMethodType.Recurring
-            ):
-                if builder.payment_method.payment_type == "ACH":
-                    ret = "CheckSale"
-                else:
-                    ret = "RecurringBilling"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Debit:
-                ret = "DebitSale"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Cash:
-                ret = "CashSale"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.ACH:
-                ret = "CheckSale"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.EBT:
-                if builder.transaction_modifier == TransactionModifier.CashBack:
-                    ret = "EBTCashBackPurchase"
-                elif builder.transaction_modifier == TransactionModifier.Voucher:
-                    ret = "EBTVoucherPurchase"
-                else:
-                    ret = "EBTFSPurchase"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Gift:
-                ret = "GiftCardSale"
-        elif builder.transaction_type == TransactionType.Refund:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                ret = "CreditReturn"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Debit:
-                if isinstance(builder.payment_method, TransactionReference):
-                    raise UnsupportedTransactionException()
-                ret = "DebitReturn"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Cash:
-                ret = "CashReturn"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.EBT:
-                if isinstance(builder.payment_method, TransactionReference):
-                    raise UnsupportedTransactionException()
-                ret = "EBTFSReturn"
-        elif builder.transaction_type == TransactionType.Reversal:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                ret = "CreditReversal"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Debit:
-                if isinstance(builder.payment_method, TransactionReference):
-                    raise UnsupportedTransactionException()
-                ret = "DebitReversal"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Gift:
-                ret = "GiftCardReversal"
-        elif builder.transaction_type == TransactionType.Edit:
-            if builder.transaction_modifier == TransactionModifier.LevelII:
-                ret = "CreditCPCEdit"
-            else:
-                ret = "CreditTxnEdit"
-        elif builder.transaction_type == TransactionType.Void:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                ret = "CreditVoid"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.ACH:
-                ret = "CheckVoid"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Gift:
-                ret = "GiftCardVoid"
-        elif builder.transaction_type == TransactionType.AddValue:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                ret = "PrePaidAddValue"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Debit:
-                ret = "DebitAddValue"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Gift:
-                ret = "GiftCardAddValue"
-        elif builder.transaction_type == TransactionType.Balance:
-            if builder.payment_method.payment_method_type == PaymentMethodType.Credit:
-                ret = "PrePaidBalanceInquiry"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.EBT:
-                ret = "EBTBalanceInquiry"
-            elif builder.payment_method.payment_method_type == PaymentMethodType.Gift:
-                ret = "GiftCardBalance"
-        elif builder.transaction_type == TransactionType.BenefitWithdrawal:
-            ret = "EBTCashBenefitWithdrawal"
-        elif builder.transaction_type == TransactionType.Activate:
-            ret = "GiftCardActivate"
-        elif builder.transaction_type == TransactionType.Alias:
-            ret = "GiftCardAlias"
-        elif builder.transaction_type == TransactionType.Deactivate:
-            ret = "GiftCardDeactivate"
-        elif builder.transaction_type == TransactionType.Replace:
-            ret = "GiftCardReplace"
-        elif builder.transaction_type == TransactionType.Reward:
-            ret = "GiftCardReward"
-        elif builder.transaction_type == TransactionType.TokenUpdate:
-            ret = "ManageTokens"
-        elif builder.transaction_type == TransactionType.TokenDelete:
-            ret = "ManageTokens"
-
-        if ret is None:
-            raise UnsupportedTransactionException()
-
-        return ret
+        return map_transaction_type(builder)
 
     @staticmethod
     def _map_report_type(report_type):
@@ -1787,83 +1937,17 @@ class PorticoConnector(XmlGateway):
 
         return False, None
 
-    def _hydrate_transaction_summary(self, item):
-        summary = TransactionSummary()
+    def _hydrate_transaction_summaries(self, items):
+        return [self._hydrate_transaction_summary(value) for value in items]
 
+    def _hydrate_transaction_summary(self, item):
         if item is None:
-            return summary
-
-        if "Amt" in item:
-            summary.amount = item["Amt"]
-
-        if "AuthAmt" in item:
-            summary.authorizated_amount = item["AuthAmt"]
-
-        if "AuthCode" in item:
-            summary.auth_code = item["AuthCode"]
+            return TransactionSummary()
 
-        if "ClientTxnId" in item:
-            summary.client_transaction_id = item["ClientTxnId"]
+        if self.lazy_responses:
+            return LazyTransactionSummary(item)
 
-        if "DeviceId" in item:
-            summary.device_id = item["DeviceId"]
-
-        if "RspCode" in item or "IssuerRspCode" in item:
-            summary.issuer_response_code = (
-                item["RspCode"] if "RspCode" in item else item["IssuerRspCode"]
-            )
-
-        if "RspText" in item or "IssuerRspText" in item:
-            summary.issuer_response_message = (
-                item["RspText"] if "RspText" in item else item["IssuerRspText"]
-            )
-
-        if "MaskedCardNbr" in item:
-            summary.masked_card_number = item["MaskedCardNbr"]
-
-        if "OriginalGatewayTxnId" in item:
-            summary.original_transaction_id = item["OriginalGatewayTxnId"]
-
-        if "GatewayRspCode" in item:
-            summary.gateway_response_code = self._normalize_response(
-                item["GatewayRspCode"]
-            )
-
-        if "GatewayResponseMsg" in item:
-            summary.gateway_response_message = item["GatewayResponseMsg"]
-
-        if "RefNbr" in item:
-            summary.reference_number = item["RefNbr"]
-
-        if "ServiceName" in item:
-            summary.service_name = item["ServiceName"]
-
-        if "SettlementAmt" in item:
-            summary.settlement_amount = item["SettlementAmt"]
-
-        if "TxnStatus" in item or "Status" in item:
-            summary.status = (
-                item["TxnStatus"] if "TxnStatus" in item else item["Status"]
-            )
-        elif "Data" in item:
-            if "TxnStatus" in item["Data"]:
-                summary.status = item["Data"]["TxnStatus"]
-
-        if "TxnUtcDT" in item or "ReqUtcDT" in item:
-            summary.transaction_date = (
-                item["TxnUtcDT"] if "TxnUtcDT" in item else item["ReqUtcDT"]
-            )
-
-        if "GatewayTxnId" in item:
-            summary.transaction_id = item["GatewayTxnId"]
-
-        if "ConvenienceAmtInfo" in item:
-            summary.convenience_amount = item["ConvenienceAmtInfo"]
-
-        if "ShippingAmtInfo" in item:
-            summary.shipping_amount = item["ShippingAmtInfo"]
-
-        return summary
+        return PORTICO_TRANSACTION_SUMMARY_FIELDS.apply(TransactionSummary(), item)
 
     def _has_attr(self, obj, attr):
         if not obj:
@@ -1875,9 +1959,7 @@ class PorticoConnector(XmlGateway):
             return False
 
     def _get_release_version(self):
-        if "site-packages" in __file__:
-            return version("GlobalPayments.Api")
-        return "0.0.0"
+        return _get_release_version()
 
 
 class RealexConnector(XmlGateway):
@@ -1902,6 +1984,20 @@ class RealexConnector(XmlGateway):
         return True
 
     def process_authorization(self, builder):
+        request = self._build_authorization(builder)
+        response = self.do_transaction(tostring(request), builder)
+        return self._map_response(
+            response, self._map_accepted_codes(request.get("type"))
+        )
+
+    async def process_authorization_async(self, builder):
+        request = self._build_authorization(builder)
+        response = await self.do_transaction_async(tostring(request), builder)
+        return self._map_response(
+            response, self._map_accepted_codes(request.get("type"))
+        )
+
+    def _build_authorization(self, builder):
         timestamp = (
             builder.timestamp
             if builder.timestamp
@@ -2072,8 +2168,7 @@ class RealexConnector(XmlGateway):
 
         # et.SubElement(request, 'mobile')
         # et.SubElement(request, 'token').text = token
-        response = self.do_transaction(et.tostring(request))
-        return self._map_response(response, self._map_accepted_codes(request_type))
+        return request
 
     def serialize_request(self, builder):
         if self.hosted_payment_config is None:
@@ -2232,6 +2327,20 @@ class RealexConnector(XmlGateway):
         return jsonpickle.encode(request)
 
     def manage_transaction(self, builder):
+        request = self._build_management(builder)
+        response = self.do_transaction(tostring(request), builder)
+        return self._map_response(
+            response, self._map_accepted_codes(request.get("type"))
+        )
+
+    async def manage_transaction_async(self, builder):
+        request = self._build_management(builder)
+        response = await self.do_transaction_async(tostring(request), builder)
+        return self._map_response(
+            response, self._map_accepted_codes(request.get("type"))
+        )
+
+    def _build_management(self, builder):
         timestamp = GenerationUtils.generate_timestamp()
         order_id = (
             builder.order_id
@@ -2296,15 +2405,32 @@ class RealexConnector(XmlGateway):
             self.shared_secret, to_hash
         )
 
-        response = self.do_transaction(et.tostring(request))
-        return self._map_response(response, self._map_accepted_codes(request_type))
+        return request
 
     def process_report(self, _builder):
         raise UnsupportedTransactionException(
             "Reporting functionality is not supported through this gateway."
         )
 
+    async def process_report_async(self, builder):
+        return self.process_report(builder)
+
+    def stream_report(self, builder):
+        return self.process_report(builder)
+
     def process_recurring(self, builder):
+        response = self.do_transaction(
+            tostring(self._build_recurring(builder)), builder
+        )
+        return self._map_recurring_response(response, builder)
+
+    async def process_recurring_async(self, builder):
+        response = await self.do_transaction_async(
+            tostring(self._build_recurring(builder)), builder
+        )
+        return self._map_recurring_response(response, builder)
+
+    def _build_recurring(self, builder):
         timestamp = GenerationUtils.generate_timestamp()
         order_id = (
             builder.order_id
@@ -2404,8 +2530,7 @@ class RealexConnector(XmlGateway):
                     self.shared_secret, to_hash
                 )
 
-        response = self.do_transaction(et.tostring(request))
-        return self._map_recurring_response(response, builder)
+        return request
 
     def format_amount(self, amount):
         return int(float(amount) * 100)
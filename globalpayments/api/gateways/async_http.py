@@ -0,0 +1,388 @@
+"""
+Pooled HTTP/1.1 transport for the asyncio execution path
+"""
+
+import asyncio
+import gzip
+import ssl
+import weakref
+import zlib
+from collections import deque
+from urllib.parse import urlsplit
+
+import certifi
+
+from globalpayments.api.gateways.gateway_response import GatewayResponse
+
+
+class ConnectTimeoutError(asyncio.TimeoutError):
+    """
+    Opening a connection timed out; no request data was sent
+    """
+
+
+class ConnectError(ConnectionError):
+    """
+    A connection could not be opened; no request data was sent
+    """
+
+
+class ResponseInterruptedError(ConnectionError):
+    """
+    The connection broke after part of the response was read. The server
+    received the request, so it must not be sent again.
+    """
+
+
+class AsyncConnection(object):
+    """
+    A single keep-alive connection owned by an `AsyncHttpClient`
+    """
+
+    reader = None
+    writer = None
+    reused = False
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def is_closing(self):
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self):
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+class AsyncHostPool(object):
+    """
+    Idle connections and the concurrency limit for one scheme/host/port
+    """
+
+    idle = None
+    limit = None
+
+    def __init__(self, max_connections):
+        self.idle = deque()
+        self.limit = asyncio.Semaphore(max_connections)
+
+    def acquire_idle(self):
+        while self.idle:
+            connection = self.idle.pop()
+            if not connection.is_closing:
+                connection.reused = True
+                return connection
+            connection.close()
+        return None
+
+    def close(self):
+        while self.idle:
+            self.idle.pop().close()
+
+
+class AsyncHttpClient(object):
+    """
+    Minimal HTTP/1.1 client built on asyncio streams.
+
+    Connections are kept alive and reused between requests. Pools are
+    tracked per event loop, since asyncio streams cannot be shared
+    across loops.
+    """
+
+    max_connections_per_host = None
+    ca_certs = None
+
+    def __init__(self, max_connections_per_host=100, ca_certs=None):
+        self.max_connections_per_host = max_connections_per_host
+        self.ca_certs = ca_certs or certifi.where()
+        self._ssl_context = None
+        self._pools = weakref.WeakKeyDictionary()
+        self._closed = False
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        connect_timeout=None,
+        tls_timeout=None,
+        read_timeout=None,
+        total_timeout=None,
+    ):
+        """
+        Sends a request and reads the full response body.
+
+        :param method: HTTP verb
+        :param url: Absolute request URL
+        :param headers: Request headers
+        :param body: Request body as `str` or `bytes`
+        :param connect_timeout: Seconds allowed for the TCP connection
+        :param tls_timeout: Seconds allowed for the TLS handshake
+        :param read_timeout: Seconds allowed to send the request and read
+            the response
+        :param total_timeout: Seconds allowed for the whole exchange
+        :return: GatewayResponse
+        """
+
+        exchange = self._request(
+            method, url, headers, body, connect_timeout, tls_timeout, read_timeout
+        )
+        if total_timeout is None:
+            return await exchange
+        return await asyncio.wait_for(exchange, total_timeout)
+
+    def close(self):
+        """
+        Closes all idle connections owned by the current event loop
+        """
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        pools = self._pools.pop(loop, {})
+        for pool in list(pools.values()):
+            pool.close()
+
+    def close_all(self):
+        """
+        Closes idle connections owned by every event loop and stops
+        keeping connections alive once their requests finish. Loops other
+        than the running one close their connections on their own thread.
+        """
+
+        self._closed = True
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        for loop in list(self._pools.keys()):
+            pools = self._pools.pop(loop, {})
+            for pool in list(pools.values()):
+                if loop is running:
+                    pool.close()
+                elif not loop.is_closed():
+                    loop.call_soon_threadsafe(pool.close)
+
+    async def _request(
+        self, method, url, headers, body, connect_timeout, tls_timeout, read_timeout
+    ):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        pool = self._get_pool((scheme, host, port))
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        payload = self._build_request(method, parts, headers, body)
+
+        async with pool.limit:
+            connection = pool.acquire_idle()
+
+            while True:
+                if connection is None:
+                    connection = await self._open(
+                        scheme, host, port, connect_timeout, tls_timeout
+                    )
+
+                try:
+                    status, response_headers, raw, keep_alive = (
+                        await self._with_timeout(
+                            self._exchange(connection, payload, method), read_timeout
+                        )
+                    )
+                except ResponseInterruptedError:
+                    connection.close()
+                    raise
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    connection.close()
+                    # a pooled connection may have been closed by the server
+                    # while idle; nothing came back, so the request is
+                    # replayed once on a new one
+                    if connection.reused:
+                        connection = None
+                        continue
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                break
+
+            if keep_alive and not self._closed:
+                connection.reused = False
+                pool.idle.append(connection)
+            else:
+                connection.close()
+
+        response = GatewayResponse()
+        response.status_code = status
+        response.raw_response = self._decode_content(response_headers, raw)
+        return response
+
+    async def _exchange(self, connection, payload, method):
+        connection.writer.write(payload)
+        await connection.writer.drain()
+
+        status_line = await connection.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed before response")
+        try:
+            return await self._read_response(connection.reader, status_line, method)
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            raise ResponseInterruptedError(
+                "Connection closed while reading response"
+            ) from exc
+
+    def _get_pool(self, key):
+        loop = asyncio.get_running_loop()
+        pools = self._pools.get(loop)
+        if pools is None:
+            pools = {}
+            self._pools[loop] = pools
+
+        pool = pools.get(key)
+        if pool is None:
+            pool = AsyncHostPool(self.max_connections_per_host)
+            pools[key] = pool
+        return pool
+
+    async def _open(self, scheme, host, port, connect_timeout, tls_timeout):
+        try:
+            return await self._connect(scheme, host, port, connect_timeout, tls_timeout)
+        except asyncio.TimeoutError as exc:
+            raise ConnectTimeoutError(
+                "Timed out connecting to {}:{}".format(host, port)
+            ) from exc
+        except OSError as exc:
+            # refused connections, DNS and TLS handshake failures
+            raise ConnectError("Failed to connect to {}:{}".format(host, port)) from exc
+
+    async def _connect(self, scheme, host, port, connect_timeout, tls_timeout):
+        if scheme != "https":
+            reader, writer = await self._with_timeout(
+                asyncio.open_connection(host, port), connect_timeout
+            )
+            return AsyncConnection(reader, writer)
+
+        budget = connect_timeout
+        if connect_timeout is not None and tls_timeout is not None:
+            budget = connect_timeout + tls_timeout
+
+        reader, writer = await self._with_timeout(
+            asyncio.open_connection(
+                host,
+                port,
+                ssl=self._get_ssl_context(),
+                server_hostname=host,
+                ssl_handshake_timeout=tls_timeout,
+            ),
+            budget,
+        )
+        return AsyncConnection(reader, writer)
+
+    @staticmethod
+    async def _with_timeout(awaitable, timeout):
+        if timeout is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, timeout)
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            context = ssl.create_default_context(cafile=self.ca_certs)
+            context.set_alpn_protocols(["http/1.1"])
+            self._ssl_context = context
+        return self._ssl_context
+
+    @staticmethod
+    def _build_request(method, parts, headers, body):
+        target = parts.path or "/"
+        if parts.query:
+            target = "{}?{}".format(target, parts.query)
+
+        host = parts.hostname
+        if parts.port is not None:
+            host = "{}:{}".format(host, parts.port)
+
+        lines = [
+            "{} {} HTTP/1.1".format(method, target),
+            "Host: {}".format(host),
+            "Connection: keep-alive",
+        ]
+        for key in headers or {}:
+            lines.append("{}: {}".format(key, headers[key]))
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            lines.append("Content-Length: {}".format(len(body or b"")))
+
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head + body if body else head
+
+    @staticmethod
+    async def _read_response(reader, status_line, method):
+        if not status_line.endswith(b"\n"):
+            raise asyncio.IncompleteReadError(status_line, None)
+
+        version, status, _reason = (
+            status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""]
+        )[:3]
+        status = int(status)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            name, _sep, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection_header = headers.get("connection", "").lower()
+        keep_alive = (
+            connection_header != "close"
+            if version == "HTTP/1.1"
+            else connection_header == "keep-alive"
+        )
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return status, headers, b"", keep_alive
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                if not size_line:
+                    raise asyncio.IncompleteReadError(b"", None)
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    # trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            return status, headers, b"".join(chunks), keep_alive
+
+        if "content-length" in headers:
+            raw = await reader.readexactly(int(headers["content-length"]))
+            return status, headers, raw, keep_alive
+
+        return status, headers, await reader.read(), False
+
+    @staticmethod
+    def _decode_content(headers, raw):
+        encoding = headers.get("content-encoding", "").lower()
+        if encoding == "gzip":
+            return gzip.decompress(raw)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(raw)
+            except zlib.error:
+                return zlib.decompress(raw, -zlib.MAX_WBITS)
+        return raw
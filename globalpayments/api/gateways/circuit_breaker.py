@@ -0,0 +1,215 @@
+"""
+Circuit breakers tracking the health of gateway endpoints
+"""
+
+import threading
+import time
+from collections import deque
+
+from globalpayments.api.entities.enums import CircuitBreakerState
+from globalpayments.api.entities.exceptions import CircuitBreakerOpenException
+
+
+class CircuitBreaker(object):
+    """
+    Tracks the outcome of recent requests to one endpoint.
+
+    The breaker opens when the share of failed or slow calls in the last
+    `window_size` calls crosses its threshold. While open, requests fail
+    fast with `CircuitBreakerOpenException`. After `open_duration` it lets
+    `half_open_max_calls` trial requests through, closing again when all
+    of them succeed and reopening on the first failure.
+    """
+
+    #  Endpoint guarded by the breaker
+    service_url = None
+    #  Share of failed calls that opens the breaker
+    failure_rate_threshold = None
+    #  Calls slower than this count as slow (in milliseconds)
+    slow_call_duration = None
+    #  Share of slow calls that opens the breaker
+    slow_call_rate_threshold = None
+    #  Number of recent calls considered
+    window_size = None
+    #  Calls required in the window before rates are evaluated
+    minimum_calls = None
+    #  Time the breaker stays open before probing (in milliseconds)
+    open_duration = None
+    #  Trial calls allowed while half-open
+    half_open_max_calls = None
+
+    def __init__(
+        self,
+        service_url=None,
+        failure_rate_threshold=0.5,
+        slow_call_duration=None,
+        slow_call_rate_threshold=0.8,
+        window_size=50,
+        minimum_calls=10,
+        open_duration=30000,
+        half_open_max_calls=3,
+    ):
+        self.service_url = service_url
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CircuitBreakerState.Closed
+        self._calls = deque(maxlen=window_size)
+        self._opened_at = None
+        self._trial_calls = 0
+        self._trial_successes = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def acquire(self):
+        """
+        Reserves permission to send a request.
+
+        :raises CircuitBreakerOpenException: when the breaker is open or
+            all half-open trial calls are taken
+        """
+
+        with self._lock:
+            self._refresh()
+            if self._state == CircuitBreakerState.Closed:
+                return
+            if (
+                self._state == CircuitBreakerState.HalfOpen
+                and self._trial_calls < self.half_open_max_calls
+            ):
+                self._trial_calls += 1
+                return
+
+        raise CircuitBreakerOpenException(
+            "Circuit breaker is open for {}.".format(self.service_url),
+            self.service_url,
+        )
+
+    def release(self):
+        """
+        Returns a permission without recording an outcome, e.g. when the
+        caller cancelled the request
+        """
+
+        with self._lock:
+            if self._state == CircuitBreakerState.HalfOpen and self._trial_calls:
+                self._trial_calls -= 1
+
+    def record_success(self, duration):
+        """
+        Records a completed request.
+
+        :param duration: Time taken by the request (in seconds)
+        """
+
+        slow = (
+            self.slow_call_duration is not None
+            and duration * 1000 > self.slow_call_duration
+        )
+        self._record(True, slow)
+
+    def record_failure(self, duration):
+        """
+        Records a failed request.
+
+        :param duration: Time taken by the request (in seconds)
+        """
+
+        self._record(False, False)
+
+    def _record(self, success, slow):
+        with self._lock:
+            if self._state == CircuitBreakerState.HalfOpen:
+                if not success or slow:
+                    self._open()
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_max_calls:
+                    self._state = CircuitBreakerState.Closed
+                    self._calls.clear()
+                return
+
+            if self._state == CircuitBreakerState.Open:
+                return
+
+            self._calls.append((success, slow))
+            if len(self._calls) < self.minimum_calls:
+                return
+
+            failures = sum(1 for call in self._calls if not call[0])
+            slow_calls = sum(1 for call in self._calls if call[1])
+            if (
+                failures / len(self._calls) >= self.failure_rate_threshold
+                or slow_calls / len(self._calls) >= self.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def _open(self):
+        self._state = CircuitBreakerState.Open
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+
+    def _refresh(self):
+        if (
+            self._state == CircuitBreakerState.Open
+            and time.monotonic() - self._opened_at >= self.open_duration / 1000.0
+        ):
+            self._state = CircuitBreakerState.HalfOpen
+            self._trial_calls = 0
+            self._trial_successes = 0
+
+
+class CircuitBreakerRegistry(object):
+    """
+    Circuit breakers keyed by endpoint URL.
+
+    Connectors pointing at the same endpoint share a breaker when they
+    share a registry, so every configuration sees the same health.
+    """
+
+    #  Callable creating a breaker for a service URL
+    factory = None
+
+    def __init__(self, factory=None):
+        self.factory = factory or CircuitBreaker
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_url):
+        """
+        Gets the breaker for an endpoint, creating it when needed.
+
+        :param service_url: The endpoint URL
+        :return: CircuitBreaker
+        """
+
+        breaker = self._breakers.get(service_url)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(service_url)
+                if breaker is None:
+                    breaker = self.factory(service_url)
+                    self._breakers[service_url] = breaker
+        return breaker
+
+    def states(self):
+        """
+        Gets the state of every tracked endpoint.
+
+        :return: dict of service URL to CircuitBreakerState
+        """
+
+        return {url: breaker.state for url, breaker in list(self._breakers.items())}
+
+
+CIRCUIT_BREAKERS = CircuitBreakerRegistry()
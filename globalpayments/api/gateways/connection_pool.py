@@ -0,0 +1,215 @@
+"""
+Connection pools owned by a gateway configuration
+"""
+
+import os
+import socket
+import threading
+import time
+import weakref
+
+import certifi
+import urllib3
+from urllib3.connection import HTTPConnection
+
+from globalpayments.api.gateways.async_http import AsyncHttpClient
+
+
+class _IdleEvictionMixin(object):
+    """
+    Closes pooled connections that sat idle longer than `idle_timeout`
+    before handing them out again.
+    """
+
+    idle_timeout = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        released_at = getattr(conn, "_released_at", None)
+        if (
+            self.idle_timeout is not None
+            and released_at is not None
+            and time.monotonic() - released_at > self.idle_timeout
+        ):
+            # urllib3 reconnects closed connections on their next use
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._released_at = time.monotonic()
+        super()._put_conn(conn)
+
+
+class IdleEvictingHTTPConnectionPool(_IdleEvictionMixin, urllib3.HTTPConnectionPool):
+    pass
+
+
+class IdleEvictingHTTPSConnectionPool(_IdleEvictionMixin, urllib3.HTTPSConnectionPool):
+    pass
+
+
+class _PoolManager(urllib3.PoolManager):
+    idle_timeout = None
+
+    def __init__(self, idle_timeout=None, **kwargs):
+        urllib3.PoolManager.__init__(self, **kwargs)
+        self.idle_timeout = idle_timeout
+        self.pool_classes_by_scheme = {
+            "http": IdleEvictingHTTPConnectionPool,
+            "https": IdleEvictingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = urllib3.PoolManager._new_pool(self, scheme, host, port, request_context)
+        pool.idle_timeout = self.idle_timeout
+        return pool
+
+
+class ConnectionPool(object):
+    """
+    HTTP connection pools for one `ServicesContainer` configuration.
+
+    Holds the urllib3 pool used by the sync transport and the
+    `AsyncHttpClient` used by the `*_async` methods. Pools are rebuilt in
+    child processes after `os.fork()` so prefork workers never share
+    sockets with their parent; thread pools registered with
+    `register_after_fork` are replaced at the same time.
+    """
+
+    #  Maximum number of connections kept per gateway host
+    max_connections = None
+    #  Wait for a free connection when all are in use instead of
+    #  opening a temporary, unpooled one
+    block = None
+    #  Close pooled connections left idle longer than this (in milliseconds)
+    idle_timeout = None
+    #  Enable TCP keep-alive probes on pooled connections
+    tcp_keep_alive = None
+
+    def __init__(
+        self, max_connections=10, block=False, idle_timeout=None, tcp_keep_alive=True
+    ):
+        self.max_connections = max_connections
+        self.block = block
+        self.idle_timeout = idle_timeout
+        self.tcp_keep_alive = tcp_keep_alive
+        self._manager = None
+        self._async_client = None
+        self._lock = threading.Lock()
+        _POOLS.add(self)
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request through the sync pool.
+        Accepts the same keyword arguments as `urllib3.PoolManager.request`.
+        """
+
+        return self.manager.request(method, url, **kwargs)
+
+    async def request_async(self, method, url, **kwargs):
+        """
+        Sends a request through the async pool.
+        Accepts the same keyword arguments as `AsyncHttpClient.request`.
+        """
+
+        return await self.async_client.request(method, url, **kwargs)
+
+    @property
+    def manager(self):
+        manager = self._manager
+        if manager is None:
+            with self._lock:
+                manager = self._manager
+                if manager is None:
+                    manager = self._create_manager()
+                    self._manager = manager
+        return manager
+
+    @property
+    def async_client(self):
+        client = self._async_client
+        if client is None:
+            with self._lock:
+                client = self._async_client
+                if client is None:
+                    client = AsyncHttpClient(
+                        max_connections_per_host=self.max_connections,
+                        ca_certs=certifi.where(),
+                    )
+                    self._async_client = client
+        return client
+
+    def clear(self):
+        """
+        Closes all idle connections held by the sync pool
+        """
+
+        if self._manager is not None:
+            self._manager.clear()
+
+    def close(self):
+        """
+        Closes all idle connections, sync and async, once the pool is no
+        longer used. Connections still in use are closed when released.
+        """
+
+        self.clear()
+        if self._async_client is not None:
+            self._async_client.close_all()
+        _POOLS.discard(self)
+
+    def _reinitialize(self):
+        # the inherited sockets belong to the parent process; drop them
+        # without closing so the parent's connections stay usable
+        self._manager = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    def _create_manager(self):
+        idle_timeout = self.idle_timeout
+        if idle_timeout is not None:
+            idle_timeout = idle_timeout / 1000.0
+        return _PoolManager(
+            idle_timeout=idle_timeout,
+            maxsize=self.max_connections,
+            block=self.block,
+            socket_options=self._get_socket_options(),
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where(),
+        )
+
+    def _get_socket_options(self):
+        options = list(HTTPConnection.default_socket_options)
+        if self.tcp_keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        return options
+
+
+_POOLS = weakref.WeakSet()
+#  Objects whose `_after_fork` is called in child processes
+_AFTER_FORK = weakref.WeakSet()
+
+
+def register_after_fork(owner):
+    """
+    Registers an object holding thread pools, whose worker threads do not
+    survive `os.fork()`. Its `_after_fork` method is called in child
+    processes, alongside the connection pools being rebuilt, and replaces
+    them.
+
+    :param owner: The object
+    """
+
+    _AFTER_FORK.add(owner)
+
+
+def _reinitialize_pools():
+    for pool in list(_POOLS):
+        pool._reinitialize()
+    for owner in list(_AFTER_FORK):
+        owner._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinitialize_pools)
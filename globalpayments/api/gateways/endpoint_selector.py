@@ -0,0 +1,170 @@
+"""
+Endpoint ranking and hedging for connectors with several service URLs
+"""
+
+import threading
+import time
+from collections import deque
+
+import globalpayments as gp
+from globalpayments.api.entities.enums import ReportType, TransactionType
+
+#  Read-only calls that may be duplicated by a hedged request
+HEDGED_REPORT_TYPES = (
+    ReportType.TransactionDetail,
+    ReportType.Activity,
+    ReportType.FindTransactions,
+)
+HEDGED_TRANSACTION_TYPES = (TransactionType.Fetch, TransactionType.Search)
+
+
+class EndpointStats(object):
+    """
+    Observed latency and error rate of one endpoint
+    """
+
+    #  Exponentially weighted latency of successful calls (in seconds)
+    latency = None
+    #  Exponentially weighted share of failed calls
+    error_rate = 0.0
+    #  When `error_rate` was last updated (`time.monotonic()`)
+    updated_at = None
+
+    def __init__(self, sample_size):
+        self.samples = deque(maxlen=sample_size)
+
+
+class EndpointSelector(object):
+    """
+    Ranks an ordered list of service URLs by observed health.
+
+    Healthy endpoints come before unhealthy ones. Among them, endpoints
+    with a known latency are preferred by latency penalised by error rate,
+    then the rest follow in configured order. Error rates decay over time
+    so an endpoint that failed over is tried again once it may have
+    recovered. Endpoints already tried by a call are ranked last.
+    """
+
+    #  Configured service URLs, in order of preference
+    service_urls = None
+    #  Weight of the most recent observation in the moving averages
+    smoothing = None
+    #  Multiplier applied to the error rate when scoring endpoints
+    error_penalty = None
+    #  Error rate above which an endpoint is considered unhealthy
+    unhealthy_error_rate = None
+    #  Time for an error rate to halve without new calls (in seconds)
+    recovery_half_life = None
+    #  Observations needed before the p95 latency is used for hedging
+    minimum_samples = None
+
+    def __init__(
+        self,
+        service_urls,
+        smoothing=0.2,
+        error_penalty=10,
+        unhealthy_error_rate=0.5,
+        recovery_half_life=30,
+        sample_size=200,
+        minimum_samples=20,
+    ):
+        self.service_urls = list(service_urls)
+        self.smoothing = smoothing
+        self.error_penalty = error_penalty
+        self.unhealthy_error_rate = unhealthy_error_rate
+        self.recovery_half_life = recovery_half_life
+        self.minimum_samples = minimum_samples
+        self._stats = {url: EndpointStats(sample_size) for url in self.service_urls}
+        self._lock = threading.Lock()
+
+    def rank(self, tried=None):
+        """
+        Orders the endpoints from most to least preferred.
+
+        :param tried: Endpoints already attempted by the current call
+        :return: list of service URLs
+        """
+
+        tried = tried or ()
+        now = time.monotonic()
+        keys = {}
+        with self._lock:
+            for index, url in enumerate(self.service_urls):
+                stats = self._stats[url]
+                error_rate = self._get_error_rate(stats, now)
+                keys[url] = (
+                    url in tried,
+                    error_rate >= self.unhealthy_error_rate,
+                    stats.latency is None,
+                    (stats.latency or 0) * (1 + self.error_penalty * error_rate),
+                    index,
+                )
+        return sorted(self.service_urls, key=keys.__getitem__)
+
+    def record(self, service_url, duration, success):
+        """
+        Records the outcome of a call.
+
+        :param service_url: The endpoint called
+        :param duration: Time taken by the call (in seconds)
+        :param success: Denotes if the endpoint answered successfully
+        """
+
+        stats = self._stats.get(service_url)
+        if stats is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            stats.error_rate = self._get_error_rate(stats, now)
+            stats.error_rate += self.smoothing * (
+                (0.0 if success else 1.0) - stats.error_rate
+            )
+            stats.updated_at = now
+            if success:
+                if stats.latency is None:
+                    stats.latency = duration
+                else:
+                    stats.latency += self.smoothing * (duration - stats.latency)
+                stats.samples.append(duration)
+
+    def hedge_delay(self, service_url):
+        """
+        Gets how long to wait before hedging a call to an endpoint.
+
+        :param service_url: The endpoint called first
+        :return: p95 latency in seconds, or None without enough samples
+        """
+
+        stats = self._stats.get(service_url)
+        if stats is None:
+            return None
+
+        with self._lock:
+            samples = sorted(stats.samples)
+        if len(samples) < self.minimum_samples:
+            return None
+        return samples[int(0.95 * (len(samples) - 1))]
+
+    def _get_error_rate(self, stats, now):
+        if stats.updated_at is None or not stats.error_rate:
+            return stats.error_rate
+        elapsed = now - stats.updated_at
+        return stats.error_rate * 0.5 ** (elapsed / self.recovery_half_life)
+
+    @staticmethod
+    def is_hedgeable(builder):
+        """
+        Determines if a call is read-only and may be sent twice.
+
+        :param builder: Builder of the call
+        :return: bool
+        """
+
+        if builder is None:
+            return False
+        if isinstance(builder, gp.api.builders.ReportBuilder):
+            return builder.report_type in HEDGED_REPORT_TYPES
+        if isinstance(builder, gp.api.builders.TransactionBuilder):
+            return builder.transaction_type in HEDGED_TRANSACTION_TYPES
+        return False
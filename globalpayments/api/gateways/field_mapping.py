@@ -0,0 +1,170 @@
+"""
+Declarative tables mapping gateway response fields onto entities
+"""
+
+from globalpayments.api.entities.exceptions import ApiException
+
+#  Marks a field that is left untouched when its source is missing
+KEEP = object()
+
+_INHERIT = object()
+
+
+def _compile_source(source):
+    """
+    Gets the Python condition testing that a source key or key path is
+    present, and the expression reading it
+    """
+
+    path = (source,) if isinstance(source, str) else source
+    expression = "source"
+    conditions = []
+    for key in path:
+        if conditions:
+            conditions.append("isinstance({}, dict)".format(expression))
+        conditions.append("{!r} in {}".format(key, expression))
+        expression += "[{!r}]".format(key)
+    return " and ".join(conditions), expression
+
+
+class Field(object):
+    """
+    One response field copied onto an attribute of the hydrated object.
+
+    Sources are tried in order and the first one present is used. A
+    source is either a key of the response dict or a tuple of keys
+    leading into nested dicts.
+    """
+
+    #  Name of the attribute set on the hydrated object
+    attribute = None
+    #  Keys or key paths read from the response, in order of preference
+    sources = None
+    #  Optional callable applied to the value before assigning it
+    converter = None
+    #  Value assigned when no source is present, or `KEEP`; defaults to
+    #  the table's default
+    default = _INHERIT
+
+    def __init__(self, attribute, *sources, converter=None, default=_INHERIT):
+        if not attribute.isidentifier():
+            raise ApiException("Invalid field attribute: {}".format(attribute))
+        for source in sources:
+            path = (source,) if isinstance(source, str) else source
+            if not path or not all(isinstance(key, str) for key in path):
+                raise ApiException("Invalid field source: {!r}".format(source))
+        self.attribute = attribute
+        self.sources = sources or (attribute,)
+        self.converter = converter
+        self.default = default
+
+
+class FieldMap(object):
+    """
+    Compiled table of `Field`s.
+
+    The table is turned into a straight-line Python function when it is
+    created, so hydrating an object costs no more than the equivalent
+    chain of `if "X" in item` statements. Extractors for subsets of the
+    fields are compiled on first use and cached.
+    """
+
+    #  The mapped fields
+    fields = None
+    #  Value assigned by fields without a default when their source is
+    #  missing, or `KEEP`
+    default = KEEP
+
+    def __init__(self, *fields, default=KEEP):
+        """
+        :param fields: The `Field`s, applied in order
+        :param default: Default for fields that do not set their own
+        """
+
+        self.fields = fields
+        self.default = default
+        self._attributes = frozenset(field.attribute for field in self.fields)
+        self._extract = self._compile(self.fields)
+        self._extractors = {}
+
+    @property
+    def attributes(self):
+        return self._attributes
+
+    @property
+    def paths(self):
+        """
+        Key paths of every source read by the table, as tuples.
+        """
+
+        return tuple(
+            (source,) if isinstance(source, str) else tuple(source)
+            for field in self.fields
+            for source in field.sources
+        )
+
+    def apply(self, target, source, only=None):
+        """
+        Copies the mapped fields from a response onto an object.
+
+        :param target: Object to hydrate
+        :param source: Response dict
+        :param only: Optional collection of attribute names; fields not
+            listed are skipped
+        :return: The target
+        """
+
+        if only is None:
+            self._extract(target, source)
+        else:
+            self.extractor(only)(target, source)
+        return target
+
+    def extractor(self, only):
+        """
+        Gets the compiled function copying a subset of the fields.
+
+        :param only: Collection of attribute names to copy
+        :return: Function called as `extract(target, source)`
+        """
+
+        key = frozenset(only)
+        extract = self._extractors.get(key)
+        if extract is None:
+            extract = self._compile(
+                [field for field in self.fields if field.attribute in key]
+            )
+            self._extractors[key] = extract
+        return extract
+
+    def _compile(self, fields):
+        namespace = {}
+        lines = ["def extract(target, source):", "    pass"]
+
+        for index, field in enumerate(fields):
+            value = "{}"
+            if field.converter is not None:
+                namespace["convert_{}".format(index)] = field.converter
+                value = "convert_{}({{}})".format(index)
+
+            keyword = "if"
+            for source in field.sources:
+                condition, expression = _compile_source(source)
+                lines.append("    {} {}:".format(keyword, condition))
+                lines.append(
+                    "        target.{} = {}".format(
+                        field.attribute, value.format(expression)
+                    )
+                )
+                keyword = "elif"
+
+            default = self.default if field.default is _INHERIT else field.default
+            if default is not KEEP:
+                namespace["default_{}".format(index)] = default
+                lines.append("    else:")
+                lines.append(
+                    "        target.{} = default_{}".format(field.attribute, index)
+                )
+
+        exec("\n".join(lines), namespace)
+        return namespace["extract"]
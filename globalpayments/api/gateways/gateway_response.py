@@ -1,3 +1,7 @@
 class GatewayResponse(object):
     status_code = None
     raw_response = None
+    #  Unread response body, for requests sent with `stream=True`
+    stream = None
+    #  Traffic lane held until the unread body is released
+    lane = None
@@ -0,0 +1,192 @@
+"""
+Extracts the fields of Portico transaction responses
+"""
+
+import xml.etree.cElementTree as et
+
+
+def _local_name(tag):
+    return tag.rpartition("}")[2]
+
+
+def _to_value(element):
+    text = element.text.strip() if element.text else None
+    text = text or None
+    if not len(element) and not element.attrib:
+        return text
+
+    value = {"@" + _local_name(name): attr for name, attr in element.attrib.items()}
+    value.update(_to_dict(element))
+    if text is not None:
+        value["#text"] = text
+    return value
+
+
+def _add(result, key, value):
+    if key not in result:
+        result[key] = value
+    elif isinstance(result[key], list):
+        result[key].append(value)
+    else:
+        result[key] = [result[key], value]
+
+
+def _to_dict(element):
+    result = {}
+    for child in element:
+        _add(result, _local_name(child.tag), _to_value(child))
+    return result
+
+
+def select(*paths):
+    """
+    Builds a selector picking fields for `PorticoResponse.parse`.
+
+    :param paths: Key paths of the fields, as tuples of element names
+    :return: Nested dict of element names, where `True` marks elements
+        converted whole
+    """
+
+    selector = {}
+    for path in paths:
+        node = selector
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+            if node is True:
+                break
+        else:
+            node[path[-1]] = True
+    return selector
+
+
+def _pick(element, selector):
+    result = {}
+    for child in element:
+        key = _local_name(child.tag)
+        picked = selector.get(key)
+        if picked is None:
+            continue
+        if picked is True or not len(child):
+            _add(result, key, _to_value(child))
+        else:
+            _add(result, key, _pick(child, picked))
+    return result
+
+
+class PorticoResponse(object):
+    """
+    The `Header` and transaction fields of a Portico SOAP response.
+
+    Only those two elements are converted to dicts, shaped the way
+    `xmltodict` would shape them: leaves become their stripped text (or
+    None when empty), repeated elements become lists and namespace
+    prefixes are dropped. The rest of the envelope is skipped, as are
+    fields left out by the selectors passed to `parse`.
+    """
+
+    #  Header fields keyed by element name
+    header = None
+    #  Denotes if the response carries a `Transaction` element
+    has_transaction = False
+    #  Name of the element inside `Transaction`, e.g. `CreditSale`
+    transaction_name = None
+    #  Fields of the element inside `Transaction` keyed by element name
+    transaction = None
+
+    def __init__(self):
+        self.header = {}
+        self.transaction = {}
+
+    @staticmethod
+    def parse(raw_response, header=None, transaction=None):
+        """
+        Parses a raw Portico response.
+
+        With selectors, only the picked fields are converted to values.
+
+        :param raw_response: The response body, as bytes or str
+        :param header: Optional `select` result picking the header
+            fields; all of them are converted by default
+        :param transaction: Optional `select` result picking the fields
+            of the element inside `Transaction`; all of them are
+            converted by default
+        :return: PorticoResponse
+        """
+
+        result = PorticoResponse()
+        version = None
+        for element in et.fromstring(raw_response).iter():
+            if _local_name(element.tag) == "Ver1.0":
+                version = element
+                break
+        if version is None:
+            return result
+
+        for element in version:
+            name = _local_name(element.tag)
+            if name == "Header":
+                result.header = (
+                    _to_dict(element) if header is None else _pick(element, header)
+                )
+            elif name == "Transaction":
+                result.has_transaction = True
+                if len(element):
+                    result.transaction_name = _local_name(element[0].tag)
+                    result.transaction = (
+                        _to_dict(element[0])
+                        if transaction is None
+                        else _pick(element[0], transaction)
+                    )
+        return result
+
+
+def iter_report_items(chunks, report_name, item_name, response=None):
+    """
+    Incrementally parses a Portico report response, yielding each row as
+    it is completed. Rows are shaped like `PorticoResponse` fields and
+    are dropped from the parsed tree once yielded, so memory use does
+    not grow with the size of the report.
+
+    :param chunks: Iterable of response body chunks, as bytes
+    :param report_name: Name of the report element, e.g. `ReportActivity`
+    :param item_name: Name of the row elements, e.g. `Details`
+    :param response: Optional `PorticoResponse` receiving the header
+        fields and `has_transaction` as they are parsed; the header
+        precedes the rows, so it is set before the first row is yielded
+    :return: Generator of row values
+    """
+
+    parser = et.XMLPullParser(events=("start", "end"))
+    elements = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                if (
+                    response is not None
+                    and elements
+                    and _local_name(elements[-1].tag) == "Ver1.0"
+                    and _local_name(element.tag) == "Transaction"
+                ):
+                    response.has_transaction = True
+                elements.append(element)
+                continue
+
+            elements.pop()
+            if not elements:
+                continue
+            parent = _local_name(elements[-1].tag)
+            if (
+                len(elements) > 1
+                and parent == report_name
+                and _local_name(element.tag) == item_name
+            ):
+                yield _to_value(element)
+                elements[-1].remove(element)
+            elif (
+                response is not None
+                and parent == "Ver1.0"
+                and _local_name(element.tag) == "Header"
+            ):
+                response.header = _to_dict(element)
+    parser.close()
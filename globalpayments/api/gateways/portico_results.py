@@ -0,0 +1,245 @@
+"""
+Transaction results built from parsed Portico responses
+"""
+
+from globalpayments.api.entities import (
+    BatchSummary,
+    DebitMac,
+    Transaction,
+    TransactionSummary,
+)
+from globalpayments.api.gateways.portico_response import select
+from globalpayments.api.gateways.response_fields import (
+    PORTICO_BATCH_SUMMARY_FIELDS,
+    PORTICO_DEBIT_MAC_FIELDS,
+    PORTICO_GIFT_CARD_FIELDS,
+    PORTICO_HEADER_FIELDS,
+    PORTICO_TRANSACTION_FIELDS,
+    PORTICO_TRANSACTION_SUMMARY_FIELDS,
+    normalize_response_code,
+)
+from globalpayments.api.payment_methods import GiftCard, TransactionReference
+
+#  Header fields read when mapping a Portico response
+PORTICO_HEADER_SELECTOR = select(
+    ("GatewayRspCode",),
+    ("GatewayRspMsg",),
+    ("GatewayTxnId",),
+    *PORTICO_HEADER_FIELDS.paths
+)
+
+#  Transaction element fields read when mapping a Portico response
+PORTICO_TRANSACTION_SELECTOR = select(
+    ("AuthCode",),
+    ("DebitMac",),
+    *PORTICO_TRANSACTION_FIELDS.paths,
+    *(("CardData",) + path for path in PORTICO_GIFT_CARD_FIELDS.paths),
+    *PORTICO_BATCH_SUMMARY_FIELDS.paths,
+    *PORTICO_DEBIT_MAC_FIELDS.paths
+)
+
+
+def map_transaction_reference(header, item, payment_method):
+    if payment_method is None:
+        return None
+
+    reference = TransactionReference()
+    reference.payment_method_type = payment_method.payment_method_type
+    if "GatewayTxnId" in header:
+        reference.transaction_id = header["GatewayTxnId"]
+    if "AuthCode" in item:
+        reference.auth_code = item["AuthCode"]
+    return reference
+
+
+def map_gift_card(item):
+    if "CardData" not in item:
+        return None
+    return PORTICO_GIFT_CARD_FIELDS.apply(GiftCard(), item["CardData"])
+
+
+def map_batch_summary(item):
+    if "BatchId" not in item:
+        return None
+    return PORTICO_BATCH_SUMMARY_FIELDS.apply(BatchSummary(), item)
+
+
+def map_debit_mac(item):
+    if "DebitMac" not in item:
+        return None
+    return PORTICO_DEBIT_MAC_FIELDS.apply(DebitMac(), item)
+
+
+class _LazyAttribute(object):
+    """
+    Attribute loaded on first access and then stored on the instance.
+
+    Being a non-data descriptor, the stored value shadows it, so later
+    reads are plain attribute lookups and assignments work as usual.
+    """
+
+    def __init__(self, name, load):
+        self.name = name
+        self.load = load
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.load(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _field_loader(name, fields, source, fallback):
+    """
+    Gets a loader running the compiled extractor of one table field,
+    leaving the fallback in place when the response does not have it
+    """
+
+    extract = fields.extractor((name,))
+
+    def load(instance):
+        instance.__dict__[name] = fallback(instance)
+        only = instance._response_fields
+        if only is None or name in only:
+            extract(instance, source(instance))
+        return instance.__dict__[name]
+
+    return load
+
+
+def _no_value(instance):
+    return None
+
+
+class _LazyResult(object):
+    """
+    Common behaviour of results hydrated on first access
+    """
+
+    #  Names of the attributes loaded from the response on first access
+    _lazy_attributes = ()
+    #  Names of the remaining attributes, set to None on creation
+    _eager_attributes = ()
+    #  Names of the fields to map, or None to map them all
+    _response_fields = None
+
+    def _init_eager_attributes(self):
+        for name in self._eager_attributes:
+            setattr(self, name, None)
+
+    def materialize(self):
+        """
+        Loads every attribute still backed by the response and releases
+        the response data.
+
+        :return: self
+        """
+
+        for name in self._lazy_attributes:
+            getattr(self, name)
+        self._release()
+        return self
+
+    def _release(self):
+        pass
+
+
+class LazyTransaction(_LazyResult, Transaction):
+    """
+    `Transaction` mapping its fields from the Portico response on first
+    access
+    """
+
+    def __init__(self, response, payment_method=None, response_fields=None):
+        """
+        :param response: The parsed `PorticoResponse`
+        :param payment_method: Payment method of the request, if any
+        :param response_fields: Names of the fields to map, or None
+        """
+
+        self._init_eager_attributes()
+        self.response_values = {}
+        self._header = response.header
+        self._item = response.transaction
+        self._payment_method = payment_method
+        self._response_fields = response_fields
+
+    def _release(self):
+        self._header = None
+        self._item = None
+        self._payment_method = None
+
+
+def _header_response_code(instance):
+    return normalize_response_code(instance._header["GatewayRspCode"])
+
+
+def _header_response_message(instance):
+    return instance._header["GatewayRspMsg"]
+
+
+def _transaction_loaders():
+    fallbacks = {
+        "response_code": _header_response_code,
+        "response_message": _header_response_message,
+    }
+    loaders = {}
+    for fields, source in (
+        (PORTICO_TRANSACTION_FIELDS, lambda instance: instance._item),
+        (PORTICO_HEADER_FIELDS, lambda instance: instance._header),
+    ):
+        for name in fields.attributes:
+            fallback = fallbacks.get(name, _no_value)
+            loaders[name] = _field_loader(name, fields, source, fallback)
+
+    loaders["transaction_reference"] = lambda instance: map_transaction_reference(
+        instance._header, instance._item, instance._payment_method
+    )
+    loaders["gift_card"] = lambda instance: map_gift_card(instance._item)
+    loaders["batch_summary"] = lambda instance: map_batch_summary(instance._item)
+    loaders["debit_mac"] = lambda instance: map_debit_mac(instance._item)
+    return loaders
+
+
+class LazyTransactionSummary(_LazyResult, TransactionSummary):
+    """
+    `TransactionSummary` mapping its fields from a Portico report item
+    on first access
+    """
+
+    def __init__(self, item):
+        """
+        :param item: The report item
+        """
+
+        self._init_eager_attributes()
+        self._item = item
+
+    def _release(self):
+        self._item = None
+
+
+def _transaction_summary_loaders():
+    return {
+        name: _field_loader(
+            name,
+            PORTICO_TRANSACTION_SUMMARY_FIELDS,
+            lambda instance: instance._item,
+            _no_value,
+        )
+        for name in PORTICO_TRANSACTION_SUMMARY_FIELDS.attributes
+    }
+
+
+def _install(cls, base, loaders):
+    for name, load in loaders.items():
+        setattr(cls, name, _LazyAttribute(name, load))
+    cls._lazy_attributes = tuple(sorted(loaders))
+    cls._eager_attributes = tuple(
+        name for name in getattr(base, "__slots__", ()) if name not in loaders
+    )
+
+
+_install(LazyTransaction, Transaction, _transaction_loaders())
+_install(LazyTransactionSummary, TransactionSummary, _transaction_summary_loaders())
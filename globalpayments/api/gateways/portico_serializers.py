@@ -0,0 +1,499 @@
+"""
+Portico request elements for each payment method class
+"""
+
+import xml.etree.cElementTree as et
+
+from globalpayments.api.entities import (
+    ECommerceInfo,
+    RecurringPaymentMethod,
+    ThreeDSecure,
+)
+from globalpayments.api.entities.enums import (
+    AliasAction,
+    EntryMethod,
+    PaymentMethodType,
+    ThreeDSecureVersion,
+    TransactionModifier,
+    TransactionType,
+)
+from globalpayments.api.payment_methods import (
+    CreditCardData,
+    CreditTrackData,
+    DebitTrackData,
+    EBTCardData,
+    EBTTrackData,
+    ECheck,
+    GiftCard,
+    TransactionReference,
+)
+
+
+def _card_data(block1, payment_method):
+    # because debit
+    if (
+        payment_method.payment_method_type == PaymentMethodType.Debit
+        or payment_method.payment_method_type == PaymentMethodType.ACH
+    ):
+        return block1
+    return et.Element("CardData")
+
+
+def _append_credential_on_file(connector, block1, builder):
+    if connector._should_include_credential_on_file(builder) and (
+        hasattr(builder, "card_brand_transaction_id")
+        and builder.card_brand_transaction_id
+        or hasattr(builder, "transaction_initiator")
+        and builder.transaction_initiator
+    ):
+        block1.append(connector._hydrate_credential_on_file(builder))
+
+
+def _append_manual_entry(connector, block1, card_data, builder):
+    card = builder.payment_method
+    has_token, token_value = connector._has_token(card)
+
+    manual_entry = et.SubElement(card_data, "TokenData" if has_token else "ManualEntry")
+    _append_credential_on_file(connector, block1, builder)
+
+    et.SubElement(manual_entry, "TokenValue" if has_token else "CardNbr").text = (
+        token_value or card.number
+    )
+
+    if card.exp_month is not None:
+        et.SubElement(manual_entry, "ExpMonth").text = str(card.exp_month)
+    if card.exp_year is not None:
+        et.SubElement(manual_entry, "ExpYear").text = str(card.exp_year)
+    if card.cvn is not None:
+        et.SubElement(manual_entry, "CVV2").text = str(card.cvn)
+
+    et.SubElement(manual_entry, "ReaderPresent").text = (
+        "Y" if card.reader_present else "N"
+    )
+    et.SubElement(manual_entry, "CardPresent").text = "Y" if card.card_present else "N"
+
+    block1.append(card_data)
+
+    if isinstance(card, CreditCardData):
+        secure_ecom = card.three_d_secure
+
+        if (secure_ecom is not None) and (isinstance(secure_ecom, ECommerceInfo)):
+            secure_ecommerce = et.SubElement(block1, "SecureECommerce")
+            et.SubElement(secure_ecommerce, "PaymentDataSource").text = (
+                secure_ecom.payment_data_source
+            )
+            et.SubElement(secure_ecommerce, "TypeOfPaymentData").text = (
+                secure_ecom.payment_data_type
+            )
+            et.SubElement(secure_ecommerce, "PaymentData").text = secure_ecom.cavv
+            et.SubElement(secure_ecommerce, "ECommerceIndicator").text = secure_ecom.eci
+            et.SubElement(secure_ecommerce, "XID").text = secure_ecom.xid
+        elif (card.three_d_secure is not None) and (
+            isinstance(card.three_d_secure, ThreeDSecure)
+        ):
+            mpi = et.SubElement(block1, "Secure3D")
+            et.SubElement(mpi, "Version").text = (
+                "2" if card.three_d_secure.version == ThreeDSecureVersion.Two else "1"
+            )
+            et.SubElement(mpi, "AuthenticationValue").text = card.three_d_secure.cavv
+            et.SubElement(mpi, "DirectoryServerTxnId").text = card.three_d_secure.xid
+            et.SubElement(mpi, "ECI").text = str(card.three_d_secure.eci)
+
+    if builder.transaction_modifier == TransactionModifier.Recurring:
+        recurring = et.SubElement(block1, "RecurringData")
+        et.SubElement(recurring, "ScheduleID").text = builder.schedule_id
+        et.SubElement(recurring, "OneTime").text = (
+            "Y" if builder.one_time_payment else "N"
+        )
+
+
+def _append_track_data(connector, block1, card_data, builder):
+    track = builder.payment_method
+    has_token, token_value = connector._has_token(track)
+
+    track_data = et.SubElement(card_data, "TokenData" if has_token else "TrackData")
+    if not has_token:
+        track_data.text = str(track.value)
+        track_data.set(
+            "method",
+            (
+                "proximity"
+                if getattr(track, "entry_method", None) == EntryMethod.Proximity
+                else "swipe"
+            ),
+        )
+        if track.payment_method_type != PaymentMethodType.Debit:
+            block1.append(card_data)
+    else:
+        et.SubElement(track_data, "TokenValue").text = token_value
+
+
+def _append_gift_card(block1, card_data, builder):
+    card = builder.payment_method
+
+    # currency
+    if builder.currency:
+        et.SubElement(block1, "Currency").text = builder.currency.upper()
+
+    # if it's replace, add the new card, and change the card data name to be old card data
+    if builder.transaction_type == TransactionType.Replace:
+        new_card_data = et.SubElement(block1, "NewCardData")
+        et.SubElement(new_card_data, builder.replacement_card.value_type).text = (
+            builder.replacement_card.value
+        )
+        if builder.replacement_card.pin:
+            et.SubElement(new_card_data, "PIN").text = builder.replacement_card.pin
+
+        card_data = et.Element("OldCardData")
+
+    et.SubElement(card_data, card.value_type).text = card.value
+    if card.pin:
+        et.SubElement(card_data, "PIN").text = card.pin
+
+    if builder.alias_action != AliasAction.Create:
+        block1.append(card_data)
+    return card_data
+
+
+def _append_check(connector, block1, builder):
+    check = builder.payment_method
+    has_token, token_value = connector._has_token(check)
+
+    # check action
+    et.SubElement(block1, "CheckAction").text = "SALE"
+
+    if not has_token:
+        account_info = et.SubElement(block1, "AccountInfo")
+        if check.routing_number:
+            et.SubElement(account_info, "RoutingNumber").text = check.routing_number
+        if check.account_number:
+            et.SubElement(account_info, "AccountNumber").text = check.account_number
+    else:
+        et.SubElement(block1, "TokenValue").text = token_value
+        account_info = et.SubElement(block1, "AccountInfo")
+    if check.check_number:
+        et.SubElement(account_info, "CheckNumber").text = check.check_number
+    if check.micr_number:
+        et.SubElement(account_info, "MICRData").text = check.micr_number
+    if check.account_type:
+        et.SubElement(account_info, "AccountType").text = check.account_type.value
+
+    if check.entry_mode:
+        et.SubElement(block1, "DataEntryMode").text = check.entry_mode.value.upper()
+    if check.check_type:
+        et.SubElement(block1, "CheckType").text = check.check_type.value
+    if check.sec_code:
+        et.SubElement(block1, "SECCode").text = check.sec_code.value
+
+    # verify info
+    verify = et.SubElement(block1, "VerifyInfo")
+    et.SubElement(verify, "CheckVerify").text = "Y" if check.check_verify else "N"
+    et.SubElement(verify, "ACHVerify").text = "Y" if check.ach_verify else "N"
+
+
+def _append_reference(block1, builder):
+    reference = builder.payment_method
+    if reference.transaction_id or not reference.client_transaction_id:
+        et.SubElement(block1, "GatewayTxnId").text = reference.transaction_id
+    if reference.client_transaction_id:
+        et.SubElement(block1, "ClientTxnId").text = reference.client_transaction_id
+
+
+def _append_recurring(connector, block1, builder):
+    method = builder.payment_method
+
+    # check action
+    if method.payment_type == "ACH":
+        et.SubElement(block1, "CheckAction").text = "SALE"
+        if method.sec_code is not None:
+            et.SubElement(block1, "SECCode").text = method.sec_code.value
+
+    # payment method stuff
+    et.SubElement(block1, "PaymentMethodKey").text = method.key
+    if method.payment_method is not None and isinstance(
+        method.payment_method, CreditCardData
+    ):
+        card = method.payment_method
+        data = et.SubElement(block1, "PaymentMethodKeyData")
+        et.SubElement(data, "ExpMonth").text = str(card.exp_month)
+        et.SubElement(data, "ExpYear").text = str(card.exp_year)
+        et.SubElement(data, "CVV2").text = str(card.cvn)
+
+        # Add the credential on file logic
+        _append_credential_on_file(connector, block1, builder)
+
+    # recurring data
+    recurring = et.SubElement(block1, "RecurringData")
+    et.SubElement(recurring, "ScheduleID").text = builder.schedule_id
+    et.SubElement(recurring, "OneTime").text = "Y" if builder.one_time_payment else "N"
+
+
+def _append_pin_block(block1, builder):
+    pin_block = builder.payment_method.pin_block
+    if pin_block and builder.transaction_type != TransactionType.Reversal:
+        et.SubElement(block1, "PinBlock").text = pin_block
+
+
+def _append_encryption_data(card_data, builder):
+    encryption_data = builder.payment_method.encryption_data
+    if encryption_data is not None:
+        enc = et.SubElement(card_data, "EncryptionData")
+        if encryption_data.version:
+            et.SubElement(enc, "Version").text = encryption_data.version
+        if encryption_data.track_number:
+            et.SubElement(enc, "EncryptedTrackNumber").text = (
+                encryption_data.track_number
+            )
+        if encryption_data.ktb:
+            et.SubElement(enc, "KTB").text = encryption_data.ktb
+        if encryption_data.ktb:
+            et.SubElement(enc, "KSN").text = encryption_data.ksn
+
+
+def _append_token_request(card_data, builder):
+    if builder.payment_method.tokenizable:
+        et.SubElement(card_data, "TokenRequest").text = (
+            "Y" if builder.request_multi_use_token else "N"
+        )
+
+
+def serialize_credit_card(connector, block1, builder):
+    card_data = _card_data(block1, builder.payment_method)
+    _append_manual_entry(connector, block1, card_data, builder)
+    _append_encryption_data(card_data, builder)
+    _append_token_request(card_data, builder)
+
+
+def write_credit_card(connector, writer, builder):
+    """
+    Writes the elements `serialize_credit_card` adds straight to an
+    `XmlWriter`, for the common credit sale and authorization requests.
+
+    :param connector: The Portico connector
+    :param writer: `XmlWriter` positioned inside the request's Block1
+    :param builder: The authorization builder
+    """
+
+    card = builder.payment_method
+    has_token, token_value = connector._has_token(card)
+
+    if connector._should_include_credential_on_file(builder) and (
+        hasattr(builder, "card_brand_transaction_id")
+        and builder.card_brand_transaction_id
+        or hasattr(builder, "transaction_initiator")
+        and builder.transaction_initiator
+    ):
+        writer.tree(connector._hydrate_credential_on_file(builder))
+
+    writer.start("CardData")
+    entry = "TokenData" if has_token else "ManualEntry"
+    writer.start(entry)
+    writer.element("TokenValue" if has_token else "CardNbr", token_value or card.number)
+    if card.exp_month is not None:
+        writer.element("ExpMonth", str(card.exp_month))
+    if card.exp_year is not None:
+        writer.element("ExpYear", str(card.exp_year))
+    if card.cvn is not None:
+        writer.element("CVV2", str(card.cvn))
+    writer.element("ReaderPresent", "Y" if card.reader_present else "N")
+    writer.element("CardPresent", "Y" if card.card_present else "N")
+    writer.end(entry)
+
+    encryption_data = card.encryption_data
+    if encryption_data is not None:
+        writer.start("EncryptionData")
+        if encryption_data.version:
+            writer.element("Version", encryption_data.version)
+        if encryption_data.track_number:
+            writer.element("EncryptedTrackNumber", encryption_data.track_number)
+        if encryption_data.ktb:
+            writer.element("KTB", encryption_data.ktb)
+            writer.element("KSN", encryption_data.ksn)
+        writer.end("EncryptionData")
+
+    if card.tokenizable:
+        writer.element("TokenRequest", "Y" if builder.request_multi_use_token else "N")
+    writer.end("CardData")
+
+    if isinstance(card, CreditCardData):
+        secure_ecom = card.three_d_secure
+
+        if (secure_ecom is not None) and (isinstance(secure_ecom, ECommerceInfo)):
+            writer.start("SecureECommerce")
+            writer.element("PaymentDataSource", secure_ecom.payment_data_source)
+            writer.element("TypeOfPaymentData", secure_ecom.payment_data_type)
+            writer.element("PaymentData", secure_ecom.cavv)
+            writer.element("ECommerceIndicator", secure_ecom.eci)
+            writer.element("XID", secure_ecom.xid)
+            writer.end("SecureECommerce")
+        elif (secure_ecom is not None) and (isinstance(secure_ecom, ThreeDSecure)):
+            writer.start("Secure3D")
+            writer.element(
+                "Version",
+                "2" if secure_ecom.version == ThreeDSecureVersion.Two else "1",
+            )
+            writer.element("AuthenticationValue", secure_ecom.cavv)
+            writer.element("DirectoryServerTxnId", secure_ecom.xid)
+            writer.element("ECI", str(secure_ecom.eci))
+            writer.end("Secure3D")
+
+    if builder.transaction_modifier == TransactionModifier.Recurring:
+        writer.start("RecurringData")
+        writer.element("ScheduleID", builder.schedule_id)
+        writer.element("OneTime", "Y" if builder.one_time_payment else "N")
+        writer.end("RecurringData")
+
+
+def serialize_credit_track(connector, block1, builder):
+    card_data = _card_data(block1, builder.payment_method)
+    _append_track_data(connector, block1, card_data, builder)
+    _append_encryption_data(card_data, builder)
+    _append_token_request(card_data, builder)
+
+
+def serialize_debit_track(connector, block1, builder):
+    card_data = _card_data(block1, builder.payment_method)
+    _append_track_data(connector, block1, card_data, builder)
+    _append_pin_block(block1, builder)
+    _append_encryption_data(card_data, builder)
+
+
+def serialize_ebt_card(connector, block1, builder):
+    _append_manual_entry(
+        connector, block1, _card_data(block1, builder.payment_method), builder
+    )
+    _append_pin_block(block1, builder)
+
+
+def serialize_ebt_track(connector, block1, builder):
+    card_data = _card_data(block1, builder.payment_method)
+    _append_track_data(connector, block1, card_data, builder)
+    _append_pin_block(block1, builder)
+    _append_encryption_data(card_data, builder)
+
+
+def serialize_gift_card(connector, block1, builder):
+    _append_gift_card(block1, _card_data(block1, builder.payment_method), builder)
+
+
+def serialize_check(connector, block1, builder):
+    _append_check(connector, block1, builder)
+
+
+def serialize_transaction_reference(connector, block1, builder):
+    _append_reference(block1, builder)
+
+
+def serialize_recurring_payment_method(connector, block1, builder):
+    _append_recurring(connector, block1, builder)
+
+
+def serialize_payment_method(connector, block1, builder):
+    """
+    Adds the payment method elements for payment methods without a
+    registered serializer, choosing them from the attributes the
+    payment method has.
+
+    :param connector: The Portico connector
+    :param block1: The request's Block1 element
+    :param builder: The authorization builder
+    """
+
+    payment_method = builder.payment_method
+    card_data = _card_data(block1, payment_method)
+
+    if getattr(payment_method, "is_card_data", False):
+        _append_manual_entry(connector, block1, card_data, builder)
+    elif getattr(payment_method, "is_track_data", False):
+        _append_track_data(connector, block1, card_data, builder)
+    elif isinstance(payment_method, GiftCard):
+        card_data = _append_gift_card(block1, card_data, builder)
+    elif isinstance(payment_method, ECheck):
+        _append_check(connector, block1, builder)
+
+    if isinstance(payment_method, TransactionReference):
+        _append_reference(block1, builder)
+    if isinstance(payment_method, RecurringPaymentMethod):
+        _append_recurring(connector, block1, builder)
+    if getattr(payment_method, "pin_block", None):
+        _append_pin_block(block1, builder)
+    if getattr(payment_method, "encryption_data", None):
+        _append_encryption_data(card_data, builder)
+    if getattr(payment_method, "tokenizable", False):
+        _append_token_request(card_data, builder)
+
+
+#  Serializers by payment method class
+_SERIALIZERS = {
+    CreditCardData: serialize_credit_card,
+    CreditTrackData: serialize_credit_track,
+    DebitTrackData: serialize_debit_track,
+    EBTCardData: serialize_ebt_card,
+    EBTTrackData: serialize_ebt_track,
+    GiftCard: serialize_gift_card,
+    ECheck: serialize_check,
+    TransactionReference: serialize_transaction_reference,
+    RecurringPaymentMethod: serialize_recurring_payment_method,
+}
+#  Serializers found for each payment method class seen so far
+_RESOLVED = {}
+#  Functions writing the same elements as a serializer to an `XmlWriter`
+_WRITERS = {serialize_credit_card: write_credit_card}
+
+
+def register_payment_method_serializer(payment_method_class, serializer):
+    """
+    Sets the serializer adding a payment method's elements to Portico
+    authorization requests. It is used for the class and its subclasses
+    without a serializer of their own.
+
+    :param payment_method_class: The payment method class
+    :param serializer: Callable taking the connector, the request's Block1
+        element and the builder
+    """
+
+    _SERIALIZERS[payment_method_class] = serializer
+    _RESOLVED.clear()
+
+
+def get_payment_method_serializer(payment_method_class):
+    """
+    Gets the serializer for a payment method class.
+
+    :param payment_method_class: The payment method class
+    :return: Callable taking the connector, the request's Block1 element
+        and the builder
+    """
+
+    try:
+        return _RESOLVED[payment_method_class]
+    except KeyError:
+        pass
+    serializer = serialize_payment_method
+    for base in payment_method_class.__mro__:
+        if base in _SERIALIZERS:
+            serializer = _SERIALIZERS[base]
+            break
+    return _RESOLVED.setdefault(payment_method_class, serializer)
+
+
+def write_payment_method(connector, writer, builder):
+    """
+    Writes a payment method's elements to a Portico authorization request.
+    Serializers without a direct writer add them to a scratch Block1 first.
+
+    :param connector: The Portico connector
+    :param writer: `XmlWriter` positioned inside the request's Block1
+    :param builder: The authorization builder
+    """
+
+    serializer = get_payment_method_serializer(type(builder.payment_method))
+    write = _WRITERS.get(serializer)
+    if write is not None:
+        write(connector, writer, builder)
+        return
+
+    block1 = et.Element("Block1")
+    serializer(connector, block1, builder)
+    for child in block1:
+        writer.tree(child)
@@ -0,0 +1,209 @@
+"""
+Portico transaction element names by transaction type, modifier and
+payment method type
+"""
+
+from globalpayments.api.entities.enums import (
+    PaymentMethodType,
+    TransactionModifier,
+    TransactionType,
+)
+from globalpayments.api.entities.exceptions import UnsupportedTransactionException
+from globalpayments.api.payment_methods import TransactionReference
+
+#  Matches any modifier or payment method type, including none
+_ANY = object()
+
+
+def _recurring_sale(builder):
+    if builder.payment_method.payment_type == "ACH":
+        return "CheckSale"
+    return "RecurringBilling"
+
+
+def _not_by_reference(name):
+    def resolve(builder):
+        if isinstance(builder.payment_method, TransactionReference):
+            raise UnsupportedTransactionException(
+                "Portico does not support {} by transaction reference.".format(name)
+            )
+        return name
+
+    return resolve
+
+
+#  (transaction type, modifier, payment method type, element name) in
+#  order of precedence. A callable element name picks the name from the
+#  builder.
+_RULES = (
+    (TransactionType.BatchClose, _ANY, _ANY, "BatchClose"),
+    (
+        TransactionType.Decline,
+        TransactionModifier.ChipDecline,
+        _ANY,
+        "ChipCardDecline",
+    ),
+    (
+        TransactionType.Decline,
+        TransactionModifier.FraudDecline,
+        _ANY,
+        "OverrideFraudDecline",
+    ),
+    (TransactionType.Verify, _ANY, _ANY, "CreditAccountVerify"),
+    (TransactionType.Capture, _ANY, _ANY, "CreditAddToBatch"),
+    (
+        TransactionType.Auth,
+        TransactionModifier.Additional,
+        PaymentMethodType.Credit,
+        "CreditAdditionalAuth",
+    ),
+    (
+        TransactionType.Auth,
+        TransactionModifier.Incremental,
+        PaymentMethodType.Credit,
+        "CreditIncrementalAuth",
+    ),
+    (
+        TransactionType.Auth,
+        TransactionModifier.Offline,
+        PaymentMethodType.Credit,
+        "CreditOfflineAuth",
+    ),
+    (
+        TransactionType.Auth,
+        TransactionModifier.Recurring,
+        PaymentMethodType.Credit,
+        "RecurringBillingAuth",
+    ),
+    (TransactionType.Auth, _ANY, PaymentMethodType.Credit, "CreditAuth"),
+    (TransactionType.Auth, _ANY, PaymentMethodType.Recurring, "RecurringBillingAuth"),
+    (
+        TransactionType.Sale,
+        TransactionModifier.Offline,
+        PaymentMethodType.Credit,
+        "CreditOfflineSale",
+    ),
+    (
+        TransactionType.Sale,
+        TransactionModifier.Recurring,
+        PaymentMethodType.Credit,
+        "RecurringBilling",
+    ),
+    (TransactionType.Sale, _ANY, PaymentMethodType.Credit, "CreditSale"),
+    (TransactionType.Sale, _ANY, PaymentMethodType.Recurring, _recurring_sale),
+    (TransactionType.Sale, _ANY, PaymentMethodType.Debit, "DebitSale"),
+    (TransactionType.Sale, _ANY, PaymentMethodType.Cash, "CashSale"),
+    (TransactionType.Sale, _ANY, PaymentMethodType.ACH, "CheckSale"),
+    (
+        TransactionType.Sale,
+        TransactionModifier.CashBack,
+        PaymentMethodType.EBT,
+        "EBTCashBackPurchase",
+    ),
+    (
+        TransactionType.Sale,
+        TransactionModifier.Voucher,
+        PaymentMethodType.EBT,
+        "EBTVoucherPurchase",
+    ),
+    (TransactionType.Sale, _ANY, PaymentMethodType.EBT, "EBTFSPurchase"),
+    (TransactionType.Sale, _ANY, PaymentMethodType.Gift, "GiftCardSale"),
+    (TransactionType.Refund, _ANY, PaymentMethodType.Credit, "CreditReturn"),
+    (
+        TransactionType.Refund,
+        _ANY,
+        PaymentMethodType.Debit,
+        _not_by_reference("DebitReturn"),
+    ),
+    (TransactionType.Refund, _ANY, PaymentMethodType.Cash, "CashReturn"),
+    (
+        TransactionType.Refund,
+        _ANY,
+        PaymentMethodType.EBT,
+        _not_by_reference("EBTFSReturn"),
+    ),
+    (TransactionType.Reversal, _ANY, PaymentMethodType.Credit, "CreditReversal"),
+    (
+        TransactionType.Reversal,
+        _ANY,
+        PaymentMethodType.Debit,
+        _not_by_reference("DebitReversal"),
+    ),
+    (TransactionType.Reversal, _ANY, PaymentMethodType.Gift, "GiftCardReversal"),
+    (TransactionType.Edit, TransactionModifier.LevelII, _ANY, "CreditCPCEdit"),
+    (TransactionType.Edit, _ANY, _ANY, "CreditTxnEdit"),
+    (TransactionType.Void, _ANY, PaymentMethodType.Credit, "CreditVoid"),
+    (TransactionType.Void, _ANY, PaymentMethodType.ACH, "CheckVoid"),
+    (TransactionType.Void, _ANY, PaymentMethodType.Gift, "GiftCardVoid"),
+    (TransactionType.AddValue, _ANY, PaymentMethodType.Credit, "PrePaidAddValue"),
+    (TransactionType.AddValue, _ANY, PaymentMethodType.Debit, "DebitAddValue"),
+    (TransactionType.AddValue, _ANY, PaymentMethodType.Gift, "GiftCardAddValue"),
+    (
+        TransactionType.Balance,
+        _ANY,
+        PaymentMethodType.Credit,
+        "PrePaidBalanceInquiry",
+    ),
+    (TransactionType.Balance, _ANY, PaymentMethodType.EBT, "EBTBalanceInquiry"),
+    (TransactionType.Balance, _ANY, PaymentMethodType.Gift, "GiftCardBalance"),
+    #  shares its value with `Verify`, whose rule takes precedence
+    (TransactionType.BenefitWithdrawal, _ANY, _ANY, "EBTCashBenefitWithdrawal"),
+    (TransactionType.Activate, _ANY, _ANY, "GiftCardActivate"),
+    (TransactionType.Alias, _ANY, _ANY, "GiftCardAlias"),
+    (TransactionType.Deactivate, _ANY, _ANY, "GiftCardDeactivate"),
+    (TransactionType.Replace, _ANY, _ANY, "GiftCardReplace"),
+    (TransactionType.Reward, _ANY, _ANY, "GiftCardReward"),
+    (TransactionType.TokenUpdate, _ANY, _ANY, "ManageTokens"),
+    (TransactionType.TokenDelete, _ANY, _ANY, "ManageTokens"),
+)
+
+
+def _expand(rules):
+    modifiers = tuple(TransactionModifier) + (None,)
+    payment_method_types = tuple(PaymentMethodType) + (None,)
+    table = {}
+    for transaction_type, modifier, payment_method_type, name in rules:
+        for each_modifier in modifiers if modifier is _ANY else (modifier,):
+            for each_type in (
+                payment_method_types
+                if payment_method_type is _ANY
+                else (payment_method_type,)
+            ):
+                table.setdefault((transaction_type, each_modifier, each_type), name)
+    return table
+
+
+#  Element names, or callables picking one from the builder, keyed by
+#  (transaction type, modifier, payment method type)
+PORTICO_TRANSACTION_TYPES = _expand(_RULES)
+
+
+def _describe(value):
+    return getattr(value, "name", value)
+
+
+def map_transaction_type(builder):
+    """
+    Gets the Portico transaction element name for a builder.
+
+    :param builder: The transaction builder
+    :return: str
+    :raises UnsupportedTransactionException: Portico has no transaction for
+        the builder's type, modifier and payment method type
+    """
+
+    key = (
+        builder.transaction_type,
+        builder.transaction_modifier,
+        getattr(builder.payment_method, "payment_method_type", None),
+    )
+    try:
+        name = PORTICO_TRANSACTION_TYPES[key]
+    except KeyError:
+        raise UnsupportedTransactionException(
+            "Portico does not support {} transactions with modifier {} for "
+            "payment method type {}.".format(*map(_describe, key))
+        ) from None
+    if name.__class__ is str:
+        return name
+    return name(builder)
@@ -0,0 +1,167 @@
+"""
+Splits a report's date range into windows requested concurrently
+"""
+
+import asyncio
+import datetime
+from concurrent import futures
+
+
+class ReportWindows(object):
+    """
+    Plans and runs the sub-windows of a report's `start_date`..`end_date`.
+
+    Up to `parallelism` windows are requested at once. The first ones
+    together cover a quarter of the range; the size of each later window
+    is derived from the rows per second of the range fetched so far, so
+    that a window returns about `rows_per_window` rows. Window bounds are
+    inclusive, so rows on a shared bound may be returned twice;
+    `merge` removes them.
+    """
+
+    #  Number of rows a window should return
+    rows_per_window = 2000
+    #  Initial windows cover this fraction of the range in total
+    initial_fraction = 0.25
+    #  A window is at most this many times the size of the largest so far
+    max_growth = 4
+    #  Windows are never shorter than this
+    min_window = datetime.timedelta(minutes=1)
+
+    def __init__(self, start_date, end_date, parallelism, rows_per_window=None):
+        """
+        :param start_date: Start of the report range
+        :param end_date: End of the report range
+        :param parallelism: Maximum number of windows requested at once
+        :param rows_per_window: Number of rows a window should return
+        """
+
+        self.parallelism = max(1, parallelism)
+        if rows_per_window is not None:
+            self.rows_per_window = rows_per_window
+        self._cursor = start_date
+        self._end_date = end_date
+        self._window = max(
+            (end_date - start_date) * self.initial_fraction / self.parallelism,
+            self.min_window,
+        )
+        self._largest = self._window
+        self._rows = 0
+        self._covered = datetime.timedelta(0)
+
+    def next_window(self):
+        """
+        Plans the next window.
+        :return: (start, end) tuple, or None once the range is covered
+        """
+
+        if self._cursor >= self._end_date:
+            return None
+
+        start = self._cursor
+        end = min(start + self._window, self._end_date)
+        self._cursor = end
+        self._largest = max(self._largest, end - start)
+        return start, end
+
+    def record(self, window, rows):
+        """
+        Adjusts the size of later windows to the rows a window returned.
+        :param window: The (start, end) tuple of the window
+        :param rows: Number of rows returned for it
+        :return: None
+        """
+
+        self._rows += rows
+        self._covered += window[1] - window[0]
+        if self._rows:
+            size = self._covered * self.rows_per_window / self._rows
+        else:
+            size = self._largest * self.max_growth
+        self._window = min(max(size, self.min_window), self._largest * self.max_growth)
+
+    def run(self, fetch):
+        """
+        Fetches every window on a thread pool.
+        :param fetch: Called with a (start, end) tuple; returns its rows
+        :return: List of the rows of each window, in window order
+        """
+
+        results = []
+        with futures.ThreadPoolExecutor(
+            max_workers=self.parallelism, thread_name_prefix="gp-report-window"
+        ) as executor:
+            pending = {}
+            while True:
+                while len(pending) < self.parallelism:
+                    window = self.next_window()
+                    if window is None:
+                        break
+                    pending[executor.submit(fetch, window)] = window
+                if not pending:
+                    return self._in_window_order(results)
+
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    window = pending.pop(future)
+                    rows = future.result()
+                    self.record(window, len(rows))
+                    results.append((window, rows))
+
+    async def run_async(self, fetch):
+        """
+        Fetches every window concurrently on the running event loop.
+        :param fetch: Coroutine function called with a (start, end) tuple;
+            returns its rows
+        :return: List of the rows of each window, in window order
+        """
+
+        results = []
+        pending = {}
+        try:
+            while True:
+                while len(pending) < self.parallelism:
+                    window = self.next_window()
+                    if window is None:
+                        break
+                    pending[asyncio.ensure_future(fetch(window))] = window
+                if not pending:
+                    return self._in_window_order(results)
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    window = pending.pop(task)
+                    rows = task.result()
+                    self.record(window, len(rows))
+                    results.append((window, rows))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _in_window_order(results):
+        results.sort(key=lambda result: result[0][0])
+        return [rows for _, rows in results]
+
+    @staticmethod
+    def merge(results):
+        """
+        Merges the rows of every window in order of transaction date,
+        keeping the first row of each gateway transaction id.
+        :param results: List of the rows of each window
+        :return: List of TransactionSummary
+        """
+
+        seen = set()
+        merged = []
+        for rows in results:
+            for row in rows:
+                if row.transaction_id is not None:
+                    if row.transaction_id in seen:
+                        continue
+                    seen.add(row.transaction_id)
+                merged.append(row)
+        merged.sort(key=lambda row: row.transaction_date or "")
+        return merged
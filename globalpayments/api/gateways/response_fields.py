@@ -0,0 +1,202 @@
+"""
+Response field tables of the Portico and PayPlan connectors
+"""
+
+from globalpayments.api.entities.enums import PaymentSchedule
+from globalpayments.api.gateways.field_mapping import KEEP, Field, FieldMap
+
+
+def normalize_response_code(code):
+    """
+    Maps the Portico success codes `0` and `85` to `00`
+    """
+
+    if code == "0" or code == "85":
+        return "00"
+    return code
+
+
+def _normalize_response_text(code):
+    return normalize_response_code(str(code))
+
+
+def _is_true(value):
+    return value == "true"
+
+
+def _is_yes(value):
+    return value == "Yes"
+
+
+def _cents_to_amount(value):
+    return int(value) / 100
+
+
+def _to_payment_schedule(value):
+    if value == "Last":
+        return PaymentSchedule.LastDayOfTheMonth
+    if value == "First":
+        return PaymentSchedule.FirstDayOfTheMonth
+    return PaymentSchedule.Dynamic
+
+
+#  Portico transaction element -> `Transaction`
+PORTICO_TRANSACTION_FIELDS = FieldMap(
+    Field("authorized_amount", "AuthAmt", converter=str),
+    Field("available_balance", "AvailableBalance", converter=str),
+    Field("avs_response_code", "AVSRsltCode", converter=str),
+    Field("avs_response_message", "AVSRsltText", converter=str),
+    Field("balance_amount", "BalanceAmt", converter=str),
+    Field("card_type", "CardType", converter=str),
+    Field("card_last4", "TokenPANLast4", converter=str),
+    Field("cavv_response_code", "CAVVResultCode", converter=str),
+    Field("commercial_indicator", "CPCInd", converter=str),
+    Field("cvn_response_code", "CVVRsltCode", converter=str),
+    Field("cvn_response_message", "CVVRsltText", converter=str),
+    Field("emv_issuer_response", "EMVIssuerResp", converter=str),
+    Field("points_balance_amount", "PointsBalanceAmt", converter=str),
+    Field("recurring_data_code", "RecurringDataCode", converter=str),
+    Field("reference_number", "RefNbr", converter=str),
+    Field("response_code", "RspCode", converter=_normalize_response_text),
+    Field("response_message", "RspText", "RspMessage", converter=str),
+    Field("transaction_descriptor", "TxnDescriptor", converter=str),
+    Field("host_response_date", "HostRspDT", converter=str),
+    Field("card_brand_transaction_id", "CardBrandTxnId", converter=str),
+)
+
+#  Portico header -> `Transaction`
+PORTICO_HEADER_FIELDS = FieldMap(
+    Field("token", ("TokenData", "TokenValue")),
+)
+
+#  Portico `CardData` element -> `GiftCard`
+PORTICO_GIFT_CARD_FIELDS = FieldMap(
+    Field("number", "CardNbr"),
+    Field("alias", "Alias"),
+    Field("pin", "PIN"),
+)
+
+#  Portico transaction element -> `BatchSummary`
+PORTICO_BATCH_SUMMARY_FIELDS = FieldMap(
+    Field("id", "BatchId"),
+    Field("transaction_count", "TxnCnt"),
+    Field("total_amount", "TotalAmt"),
+    Field("sequence_number", "BatchSeqNbr"),
+)
+
+#  Portico transaction element -> `DebitMac`
+PORTICO_DEBIT_MAC_FIELDS = FieldMap(
+    Field("transaction_code", "TransactionCode"),
+    Field("transmission_number", "TransmissionNumber"),
+    Field("bank_response_code", "BankResponseCode"),
+    Field("mac_key", "MacKey"),
+    Field("pin_key", "PinKey"),
+    Field("field_key", "FieldKey"),
+    Field("trace_number", "TraceNumber"),
+    Field("message_authentication_code", "MessageAuthenticationCode"),
+)
+
+#  Portico report transaction -> `TransactionSummary`
+PORTICO_TRANSACTION_SUMMARY_FIELDS = FieldMap(
+    Field("amount", "Amt"),
+    Field("authorized_amount", "AuthAmt"),
+    Field("auth_code", "AuthCode"),
+    Field("client_transaction_id", "ClientTxnId"),
+    Field("device_id", "DeviceId"),
+    Field("issuer_response_code", "RspCode", "IssuerRspCode"),
+    Field("issuer_response_message", "RspText", "IssuerRspText"),
+    Field("masked_card_number", "MaskedCardNbr"),
+    Field("original_transaction_id", "OriginalGatewayTxnId"),
+    Field("gateway_response_code", "GatewayRspCode", converter=normalize_response_code),
+    Field("gateway_response_message", "GatewayResponseMsg"),
+    Field("reference_number", "RefNbr"),
+    Field("service_name", "ServiceName"),
+    Field("settlement_amount", "SettlementAmt"),
+    Field("status", "TxnStatus", "Status", ("Data", "TxnStatus")),
+    Field("transaction_date", "TxnUtcDT", "ReqUtcDT"),
+    Field("transaction_id", "GatewayTxnId"),
+    Field("convenience_amount", "ConvenienceAmtInfo"),
+    Field("shipping_amount", "ShippingAmtInfo"),
+)
+
+#  PayPlan address fields -> `Address`
+PAYPLAN_ADDRESS_FIELDS = FieldMap(
+    Field("street_address_1", "addressLine1"),
+    Field("street_address_2", "addressLine2"),
+    Field("city", "city"),
+    Field("province", "stateProvince"),
+    Field("postal_code", "zipPostalCode"),
+    Field("country", "country"),
+    default=None,
+)
+
+#  PayPlan customer -> `Customer`
+PAYPLAN_CUSTOMER_FIELDS = FieldMap(
+    Field("key", "customerKey"),
+    Field("id", "customerIdentifier"),
+    Field("first_name", "firstName"),
+    Field("last_name", "lastName"),
+    Field("company", "company"),
+    Field("status", "customerStatus"),
+    Field("title", "title"),
+    Field("department", "department"),
+    Field("email", "primaryEmail"),
+    Field("home_phone", "phoneEvening"),
+    Field("work_phone", "phoneDay"),
+    Field("mobile_phone", "phoneMobile"),
+    Field("fax", "fax"),
+    default=None,
+)
+
+#  PayPlan payment method -> `RecurringPaymentMethod`
+PAYPLAN_PAYMENT_METHOD_FIELDS = FieldMap(
+    Field("key", "paymentMethodKey"),
+    Field("id", "paymentMethodIdentifier"),
+    Field("payment_type", "paymentMethodType"),
+    Field("preferred_payment", "preferredPayment", converter=_is_true),
+    Field("status", "paymentStatus"),
+    Field("customer_key", "customerKey"),
+    Field("name_on_account", "nameOnAccount"),
+    Field("commercial_indicator", "commercialIndicator"),
+    Field("tax_type", "taxType"),
+    Field("expiration_date", "expirationDate"),
+    default=None,
+)
+
+#  PayPlan schedule -> `Schedule`
+PAYPLAN_SCHEDULE_FIELDS = FieldMap(
+    Field("key", "scheduleKey"),
+    Field("id", "scheduleIdentifier"),
+    Field("customer_key", "customerKey"),
+    Field("name", "scheduleName"),
+    Field("status", "scheduleStatus"),
+    Field("payment_key", "paymentMethodKey"),
+    Field(
+        "amount",
+        ("subtotalAmount", "value"),
+        converter=_cents_to_amount,
+        default=KEEP,
+    ),
+    Field("currency", ("subtotalAmount", "currency"), default=KEEP),
+    Field("tax_amount", ("taxAmount", "value"), default=KEEP),
+    Field("device_id", "deviceId"),
+    Field("start_date", "startDate"),
+    Field(
+        "payment_schedule",
+        "processingDateInfo",
+        converter=_to_payment_schedule,
+        default=PaymentSchedule.Dynamic,
+    ),
+    Field("frequency", "frequency"),
+    Field("end_date", "endDate"),
+    Field("reprocessing_count", "reprocessingCount"),
+    Field("email_receipt", "emailReceipt"),
+    Field("email_notification", "emailNotification", converter=_is_yes),
+    Field("invoice_number", "invoiceNbr"),
+    Field("po_number", "poNumber"),
+    Field("description", "description"),
+    Field("next_processing_date", "nextProcessingDate"),
+    Field("cancellation_date", "cancellationDate"),
+    Field("has_started", "scheduleStarted", converter=_is_true),
+    default=None,
+)
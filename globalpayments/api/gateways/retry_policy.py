@@ -0,0 +1,260 @@
+"""
+Retry policy applied around gateway requests
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import globalpayments as gp
+from globalpayments.api.entities.enums import TransactionType
+from globalpayments.api.entities.exceptions import (
+    CircuitBreakerOpenException,
+    GatewayException,
+    RateLimitException,
+)
+
+
+class RetryBudget(object):
+    """
+    Caps retries to a fraction of the requests made through a policy.
+
+    Every request deposits `ratio` tokens and every retry withdraws one.
+    The budget starts full so a cold client can still retry, and is
+    capped at `capacity` tokens to bound retry bursts.
+    """
+
+    ratio = None
+    capacity = None
+
+    def __init__(self, ratio=0.2, capacity=10):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        Takes a token for a retry.
+
+        :return: bool, False when the budget is exhausted
+        """
+
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryMetrics(object):
+    """
+    Counters describing the behaviour of a `RetryPolicy`
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "attempts": 0,
+            "retries": 0,
+            "recovered": 0,
+            "exhausted": 0,
+            "budget_exhausted": 0,
+        }
+
+    def increment(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def snapshot(self):
+        """
+        Gets a copy of the current counters.
+
+        :return: dict
+        """
+
+        with self._lock:
+            return dict(self._counters)
+
+
+class RetryPolicy(object):
+    """
+    Retries failed gateway requests with exponential backoff and full
+    jitter.
+
+    Requests that are safe to repeat (reports, `Fetch`/`Search` and
+    `GET`s) are retried on any transport failure and on `retry_statuses`.
+    Money-moving requests are only retried when the connection could not
+    be established, as the gateway never saw them. Subclasses may
+    override `is_idempotent`, `should_retry` or `get_delay`.
+    """
+
+    #  Maximum attempts per request, including the first one
+    max_attempts = None
+    #  Delay before the first retry (in milliseconds)
+    base_delay = None
+    #  Upper bound for a single delay (in milliseconds)
+    max_delay = None
+    #  HTTP status codes retried for idempotent requests
+    retry_statuses = None
+    #  `RetryBudget` shared by all requests made through the policy
+    budget = None
+    #  `RetryMetrics` updated by the policy
+    metrics = None
+
+    def __init__(
+        self,
+        max_attempts=3,
+        base_delay=100,
+        max_delay=2000,
+        retry_statuses=(502, 503, 504),
+        budget=None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+        self.budget = RetryBudget() if budget is None else budget
+        self.metrics = RetryMetrics()
+
+    def execute(self, send, verb, builder=None):
+        """
+        Sends a request, retrying it according to the policy.
+
+        :param send: Callable sending one attempt and returning a
+            GatewayResponse
+        :param verb: HTTP verb of the request
+        :param builder: Builder of the request, if any
+        :return: GatewayResponse
+        """
+
+        idempotent = self._start(verb, builder)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.metrics.increment("attempts")
+            try:
+                response = send()
+            except GatewayException as exc:
+                delay = self._next_delay(exc, None, attempt, idempotent, builder)
+                if delay is None:
+                    raise
+            else:
+                delay = self._next_delay(None, response, attempt, idempotent, builder)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+
+    async def execute_async(self, send, verb, builder=None):
+        """
+        Sends a request from a coroutine, retrying it according to the
+        policy.
+
+        :param send: Callable returning an awaitable for one attempt
+        :param verb: HTTP verb of the request
+        :param builder: Builder of the request, if any
+        :return: GatewayResponse
+        """
+
+        idempotent = self._start(verb, builder)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.metrics.increment("attempts")
+            try:
+                response = await send()
+            except GatewayException as exc:
+                delay = self._next_delay(exc, None, attempt, idempotent, builder)
+                if delay is None:
+                    raise
+            else:
+                delay = self._next_delay(None, response, attempt, idempotent, builder)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+
+    def is_idempotent(self, verb, builder=None):
+        """
+        Determines if a request can be repeated without side effects.
+
+        :param verb: HTTP verb of the request
+        :param builder: Builder of the request, if any
+        :return: bool
+        """
+
+        if builder is None:
+            return verb == "GET"
+        if isinstance(builder, gp.api.builders.ReportBuilder):
+            return True
+        transaction_type = getattr(builder, "transaction_type", None)
+        if transaction_type in (TransactionType.Fetch, TransactionType.Search):
+            return True
+        return verb == "GET"
+
+    def should_retry(self, exc, response, idempotent):
+        """
+        Classifies a failed attempt.
+
+        :param exc: GatewayException raised by the attempt, if any
+        :param response: GatewayResponse of the attempt, if any
+        :param idempotent: Denotes if the request is safe to repeat
+        :return: bool
+        """
+
+        if exc is None:
+            return idempotent and response.status_code in self.retry_statuses
+        if isinstance(exc, (CircuitBreakerOpenException, RateLimitException)):
+            return False
+        if not exc.request_sent:
+            return True
+        return idempotent
+
+    def get_delay(self, attempt):
+        """
+        Gets the backoff before the next attempt (in seconds).
+
+        :param attempt: Number of the attempt that just failed
+        :return: float
+        """
+
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling) / 1000.0
+
+    def _start(self, verb, builder):
+        self.metrics.increment("requests")
+        if self.budget is not None:
+            self.budget.deposit()
+        return self.is_idempotent(verb, builder)
+
+    def _next_delay(self, exc, response, attempt, idempotent, builder):
+        if not self.should_retry(exc, response, idempotent):
+            if attempt > 1 and exc is None:
+                self.metrics.increment("recovered")
+            return None
+
+        if attempt >= self.max_attempts:
+            self.metrics.increment("exhausted")
+            return None
+
+        delay = self.get_delay(attempt)
+        deadline = getattr(builder, "deadline", None)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            self.metrics.increment("exhausted")
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            self.metrics.increment("budget_exhausted")
+            return None
+
+        self.metrics.increment("retries")
+        return delay
@@ -0,0 +1,145 @@
+"""
+Background reversal of authorizations whose outcome is unknown
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import globalpayments as gp
+from globalpayments.api.entities.enums import PaymentMethodType, TransactionType
+from globalpayments.api.entities.exceptions import GatewayException
+from globalpayments.api.gateways.connection_pool import register_after_fork
+from globalpayments.api.payment_methods import TransactionReference
+
+
+class TimeoutReversalResult(object):
+    """
+    Outcome of a timeout reversal, passed to the engine's callback
+    """
+
+    #  Client transaction id shared by the original and the reversal
+    client_transaction_id = None
+    #  Amount of the original authorization
+    amount = None
+    #  Transaction type of the original authorization
+    transaction_type = None
+    #  Number of reversal attempts made
+    attempts = 0
+    #  Denotes if the gateway accepted the reversal
+    reversed = False
+    #  Reversal `Transaction` when the gateway accepted it
+    response = None
+    #  Last error when the reversal did not succeed
+    exception = None
+
+
+class TimeoutReversalEngine(object):
+    """
+    Reverses Portico credit sales and authorizations that timed out.
+
+    The original request is sent with a `ClientTxnId`, so a reversal can
+    reference it without knowing the gateway transaction id. Reversals run
+    on a small background thread pool, are retried on transport failures
+    and report their outcome through `callback`.
+    """
+
+    #  Maximum reversal attempts per timed out transaction
+    max_attempts = None
+    #  Delay between reversal attempts (in milliseconds)
+    retry_delay = None
+    #  Called with a `TimeoutReversalResult` once a reversal finishes
+    callback = None
+
+    def __init__(self, max_attempts=3, retry_delay=1000, callback=None, max_workers=2):
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.callback = callback
+        self._max_workers = max_workers
+        self._shut_down = False
+        self._executor = self._create_executor()
+        register_after_fork(self)
+
+    @staticmethod
+    def supports(builder):
+        """
+        Determines if a timed out authorization can be reversed by
+        client transaction id.
+
+        :param builder: The authorization builder
+        :return: bool
+        """
+
+        return (
+            builder.transaction_type in (TransactionType.Sale, TransactionType.Auth)
+            and builder.payment_method is not None
+            and builder.payment_method.payment_method_type == PaymentMethodType.Credit
+            and not isinstance(builder.payment_method, TransactionReference)
+        )
+
+    def submit(self, connector, builder):
+        """
+        Schedules the reversal of a timed out authorization.
+
+        :param connector: The connector that sent the authorization
+        :param builder: The timed out authorization builder
+        :return: concurrent.futures.Future resolving to a
+            `TimeoutReversalResult`
+        """
+
+        result = TimeoutReversalResult()
+        result.client_transaction_id = builder.client_transaction_id
+        result.amount = builder.amount
+        result.transaction_type = builder.transaction_type
+
+        reference = TransactionReference()
+        reference.payment_method_type = builder.payment_method.payment_method_type
+        reversal = (
+            gp.api.builders.AuthorizationBuilder(TransactionType.Reversal, reference)
+            .with_amount(builder.amount)
+            .with_client_transaction_id(builder.client_transaction_id)
+        )
+
+        return self._executor.submit(self._reverse, connector, reversal, result)
+
+    def shutdown(self, wait=True):
+        """
+        Stops accepting reversals, optionally waiting for pending ones
+        """
+
+        self._shut_down = True
+        self._executor.shutdown(wait=wait)
+
+    def _create_executor(self):
+        return ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="gp-timeout-reversal"
+        )
+
+    def _after_fork(self):
+        # the executor's threads stayed in the parent, so reversals
+        # submitted in the child would never run
+        if not self._shut_down:
+            self._executor = self._create_executor()
+
+    def _reverse(self, connector, reversal, result):
+        while result.attempts < self.max_attempts:
+            if result.attempts and self.retry_delay:
+                time.sleep(self.retry_delay / 1000.0)
+            result.attempts += 1
+
+            try:
+                result.response = connector.process_authorization(reversal)
+                result.reversed = True
+                result.exception = None
+                break
+            except GatewayException as exc:
+                result.exception = exc
+                # the gateway answered, so retrying will not change the outcome
+                if exc.response_code is not None:
+                    break
+            except Exception as exc:
+                result.exception = exc
+                break
+
+        if self.callback is not None:
+            self.callback(result)
+        return result
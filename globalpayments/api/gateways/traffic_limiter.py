@@ -0,0 +1,297 @@
+"""
+Client-side rate limits and concurrency bulkheads
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+import globalpayments as gp
+from globalpayments.api.entities.enums import TransactionType
+from globalpayments.api.entities.exceptions import RateLimitException
+
+
+class TokenBucket(object):
+    """
+    Allows `rate` requests per second with bursts of up to `burst`.
+
+    Callers reserve a token up front and then sleep until it becomes
+    available, so waiting callers are served in order.
+    """
+
+    rate = None
+    burst = None
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, timeout=None):
+        """
+        Reserves a token.
+
+        :param timeout: Longest acceptable wait (in seconds), or None to
+            wait as long as needed
+        :return: Seconds to wait before using the token, or None when the
+            wait would exceed `timeout`
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                return None
+            self._tokens -= 1
+            return wait
+
+
+class _Waiter(object):
+    granted = False
+
+    def __init__(self, loop=None):
+        self.loop = loop
+        if loop is None:
+            self.event = threading.Event()
+        else:
+            self.future = loop.create_future()
+
+    def grant(self):
+        self.granted = True
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class Bulkhead(object):
+    """
+    Caps the number of requests in flight.
+
+    Usable from threads and coroutines alike; waiters are served in
+    arrival order.
+    """
+
+    max_in_flight = None
+
+    def __init__(self, max_in_flight):
+        self.max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def acquire(self, timeout=None):
+        """
+        Takes a slot, waiting up to `timeout` seconds for one.
+
+        :return: bool, False when no slot became free in time
+        """
+
+        with self._lock:
+            waiter = self._try_acquire(timeout)
+        if isinstance(waiter, bool):
+            return waiter
+
+        waiter.event.wait(timeout)
+        return self._settle(waiter)
+
+    async def acquire_async(self, timeout=None):
+        """
+        Takes a slot from a coroutine, waiting up to `timeout` seconds.
+
+        :return: bool, False when no slot became free in time
+        """
+
+        with self._lock:
+            waiter = self._try_acquire(timeout, asyncio.get_running_loop())
+        if isinstance(waiter, bool):
+            return waiter
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            if self._settle(waiter):
+                self.release()
+            raise
+        return self._settle(waiter)
+
+    def release(self):
+        """
+        Frees a slot, handing it to the oldest waiter if any
+        """
+
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().grant()
+            else:
+                self._in_flight -= 1
+
+    def _try_acquire(self, timeout, loop=None):
+        if self._in_flight < self.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+        waiter = _Waiter(loop)
+        self._waiters.append(waiter)
+        return waiter
+
+    def _settle(self, waiter):
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+
+class TrafficLane(object):
+    """
+    Rate limit and bulkhead applied to one class of traffic
+    """
+
+    #  `TokenBucket`, or None for no rate limit
+    bucket = None
+    #  `Bulkhead`, or None for no concurrency limit
+    bulkhead = None
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        if rate is not None:
+            self.bucket = TokenBucket(rate, burst)
+        if max_in_flight is not None:
+            self.bulkhead = Bulkhead(max_in_flight)
+
+    def release(self):
+        if self.bulkhead is not None:
+            self.bulkhead.release()
+
+
+class TrafficLimiter(object):
+    """
+    Per-configuration rate limits and bulkheads.
+
+    Reports and recurring `Fetch`/`Search` calls run in the `background`
+    lane so bulk jobs cannot starve `interactive` authorizations. When a
+    lane is saturated, requests wait up to `max_wait` (bounded by the
+    call's deadline) and are then rejected with `RateLimitException`;
+    a `max_wait` of 0 rejects immediately.
+    """
+
+    #  Lane for authorizations and other customer-facing calls
+    interactive = None
+    #  Lane for reports and recurring searches
+    background = None
+    #  Longest wait for capacity (in milliseconds), or None to wait
+    #  until the call's deadline
+    max_wait = None
+
+    def __init__(self, interactive=None, background=None, max_wait=None):
+        self.interactive = interactive or TrafficLane()
+        self.background = background or TrafficLane()
+        self.max_wait = max_wait
+
+    def get_lane(self, builder=None):
+        """
+        Chooses the lane for a call.
+
+        :param builder: Builder of the call, if any
+        :return: TrafficLane
+        """
+
+        if builder is None:
+            return self.interactive
+        if isinstance(builder, gp.api.builders.ReportBuilder):
+            return self.background
+        if isinstance(builder, gp.api.builders.RecurringBuilder) and (
+            builder.transaction_type in (TransactionType.Fetch, TransactionType.Search)
+        ):
+            return self.background
+        return self.interactive
+
+    def acquire(self, builder=None):
+        """
+        Waits for capacity in the call's lane.
+
+        :param builder: Builder of the call, if any
+        :return: TrafficLane to release once the call completes
+        :raises RateLimitException: when no capacity became available
+        """
+
+        lane = self.get_lane(builder)
+        started = time.monotonic()
+        timeout = self._get_timeout(builder)
+
+        if lane.bucket is not None:
+            wait = lane.bucket.reserve(timeout)
+            if wait is None:
+                raise self._rejected(lane)
+            time.sleep(wait)
+
+        if lane.bulkhead is not None:
+            if not lane.bulkhead.acquire(self._remaining(timeout, started)):
+                raise self._rejected(lane)
+        return lane
+
+    async def acquire_async(self, builder=None):
+        """
+        Waits for capacity in the call's lane from a coroutine.
+
+        :param builder: Builder of the call, if any
+        :return: TrafficLane to release once the call completes
+        :raises RateLimitException: when no capacity became available
+        """
+
+        lane = self.get_lane(builder)
+        started = time.monotonic()
+        timeout = self._get_timeout(builder)
+
+        if lane.bucket is not None:
+            wait = lane.bucket.reserve(timeout)
+            if wait is None:
+                raise self._rejected(lane)
+            await asyncio.sleep(wait)
+
+        if lane.bulkhead is not None:
+            acquired = await lane.bulkhead.acquire_async(
+                self._remaining(timeout, started)
+            )
+            if not acquired:
+                raise self._rejected(lane)
+        return lane
+
+    def _get_timeout(self, builder):
+        timeout = None if self.max_wait is None else self.max_wait / 1000.0
+        deadline = getattr(builder, "deadline", None)
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+    @staticmethod
+    def _remaining(timeout, started):
+        if timeout is None:
+            return None
+        return max(0.0, timeout - (time.monotonic() - started))
+
+    def _rejected(self, lane):
+        name = "background" if lane is self.background else "interactive"
+        return RateLimitException(
+            "Client-side {} traffic limit reached.".format(name), name
+        )
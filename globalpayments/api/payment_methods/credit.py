@@ -16,27 +16,22 @@ class Credit(object):
     Use credit as a payment method.
     """
 
-    tokenizable = True
+    __slots__ = ("encryption_data", "three_d_secure", "token")
 
-    encryption_data = None
-    """
-    The card's encryption data; where applicable.
-    """
+    tokenizable = True
 
     payment_method_type = PaymentMethodType.Credit
     """
     Set to L{PaymentMethodType.Credit} for internal methods.
     """
 
-    three_d_secure = None
-    """
-    3DSecure data attached to the card
-    """
-
-    token = None
-    """
-    A token value representing the card.
-    """
+    def __init__(self):
+        #  The card's encryption data; where applicable
+        self.encryption_data = None
+        #  3DSecure data attached to the card
+        self.three_d_secure = None
+        #  A token value representing the card
+        self.token = None
 
     @property
     def is_card_data(self):
@@ -196,8 +191,18 @@ class CreditCardData(Credit):
     Use credit tokens or manual entry data as a payment method.
     """
 
-    _cvn = None
-    _number = None
+    __slots__ = (
+        "_cvn",
+        "_number",
+        "card_type",
+        "card_present",
+        "card_holder_name",
+        "cvn_presence_indicator",
+        "exp_month",
+        "exp_year",
+        "reader_present",
+    )
+
     _regexDict = {
         "Amex": r"^3[47][0-9]{13}$",
         "MC": r"^5[1-5][0-9]{14}$",
@@ -208,48 +213,25 @@ class CreditCardData(Credit):
         "Jcb": r"^(?:2131|1800|35\d{3})\d{11}$",
     }
 
-    card_type = "Unknown"
-    """
-    The card type of the manual entry data.
-
-    Default value is `Unknown`.
-    """
-
-    card_present = False
-    """
-    Indicates if the card is present with the merchant at time of payment.
-
-    Default value is `False`.
-    """
-
-    card_holder_name = None
-    """
-    The name on the front of the card.
-    """
-
-    cvn_presence_indicator = CvnPresenceIndicator.NotRequested
-    """
-    Indicates card verification number (CVN) presence.
-
-    Default value is L{CvnPresenceIndicator.NotRequested}.
-    """
-
-    exp_month = None
-    """
-    The card's expiration month.
-    """
-
-    exp_year = None
-    """
-    The card's expiration year.
-    """
-
-    reader_present = False
-    """
-    Indicates if a card reader was used when accepting the card data.
-
-    Default value is `False`.
-    """
+    def __init__(self):
+        super(CreditCardData, self).__init__()
+        self._cvn = None
+        self._number = None
+        #  The card type of the manual entry data
+        self.card_type = "Unknown"
+        #  Indicates if the card is present with the merchant at time of
+        #  payment
+        self.card_present = False
+        #  The name on the front of the card
+        self.card_holder_name = None
+        #  Indicates card verification number (CVN) presence
+        self.cvn_presence_indicator = CvnPresenceIndicator.NotRequested
+        #  The card's expiration month
+        self.exp_month = None
+        #  The card's expiration year
+        self.exp_year = None
+        #  Indicates if a card reader was used when accepting the card data
+        self.reader_present = False
 
     @property
     def cvn(self):
@@ -304,12 +286,11 @@ class CreditTrackData(Credit):
     Use credit track data as a payment method.
     """
 
-    entry_method = None
-    """
-    Indicates how the card's track data was obtained.
-    """
+    __slots__ = ("entry_method", "value")
 
-    value = None
-    """
-    The card's track data.
-    """
+    def __init__(self):
+        super(CreditTrackData, self).__init__()
+        #  Indicates how the card's track data was obtained
+        self.entry_method = None
+        #  The card's track data
+        self.value = None
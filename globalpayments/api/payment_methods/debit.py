@@ -12,10 +12,15 @@ from globalpayments.api.entities.enums import (
 
 
 class DebitTrackData(object):
-    encryption_data = None
+    __slots__ = ("encryption_data", "entry_method", "pin_block", "value")
+
     payment_method_type = PaymentMethodType.Debit
-    pin_block = None
-    value = None
+
+    def __init__(self):
+        self.encryption_data = None
+        self.entry_method = None
+        self.pin_block = None
+        self.value = None
 
     @property
     def is_track_data(self):
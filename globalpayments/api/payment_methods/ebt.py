@@ -8,8 +8,12 @@ from globalpayments.api.entities.enums import (
 
 
 class EBT(object):
+    __slots__ = ("pin_block",)
+
     payment_method_type = PaymentMethodType.EBT
-    pin_block = None
+
+    def __init__(self):
+        self.pin_block = None
 
     @property
     def is_card_data(self):
@@ -65,19 +69,38 @@ class EBT(object):
 
 
 class EBTCardData(EBT):
-    approval_code = None
-    number = None
-    exp_month = None
-    exp_year = None
-    cvn = None
-    cvn_presence_indicator = CvnPresenceIndicator.NotRequested
-    card_holder_name = None
-    card_present = False
-    reader_present = False
-    serial_number = None
+    __slots__ = (
+        "approval_code",
+        "number",
+        "exp_month",
+        "exp_year",
+        "cvn",
+        "cvn_presence_indicator",
+        "card_holder_name",
+        "card_present",
+        "reader_present",
+        "serial_number",
+    )
+
+    def __init__(self):
+        super(EBTCardData, self).__init__()
+        self.approval_code = None
+        self.number = None
+        self.exp_month = None
+        self.exp_year = None
+        self.cvn = None
+        self.cvn_presence_indicator = CvnPresenceIndicator.NotRequested
+        self.card_holder_name = None
+        self.card_present = False
+        self.reader_present = False
+        self.serial_number = None
 
 
 class EBTTrackData(EBT):
-    encryption_data = None
-    entry_method = None
-    value = None
+    __slots__ = ("encryption_data", "entry_method", "value")
+
+    def __init__(self):
+        super(EBTTrackData, self).__init__()
+        self.encryption_data = None
+        self.entry_method = None
+        self.value = None
@@ -11,31 +11,52 @@ class ECheck(object):
     Use ACH/eCheck as a payment method.
     """
 
-    account_number = None
-    account_type = None
-    ach_verify = None
-    birth_year = None
-    check_holder_name = None
-    check_name = None
-    check_number = None
-    check_type = None
-    check_verify = None
-    drivers_license_number = None
-    drivers_license_state = None
-    entry_mode = None
-    micr_number = None
-    payment_method_type = None
-    phone_number = None
-    routing_number = None
-    sec_code = None
-    ssn_last_4 = None
-    token = None
+    __slots__ = (
+        "account_number",
+        "account_type",
+        "ach_verify",
+        "birth_year",
+        "check_holder_name",
+        "check_name",
+        "check_number",
+        "check_type",
+        "check_verify",
+        "drivers_license_number",
+        "drivers_license_state",
+        "entry_mode",
+        "micr_number",
+        "phone_number",
+        "routing_number",
+        "sec_code",
+        "ssn_last_4",
+        "token",
+    )
 
     payment_method_type = PaymentMethodType.ACH
     """
     Set to L{PaymentMethodType.ACH} for internal methods.
     """
 
+    def __init__(self):
+        self.account_number = None
+        self.account_type = None
+        self.ach_verify = None
+        self.birth_year = None
+        self.check_holder_name = None
+        self.check_name = None
+        self.check_number = None
+        self.check_type = None
+        self.check_verify = None
+        self.drivers_license_number = None
+        self.drivers_license_state = None
+        self.entry_mode = None
+        self.micr_number = None
+        self.phone_number = None
+        self.routing_number = None
+        self.sec_code = None
+        self.ssn_last_4 = None
+        self.token = None
+
     def charge(self, amount=None):
         """
         Creates a charge (sale) against the payment method.
@@ -8,10 +8,14 @@ from globalpayments.api.entities.exceptions import ApiException
 
 
 class GiftCard(object):
+    __slots__ = ("pin", "value_type", "value")
+
     payment_method_type = PaymentMethodType.Gift
-    pin = None
-    value_type = None
-    value = None
+
+    def __init__(self):
+        self.pin = None
+        self.value_type = None
+        self.value = None
 
     @property
     def alias(self):
@@ -1,6 +1,15 @@
 class TransactionReference(object):
-    auth_code = None
-    client_transaction_id = None
-    order_id = None
-    payment_method_type = None
-    transaction_id = None
+    __slots__ = (
+        "auth_code",
+        "client_transaction_id",
+        "order_id",
+        "payment_method_type",
+        "transaction_id",
+    )
+
+    def __init__(self):
+        self.auth_code = None
+        self.client_transaction_id = None
+        self.order_id = None
+        self.payment_method_type = None
+        self.transaction_id = None
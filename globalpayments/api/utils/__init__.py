@@ -15,11 +15,11 @@ class ElementTree(object):
     """
 
     doc = None
-    namespaces = {}
+    namespaces = None
 
     def __init__(self):
         self.doc = minidom.Document()
-        self.namespaces["soap"] = "http://schemas.xmlsoap.org/soap/envelope/"
+        self.namespaces = {"soap": "http://schemas.xmlsoap.org/soap/envelope/"}
 
     def element(self, tag_name):
         """
@@ -225,6 +225,14 @@ class GenerationUtils(object):
             .replace("/", "_")
         )
 
+    @staticmethod
+    def generate_client_transaction_id():
+        """
+        Generates a pseudo-random Portico client transaction id
+        """
+
+        return str(uuid.uuid4().int >> 65)
+
     @staticmethod
     def generate_recurring_key():
         """
@@ -0,0 +1,214 @@
+"""
+Writes request XML directly into a buffer
+"""
+
+import xml.etree.cElementTree as et
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _escape_text(text):
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _escape_attribute(value):
+    value = _escape_text(value)
+    if '"' in value:
+        value = value.replace('"', "&quot;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    if "\n" in value:
+        value = value.replace("\n", "&#10;")
+    if "\t" in value:
+        value = value.replace("\t", "&#09;")
+    return value
+
+
+def _check_name(name):
+    if not isinstance(name, str) or name[:1] == "{":
+        raise _Unsupported()
+    return name
+
+
+def _check_value(value):
+    if not isinstance(value, str):
+        raise _Unsupported()
+    return value
+
+
+def raw_element(data):
+    """
+    Creates a placeholder element standing for already serialized XML,
+    which `XmlWriter` writes as-is. Like `xml.etree.ElementTree.Comment`,
+    the placeholder's tag is this function; trees holding one can only be
+    serialized with `XmlWriter`.
+
+    :param data: The serialized XML, as str or ASCII bytes
+    :return: xml.etree.ElementTree.Element
+    """
+
+    element = et.Element(raw_element)
+    element.text = data.decode("ascii") if isinstance(data, bytes) else data
+    return element
+
+
+class XmlWriter(object):
+    """
+    Serializes XML straight into a buffer of string fragments.
+
+    Output matches `xml.etree.ElementTree.tostring`: text and attribute
+    values are escaped the same way, childless elements without text are
+    written as `<tag />` and non-ASCII characters become character
+    references.
+    """
+
+    def __init__(self):
+        self._parts = []
+        #  Number of parts written when the last `start` finished
+        self._started = None
+
+    def start(self, tag, attrib=None):
+        """
+        Opens an element.
+
+        :param tag: Element name
+        :param attrib: Optional dict of attribute names to values
+        """
+
+        self._parts.append(self._open_tag(tag, attrib))
+        self._parts.append(">")
+        self._started = len(self._parts)
+
+    def end(self, tag):
+        """
+        Closes an element opened with `start`. Like ElementTree, an element
+        closed right after it was opened is written as `<tag />`.
+
+        :param tag: Element name
+        """
+
+        if self._started == len(self._parts):
+            self._parts[-1] = " />"
+            self._started = None
+        else:
+            self._parts.append("</" + tag + ">")
+
+    def element(self, tag, text=None, attrib=None):
+        """
+        Writes a complete element without children.
+
+        :param tag: Element name
+        :param text: Optional text content; converted with `str`
+        :param attrib: Optional dict of attribute names to values
+        """
+
+        opening = self._open_tag(tag, attrib)
+        if text is None or text == "":
+            self._parts.append(opening + " />")
+        else:
+            self._parts.append(
+                opening + ">" + _escape_text(str(text)) + "</" + tag + ">"
+            )
+
+    def tree(self, element):
+        """
+        Writes an `xml.etree` element and its descendants.
+
+        :param element: The element
+        """
+
+        parts = []
+        try:
+            self._write_tree(parts.append, element)
+        except _Unsupported:
+            # qualified names and comments need the full ElementTree
+            # serializer; it also raises the usual errors for bad values
+            parts = [et.tostring(element).decode("ascii")]
+        self._parts.extend(parts)
+
+    def raw(self, data):
+        """
+        Writes already serialized XML.
+
+        :param data: str or ASCII bytes
+        """
+
+        if isinstance(data, bytes):
+            data = data.decode("ascii")
+        self._parts.append(data)
+
+    def getvalue(self):
+        """
+        Gets the document written so far.
+
+        :return: bytes
+        """
+
+        return "".join(self._parts).encode("ascii", "xmlcharrefreplace")
+
+    @staticmethod
+    def _open_tag(tag, attrib):
+        if not attrib:
+            return "<" + tag
+        return (
+            "<"
+            + tag
+            + "".join(
+                ' {}="{}"'.format(name, _escape_attribute(str(value)))
+                for name, value in attrib.items()
+            )
+        )
+
+    def _write_tree(self, write, element):
+        tag = element.tag
+        text = element.text
+        if tag is raw_element:
+            write(text)
+            return
+        if tag is None:
+            if text:
+                write(_escape_text(_check_value(text)))
+            for child in element:
+                self._write_tree(write, child)
+        else:
+            write("<" + _check_name(tag))
+            for name, value in element.items():
+                write(
+                    " "
+                    + _check_name(name)
+                    + '="'
+                    + _escape_attribute(_check_value(value))
+                    + '"'
+                )
+            if text or len(element):
+                write(">")
+                if text:
+                    write(_escape_text(_check_value(text)))
+                for child in element:
+                    self._write_tree(write, child)
+                write("</" + tag + ">")
+            else:
+                write(" />")
+        if element.tail:
+            write(_escape_text(_check_value(element.tail)))
+
+
+def tostring(element):
+    """
+    Serializes an `xml.etree` element like `xml.etree.ElementTree.tostring`.
+
+    :param element: The element
+    :return: bytes
+    """
+
+    writer = XmlWriter()
+    writer.tree(element)
+    return writer.getvalue()
@@ -887,7 +887,7 @@ class IntegrationGatewaysPorticoConnectorCertificationEcommerceTests(unittest.Te
         response = (
             card.charge(17.01)
             .with_currency("USD")
-            .with_modifier(TransactionModifier.Offline)
+            .with_transaction_modifier(TransactionModifier.Offline)
             .with_offline_auth_code("654321")
             .with_invoice_number("123456")
             .with_allow_duplicates(True)
@@ -903,7 +903,7 @@ class IntegrationGatewaysPorticoConnectorCertificationEcommerceTests(unittest.Te
         response = (
             card.authorize(17.10)
             .with_currency("USD")
-            .with_modifier(TransactionModifier.Offline)
+            .with_transaction_modifier(TransactionModifier.Offline)
             .with_offline_auth_code("654321")
             .with_invoice_number("123456")
             .with_allow_duplicates(True)
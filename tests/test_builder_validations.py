@@ -4,6 +4,9 @@ Test builder validations
 
 import unittest
 from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.builders import AuthorizationBuilder, ManagementBuilder
+from globalpayments.api.builders.validations import Validations
+from globalpayments.api.entities.enums import TransactionType
 from globalpayments.api.entities.exceptions import BuilderException
 from globalpayments.api.payment_methods import CreditCardData
 
@@ -77,3 +80,56 @@ class AuthorizationBuilderValidationTests(unittest.TestCase):
             self.card.authorize(14).with_currency("USD").with_offline_auth_code(
                 None
             ).execute()
+
+
+class ValidationRulesTests(unittest.TestCase):
+    """
+    Ensure validation rules are set up once per builder class
+    """
+
+    def validate(self, builder):
+        builder.validations.validate(builder)
+
+    def test_rules_are_shared_by_class(self):
+        sale = AuthorizationBuilder(TransactionType.Sale)
+        refund = AuthorizationBuilder(TransactionType.Refund)
+        capture = ManagementBuilder(TransactionType.Capture)
+
+        self.assertIs(sale.validations, refund.validations)
+        self.assertIsNot(sale.validations, capture.validations)
+
+    def test_rules_by_transaction_type(self):
+        with self.assertRaises(BuilderException):
+            self.validate(AuthorizationBuilder(TransactionType.Sale))
+        self.validate(AuthorizationBuilder(TransactionType.Verify))
+        self.validate(
+            AuthorizationBuilder(TransactionType.Sale, CreditCardData())
+            .with_amount(10)
+            .with_currency("USD")
+        )
+
+    def test_constraints_and_preconditions(self):
+        offline = (
+            AuthorizationBuilder(TransactionType.Auth, CreditCardData())
+            .with_amount(10)
+            .with_currency("USD")
+        )
+        self.validate(offline)
+        with self.assertRaises(BuilderException):
+            self.validate(offline.with_offline_auth_code(None))
+
+        refund = ManagementBuilder(TransactionType.Refund)
+        self.validate(refund)
+        with self.assertRaises(BuilderException):
+            self.validate(refund.with_amount(10))
+        self.validate(refund.with_currency("USD"))
+
+    def test_new_rules_are_applied(self):
+        builder = AuthorizationBuilder(TransactionType.Verify)
+        self.validate(builder)
+
+        validations = Validations()
+        validations.validate(builder)
+        validations.of(TransactionType.Verify).check("cvn").is_not_none()
+        with self.assertRaises(BuilderException):
+            validations.validate(builder)
@@ -0,0 +1,66 @@
+"""
+Test the generated builder setters
+"""
+
+import copy
+import unittest
+
+from globalpayments.api.builders import (
+    AuthorizationBuilder,
+    ManagementBuilder,
+    TransactionReportBuilder,
+)
+from globalpayments.api.entities import Address
+from globalpayments.api.entities.enums import ReportType, TransactionType
+from globalpayments.api.payment_methods import TransactionReference
+
+
+class BuilderSetterTests(unittest.TestCase):
+    def test_setters_are_generated(self):
+        builder = AuthorizationBuilder(TransactionType.Sale)
+
+        self.assertIs(builder, builder.with_amount(10).with_currency("USD"))
+        self.assertEqual((10, "USD"), (builder.amount, builder.currency))
+        self.assertIn("with_amount", vars(AuthorizationBuilder))
+        self.assertEqual(
+            "AuthorizationBuilder.with_amount",
+            AuthorizationBuilder.with_amount.__qualname__,
+        )
+
+    def test_inherited_attributes(self):
+        builder = ManagementBuilder(TransactionType.Capture).with_transaction_modifier(
+            None
+        )
+
+        self.assertIsNone(builder.transaction_modifier)
+        report = TransactionReportBuilder(ReportType.Activity).with_columnar(True)
+        self.assertTrue(report.columnar)
+
+    def test_defined_setters_are_kept(self):
+        address = Address()
+        builder = AuthorizationBuilder(TransactionType.Sale).with_address(address)
+        self.assertIs(address, builder.billing_address)
+
+        builder = AuthorizationBuilder(TransactionType.Refund).with_transaction_id("1")
+        self.assertIsInstance(builder.payment_method, TransactionReference)
+        self.assertEqual("1", builder.payment_method.transaction_id)
+        self.assertNotIn("with_transaction_id", vars(ManagementBuilder))
+
+    def test_unknown_properties_fail(self):
+        builder = AuthorizationBuilder(TransactionType.Sale)
+
+        with self.assertRaises(AttributeError):
+            builder.with_ammount(10)
+        with self.assertRaises(AttributeError):
+            builder.with_validations
+        with self.assertRaises(AttributeError):
+            builder.with_execute
+
+    def test_copy(self):
+        builder = AuthorizationBuilder(TransactionType.Sale).with_amount(10)
+
+        self.assertEqual(10, copy.copy(builder).amount)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Test the gateway circuit breaker
+"""
+
+import time
+import unittest
+
+from globalpayments.api.entities.enums import CircuitBreakerState
+from globalpayments.api.entities.exceptions import (
+    CircuitBreakerOpenException,
+    GatewayException,
+)
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(
+            "https://gateway", window_size=4, minimum_calls=4, open_duration=50
+        )
+
+    def fail(self, times):
+        for _ in range(times):
+            self.breaker.acquire()
+            self.breaker.record_failure(0.01)
+
+    def succeed(self, times):
+        for _ in range(times):
+            self.breaker.acquire()
+            self.breaker.record_success(0.01)
+
+    def test_opens_on_failure_rate(self):
+        self.succeed(2)
+        self.fail(1)
+        self.assertEqual(CircuitBreakerState.Closed, self.breaker.state)
+
+        self.fail(1)
+        self.assertEqual(CircuitBreakerState.Open, self.breaker.state)
+        with self.assertRaises(CircuitBreakerOpenException) as context:
+            self.breaker.acquire()
+        self.assertEqual("https://gateway", context.exception.service_url)
+
+    def test_opens_on_slow_calls(self):
+        breaker = CircuitBreaker(
+            slow_call_duration=100, slow_call_rate_threshold=0.5, minimum_calls=2
+        )
+        breaker.record_success(0.5)
+        breaker.record_success(0.5)
+        self.assertEqual(CircuitBreakerState.Open, breaker.state)
+
+    def test_half_open_probes(self):
+        self.fail(4)
+        time.sleep(0.1)
+        self.assertEqual(CircuitBreakerState.HalfOpen, self.breaker.state)
+
+        for _ in range(3):
+            self.breaker.acquire()
+        with self.assertRaises(CircuitBreakerOpenException):
+            self.breaker.acquire()
+
+        for _ in range(3):
+            self.breaker.record_success(0.01)
+        self.assertEqual(CircuitBreakerState.Closed, self.breaker.state)
+
+    def test_half_open_failure_reopens(self):
+        self.fail(4)
+        time.sleep(0.1)
+        self.fail(1)
+        self.assertEqual(CircuitBreakerState.Open, self.breaker.state)
+
+    def test_registry_shares_breakers_by_url(self):
+        registry = CircuitBreakerRegistry()
+        self.assertIs(registry.get("https://a"), registry.get("https://a"))
+        self.assertIsNot(registry.get("https://a"), registry.get("https://b"))
+        self.assertEqual(
+            {
+                "https://a": CircuitBreakerState.Closed,
+                "https://b": CircuitBreakerState.Closed,
+            },
+            registry.states(),
+        )
+
+
+class ConnectorCircuitBreakerTests(unittest.TestCase):
+    def test_connector_fails_fast_once_open(self):
+        connector = PorticoConnector()
+        connector.service_url = "http://127.0.0.1:1"
+        connector.timeout = 1000
+        connector.circuit_breakers = CircuitBreakerRegistry(
+            lambda url: CircuitBreaker(url, window_size=2, minimum_calls=2)
+        )
+
+        for _ in range(2):
+            # refused connections count as failures
+            with self.assertRaises(GatewayException):
+                connector.do_transaction(b"<request />")
+        with self.assertRaises(CircuitBreakerOpenException):
+            connector.do_transaction(b"<request />")
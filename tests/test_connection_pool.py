@@ -0,0 +1,162 @@
+"""
+Test per-configuration connection pools
+"""
+
+import asyncio
+import os
+import socket
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.gateways import HTTP, PorticoConnector
+from globalpayments.api.gateways.connection_pool import _POOLS, ConnectionPool
+from globalpayments.api.gateways.timeout_reversal import TimeoutReversalEngine
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.server.daemon_threads = True
+        self.server.connections = set()
+        self.url = "http://127.0.0.1:{}/".format(self.server.server_address[1])
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        pool = ConnectionPool()
+        for _ in range(3):
+            self.assertEqual(b"ok", pool.request("GET", self.url).data)
+        pool.clear()
+
+        self.assertEqual(1, len(self.server.connections))
+
+    def test_idle_connections_are_evicted(self):
+        pool = ConnectionPool(idle_timeout=50)
+        pool.request("GET", self.url)
+        time.sleep(0.1)
+        pool.request("GET", self.url)
+        pool.clear()
+
+        self.assertEqual(2, len(self.server.connections))
+
+    def test_tcp_keep_alive(self):
+        pool = ConnectionPool()
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool._get_socket_options()
+        )
+
+        pool = ConnectionPool(tcp_keep_alive=False)
+        self.assertNotIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool._get_socket_options()
+        )
+
+    def test_reconfigure_closes_replaced_pool(self):
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.service_url = self.url
+        ServicesContainer.configure(config, "reconfigured")
+        first = ServicesContainer.instance().get_client("reconfigured").connection_pool
+        first.request("GET", self.url)
+
+        async def reconfigure():
+            await first.request_async("GET", self.url)
+            (host_pool,) = first.async_client._pools[
+                asyncio.get_running_loop()
+            ].values()
+            self.assertEqual(1, len(host_pool.idle))
+            ServicesContainer.configure(config, "reconfigured")
+            return host_pool
+
+        host_pool = asyncio.run(reconfigure())
+
+        second = ServicesContainer.instance().get_client("reconfigured").connection_pool
+        self.assertIsNot(first, second)
+        self.assertEqual(0, len(first.manager.pools))
+        self.assertEqual(0, len(host_pool.idle))
+        self.assertNotIn(first, _POOLS)
+        self.assertIn(second, _POOLS)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_pools_are_rebuilt_after_fork(self):
+        pool = ConnectionPool()
+        pool.request("GET", self.url)
+        manager = pool.manager
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if pool.manager is not manager else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, os.waitstatus_to_exitcode(status))
+        self.assertIs(manager, pool.manager)
+        pool.clear()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_thread_pools_are_replaced_after_fork(self):
+        connector = PorticoConnector()
+        hedge_executor = connector._get_hedge_executor()
+        engine = TimeoutReversalEngine()
+        executors = (hedge_executor, engine._executor)
+        for executor in executors:
+            executor.submit(int).result()
+
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                for executor in (connector._get_hedge_executor(), engine._executor):
+                    if executor in executors:
+                        code = 1
+                    else:
+                        executor.submit(int).result(timeout=5)
+            except BaseException:
+                code = 2
+            os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, os.waitstatus_to_exitcode(status))
+        self.assertIs(hedge_executor, connector._get_hedge_executor())
+        engine.shutdown()
+        hedge_executor.shutdown()
+
+
+class ConfiguredPoolTests(unittest.TestCase):
+    def test_configure_creates_pool(self):
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.service_url = "https://cert.api2.heartlandportico.com"
+        config.max_connections = 25
+        config.pool_block = True
+        config.pool_idle_timeout = 30000
+        ServicesContainer.configure(config, "pooled")
+
+        connector = ServicesContainer.instance().get_client("pooled")
+        pool = connector.connection_pool
+        self.assertIsNot(HTTP, pool)
+        self.assertEqual(25, pool.max_connections)
+        self.assertTrue(pool.block)
+        self.assertEqual(30.0, pool.manager.idle_timeout)
+        self.assertIs(
+            pool,
+            ServicesContainer.instance().get_recurring_client("pooled").connection_pool,
+        )
@@ -0,0 +1,148 @@
+"""
+Test country lookups
+"""
+
+import unittest
+
+from globalpayments.api.entities import Address
+from globalpayments.api.entities.address import CountryUtils
+
+SPELLINGS = (
+    "United States",
+    "united states",
+    "USA",
+    "Deutschland",
+    "Holland",
+    "Phillipines",
+    "Korea",
+    "Canda",
+    "Cote d'Ivoire",
+    "niger",
+    "Niger",
+    "xyz",
+    "",
+)
+
+
+def baseline_fuzzy_score(term, query):
+    """
+    The original nested-loop scoring, kept to check the index against
+    """
+
+    term = term.lower()
+    score = 0
+    previous = -1
+    for query_char in query.lower():
+        for term_index, term_char in enumerate(term):
+            if query_char == term_char:
+                score += 1
+                if previous + 1 == term_index:
+                    score += 2
+                previous = term_index
+    return score
+
+
+def baseline_fuzzy_match(dictionary, query, significant_match):
+    rvalue = None
+    matches = {}
+    high_score = -1
+    for key in dictionary:
+        score = baseline_fuzzy_score(key, query)
+        if score > significant_match and score > high_score:
+            matches = {}
+            high_score = score
+            rvalue = dictionary[key]
+            matches[key] = rvalue
+        elif score == high_score:
+            matches[key] = dictionary[key]
+    if len(matches) > 1:
+        return None
+    return rvalue
+
+
+def baseline_country_code(country):
+    if country in CountryUtils.country_code_map_by_country:
+        return CountryUtils.country_code_map_by_country[country]
+    match = baseline_fuzzy_match(
+        CountryUtils.country_code_map_by_country,
+        country,
+        CountryUtils.significant_country_match,
+    )
+    if match is None and len(country) <= 3:
+        match = baseline_fuzzy_match(
+            CountryUtils.country_map_by_country_code,
+            country,
+            CountryUtils.significant_code_match,
+        )
+    return match
+
+
+def baseline_country(country_code):
+    if country_code in CountryUtils.country_map_by_country_code:
+        return CountryUtils.country_map_by_country_code[country_code]
+    if len(country_code) > 3:
+        return None
+    return baseline_fuzzy_match(
+        CountryUtils.country_map_by_country_code,
+        country_code,
+        CountryUtils.significant_code_match,
+    )
+
+
+class CountryUtilsTests(unittest.TestCase):
+    def test_fuzzy_score(self):
+        self.assertEqual(9, CountryUtils.fuzzy_score("Canada", "can"))
+        self.assertEqual(6, CountryUtils.fuzzy_score("abcab", "AB"))
+        self.assertEqual(0, CountryUtils.fuzzy_score("Peru", "xyz"))
+        self.assertIsNone(CountryUtils.fuzzy_score(None, "xyz"))
+        for term in ("Canada", "abcab", "Peru", "Cote d'Ivoire"):
+            for query in ("can", "AB", "xyz", "ivory", "a"):
+                self.assertEqual(
+                    baseline_fuzzy_score(term, query),
+                    CountryUtils.fuzzy_score(term, query),
+                )
+
+    def test_lookups_match_baseline(self):
+        names = list(CountryUtils.country_code_map_by_country)
+        codes = list(CountryUtils.country_map_by_country_code)
+        spellings = list(SPELLINGS)
+        spellings.extend(name.lower() for name in names)
+        spellings.extend(name[:5] for name in names)
+        spellings.extend(code.lower() for code in codes)
+
+        for spelling in spellings:
+            self.assertEqual(
+                baseline_country_code(spelling),
+                CountryUtils.get_country_code_by_country(spelling),
+                spelling,
+            )
+        for code in SPELLINGS + tuple(code.lower() for code in codes):
+            self.assertEqual(
+                baseline_country(code),
+                CountryUtils.get_country_by_country_code(code),
+                code,
+            )
+
+    def test_lookups(self):
+        self.assertEqual(
+            "US", CountryUtils.get_country_code_by_country("United States of America")
+        )
+        self.assertEqual("PH", CountryUtils.get_country_code_by_country("Phillipines"))
+        self.assertEqual("NE", CountryUtils.get_country_code_by_country("Niger"))
+        self.assertIsNone(CountryUtils.get_country_code_by_country("xyz"))
+        self.assertEqual("Canada", CountryUtils.get_country_by_country_code("CA"))
+        self.assertIsNone(CountryUtils.get_country_by_country_code("us"))
+
+    def test_results_are_cached(self):
+        match = CountryUtils._country_index.match
+        Address().country = "Phillipines"
+        hits = match.cache_info().hits
+
+        address = Address()
+        address.country = "PHILLIPINES"
+        self.assertEqual("PH", address.country_code)
+        self.assertEqual(hits + 1, match.cache_info().hits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Test endpoint failover and hedged read-only requests
+"""
+
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from globalpayments.api.builders import AuthorizationBuilder, ReportBuilder
+from globalpayments.api.entities.enums import ReportType, TransactionType
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.endpoint_selector import EndpointSelector
+
+
+class SlowFirstHandler(BaseHTTPRequestHandler):
+    """
+    Stalls the first request it receives and answers the rest at once
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.requests += 1
+            first = self.server.requests == 1
+        if first:
+            time.sleep(1)
+
+        body = b"slow" if first else b"fast"
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # the client kept the hedged response and closed this one
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class EndpointSelectorTests(unittest.TestCase):
+    def setUp(self):
+        self.selector = EndpointSelector(["https://a", "https://b", "https://c"])
+
+    def test_configured_order_until_observed(self):
+        self.assertEqual(["https://a", "https://b", "https://c"], self.selector.rank())
+        self.assertEqual(
+            ["https://b", "https://c", "https://a"], self.selector.rank({"https://a"})
+        )
+
+    def test_prefers_faster_healthy_endpoint(self):
+        self.selector.record("https://a", 0.5, True)
+        self.selector.record("https://b", 0.1, True)
+        self.assertEqual("https://b", self.selector.rank()[0])
+
+        for _ in range(5):
+            self.selector.record("https://b", 0.01, False)
+        self.assertEqual("https://a", self.selector.rank()[0])
+
+    def test_hedge_delay_uses_p95(self):
+        self.assertIsNone(self.selector.hedge_delay("https://a"))
+        for index in range(1, 101):
+            self.selector.record("https://a", index / 1000.0, True)
+        self.assertAlmostEqual(0.095, self.selector.hedge_delay("https://a"))
+
+    def test_only_read_only_calls_are_hedged(self):
+        self.assertTrue(
+            self.selector.is_hedgeable(ReportBuilder(ReportType.TransactionDetail))
+        )
+        self.assertFalse(
+            self.selector.is_hedgeable(ReportBuilder(ReportType.OpenAuths))
+        )
+        self.assertFalse(
+            self.selector.is_hedgeable(AuthorizationBuilder(TransactionType.Sale))
+        )
+
+
+class ConnectorFailoverTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowFirstHandler)
+        self.server.daemon_threads = True
+        self.server.requests = 0
+        self.server.lock = threading.Lock()
+        self.url = "http://127.0.0.1:{}".format(self.server.server_port)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.connector = PorticoConnector()
+        self.connector.timeout = 5000
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fails_over_when_endpoint_is_unreachable(self):
+        self.server.requests = 1
+        self.connector.service_url = "http://127.0.0.1:1"
+        self.connector.endpoints = EndpointSelector(["http://127.0.0.1:1", self.url])
+
+        self.assertEqual(
+            b"fast",
+            self.connector.do_transaction(
+                b"<request />", AuthorizationBuilder(TransactionType.Sale)
+            ),
+        )
+        self.assertEqual(self.url, self.connector.endpoints.rank()[0])
+
+    def test_slow_read_only_call_is_hedged(self):
+        self.connector.service_url = self.url
+        self.connector.endpoints = EndpointSelector([self.url], minimum_samples=1)
+        self.connector.endpoints.record(self.url, 0.05, True)
+        self.connector.hedging_enabled = True
+
+        started = time.monotonic()
+        response = self.connector.do_transaction(
+            b"<request />", ReportBuilder(ReportType.Activity)
+        )
+
+        self.assertEqual(b"fast", response)
+        self.assertLess(time.monotonic() - started, 0.9)
+
+    def test_money_moving_call_is_not_hedged(self):
+        self.connector.service_url = self.url
+        self.connector.endpoints = EndpointSelector([self.url], minimum_samples=1)
+        self.connector.endpoints.record(self.url, 0.05, True)
+        self.connector.hedging_enabled = True
+
+        response = self.connector.do_transaction(
+            b"<request />", AuthorizationBuilder(TransactionType.Sale)
+        )
+        self.assertEqual(b"slow", response)
+
+
+class AsyncHedgingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_read_only_call_is_hedged(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowFirstHandler)
+        server.daemon_threads = True
+        server.requests = 0
+        server.lock = threading.Lock()
+        url = "http://127.0.0.1:{}".format(server.server_port)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        connector = PorticoConnector()
+        connector.service_url = url
+        connector.endpoints = EndpointSelector([url], minimum_samples=1)
+        connector.endpoints.record(url, 0.05, True)
+        connector.hedging_enabled = True
+
+        try:
+            started = time.monotonic()
+            response = await connector.do_transaction_async(
+                b"<request />", ReportBuilder(ReportType.Activity)
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(b"fast", response)
+        self.assertLess(time.monotonic() - started, 0.9)
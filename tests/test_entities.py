@@ -0,0 +1,99 @@
+"""
+Test the slotted response entities
+"""
+
+import copy
+import pickle
+import unittest
+
+from globalpayments.api.entities import (
+    Address,
+    BatchSummary,
+    DebitMac,
+    TransactionSummary,
+)
+from globalpayments.api.entities.enums import CvnPresenceIndicator, PaymentMethodType
+from globalpayments.api.payment_methods import (
+    CreditCardData,
+    CreditTrackData,
+    DebitTrackData,
+    EBTCardData,
+    EBTTrackData,
+    ECheck,
+    GiftCard,
+    TransactionReference,
+)
+
+
+class SlottedEntityTests(unittest.TestCase):
+    def test_attributes_default_to_none(self):
+        for cls in (
+            Address,
+            BatchSummary,
+            DebitMac,
+            TransactionReference,
+            TransactionSummary,
+        ):
+            with self.subTest(cls.__name__):
+                entity = cls()
+
+                self.assertFalse(hasattr(entity, "__dict__"))
+                for name in cls.__slots__:
+                    self.assertIsNone(getattr(entity, name))
+
+    def test_unknown_attribute_is_rejected(self):
+        with self.assertRaises(AttributeError):
+            TransactionSummary().authorised_amount = "10.00"
+
+    def test_property_setters(self):
+        address = Address()
+        address.state = "IN"
+        address.country_code = "US"
+        summary = TransactionSummary()
+        summary.authorizated_amount = "10.00"
+        card = GiftCard()
+        card.alias = "9725550100"
+
+        self.assertEqual("IN", address.province)
+        self.assertEqual("United States of America", address.country)
+        self.assertEqual("10.00", summary.authorized_amount)
+        self.assertEqual("Alias", card.value_type)
+        self.assertEqual(PaymentMethodType.Gift, card.payment_method_type)
+
+    def test_payment_methods(self):
+        for cls in (
+            CreditCardData,
+            CreditTrackData,
+            DebitTrackData,
+            EBTCardData,
+            EBTTrackData,
+            ECheck,
+        ):
+            with self.subTest(cls.__name__):
+                self.assertFalse(hasattr(cls(), "__dict__"))
+
+        card = CreditCardData()
+        self.assertEqual("Unknown", card.card_type)
+        self.assertEqual(CvnPresenceIndicator.NotRequested, card.cvn_presence_indicator)
+        self.assertTrue(card.is_card_data)
+        self.assertFalse(card.is_track_data)
+        self.assertTrue(CreditTrackData().is_track_data)
+        self.assertFalse(EBTTrackData().is_card_data)
+        with self.assertRaises(AttributeError):
+            card.card_number = "4111111111111111"
+
+        card.number = "4111 1111 1111 1111"
+        card.cvn = "123"
+        clone = copy.deepcopy(card)
+        self.assertEqual("4111111111111111", clone.number)
+        self.assertEqual("Visa", clone.card_type)
+        self.assertEqual(CvnPresenceIndicator.Present, clone.cvn_presence_indicator)
+
+    def test_pickle(self):
+        reference = TransactionReference()
+        reference.transaction_id = "1234567890"
+
+        copy = pickle.loads(pickle.dumps(reference))
+
+        self.assertEqual("1234567890", copy.transaction_id)
+        self.assertIsNone(copy.auth_code)
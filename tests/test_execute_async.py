@@ -0,0 +1,254 @@
+"""
+Test the asyncio execution path
+"""
+
+import asyncio
+import unittest
+
+from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.entities.exceptions import (
+    GatewayException,
+    GatewayTimeoutException,
+)
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.async_http import (
+    AsyncHttpClient,
+    ResponseInterruptedError,
+)
+from globalpayments.api.payment_methods import CreditCardData
+
+CREDIT_SALE_RESPONSE = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    b"<soap:Body>"
+    b'<PosResponse rootUrl="https://cert.api2.heartlandportico.com/Hps.Exchange.PosGateway"'
+    b' xmlns="http://Hps.Exchange.PosGateway">'
+    b"<Ver1.0><Header><LicenseId>1</LicenseId><SiteId>1</SiteId><DeviceId>1</DeviceId>"
+    b"<GatewayTxnId>1234567890</GatewayTxnId><GatewayRspCode>0</GatewayRspCode>"
+    b"<GatewayRspMsg>Success</GatewayRspMsg></Header>"
+    b"<Transaction><CreditSale><RspCode>00</RspCode><RspText>APPROVAL</RspText>"
+    b"<AuthCode>12345A</AuthCode><AVSRsltCode>0</AVSRsltCode><RefNbr>000000000001</RefNbr>"
+    b"<CardType>Visa</CardType><AVSRsltText>AVS Not Requested.</AVSRsltText>"
+    b"</CreditSale></Transaction></Ver1.0></PosResponse></soap:Body></soap:Envelope>"
+)
+
+
+class LocalHttpServer(object):
+    """
+    Keep-alive HTTP/1.1 server answering every request with a fixed body.
+    From request number `truncate_from` on, it sends the status line, the
+    headers and part of the body, then drops the connection. A
+    `single_use` server drops each connection without answering its
+    second request.
+    """
+
+    def __init__(self, body, chunked=False, truncate_from=None, single_use=False):
+        self.body = body
+        self.chunked = chunked
+        self.truncate_from = truncate_from
+        self.single_use = single_use
+        self.connections = 0
+        self.requests = []
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return "http://127.0.0.1:{}".format(self.server.sockets[0].getsockname()[1])
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        answered = 0
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                self.requests.append(head + await reader.readexactly(length))
+
+                if self.single_use and answered:
+                    break
+                answered += 1
+                if (
+                    self.truncate_from is not None
+                    and len(self.requests) > self.truncate_from
+                ):
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s"
+                        % (len(self.body) + 93, self.body[:7])
+                    )
+                    await writer.drain()
+                    break
+                if self.chunked:
+                    half = len(self.body) // 2
+                    payload = b"".join(
+                        b"%x\r\n%s\r\n" % (len(part), part)
+                        for part in (self.body[:half], self.body[half:])
+                    )
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                        + payload
+                        + b"0\r\n\r\n"
+                    )
+                else:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s"
+                        % (len(self.body), self.body)
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class AsyncHttpClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_connections_are_reused(self):
+        server = LocalHttpServer(b"hello")
+        url = await server.start()
+        client = AsyncHttpClient()
+
+        try:
+            for _ in range(3):
+                response = await client.request("POST", url + "/path", {}, b"body")
+                self.assertEqual(200, response.status_code)
+                self.assertEqual(b"hello", response.raw_response)
+        finally:
+            client.close()
+            await server.stop()
+
+        self.assertEqual(1, server.connections)
+        self.assertEqual(3, len(server.requests))
+        self.assertTrue(server.requests[0].startswith(b"POST /path HTTP/1.1\r\n"))
+        self.assertTrue(server.requests[0].endswith(b"\r\n\r\nbody"))
+
+    async def test_chunked_response(self):
+        server = LocalHttpServer(b"chunked response body", chunked=True)
+        url = await server.start()
+        client = AsyncHttpClient()
+
+        try:
+            response = await client.request("GET", url, {})
+        finally:
+            client.close()
+            await server.stop()
+
+        self.assertEqual(b"chunked response body", response.raw_response)
+
+    async def test_request_is_resent_on_closed_idle_connection(self):
+        server = LocalHttpServer(b"hello", single_use=True)
+        url = await server.start()
+        client = AsyncHttpClient()
+
+        try:
+            for _ in range(2):
+                response = await client.request("POST", url, {}, b"body")
+                self.assertEqual(b"hello", response.raw_response)
+        finally:
+            client.close()
+            await server.stop()
+
+        self.assertEqual(2, server.connections)
+
+    async def test_interrupted_response_is_not_resent(self):
+        server = LocalHttpServer(b"hello", truncate_from=1)
+        url = await server.start()
+        client = AsyncHttpClient()
+
+        try:
+            response = await client.request("POST", url, {}, b"first")
+            self.assertEqual(b"hello", response.raw_response)
+            with self.assertRaises(ResponseInterruptedError):
+                await client.request("POST", url, {}, b"second")
+        finally:
+            client.close()
+            await server.stop()
+
+        self.assertEqual(2, len(server.requests))
+
+
+class ExecuteAsyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_credit_sale_execute_async(self):
+        server = LocalHttpServer(CREDIT_SALE_RESPONSE)
+        url = await server.start()
+
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.service_url = url
+        ServicesContainer.configure(config, "async")
+
+        card = CreditCardData()
+        card.number = "4111111111111111"
+        card.exp_month = "12"
+        card.exp_year = "2025"
+        card.cvn = "123"
+
+        try:
+            responses = await asyncio.gather(
+                *[
+                    card.charge(10)
+                    .with_currency("USD")
+                    .with_allow_duplicates(True)
+                    .execute_async("async")
+                    for _ in range(5)
+                ]
+            )
+        finally:
+            await server.stop()
+
+        self.assertEqual(5, len(server.requests))
+        self.assertIn(b"<CreditSale>", server.requests[0])
+        for response in responses:
+            self.assertEqual("00", response.response_code)
+            self.assertEqual("1234567890", response.transaction_id)
+            self.assertEqual("12345A", response.authorization_code)
+
+    async def test_interrupted_sale_is_not_resent(self):
+        server = LocalHttpServer(CREDIT_SALE_RESPONSE, truncate_from=1)
+        url = await server.start()
+
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.service_url = url
+        ServicesContainer.configure(config, "async_interrupted")
+
+        card = CreditCardData()
+        card.number = "4111111111111111"
+        card.exp_month = "12"
+        card.exp_year = "2025"
+
+        def sale():
+            return (
+                card.charge(10)
+                .with_currency("USD")
+                .with_allow_duplicates(True)
+                .execute_async("async_interrupted")
+            )
+
+        try:
+            response = await sale()
+            self.assertEqual("00", response.response_code)
+            with self.assertRaises(GatewayTimeoutException) as context:
+                await sale()
+        finally:
+            await server.stop()
+
+        self.assertTrue(context.exception.request_sent)
+        self.assertEqual(2, len(server.requests))
+
+    async def test_refused_connection(self):
+        connector = PorticoConnector()
+        connector.secret_api_key = "skapi_cert_test"
+        connector.service_url = "http://127.0.0.1:1"
+        connector.timeout = 1000
+
+        with self.assertRaises(GatewayException) as context:
+            await connector.do_transaction_async(b"<request />")
+
+        self.assertNotIsInstance(context.exception, GatewayTimeoutException)
+        self.assertFalse(context.exception.request_sent)
@@ -0,0 +1,97 @@
+"""
+Test declarative response field mapping
+"""
+
+import unittest
+
+from globalpayments.api import PorticoConfig
+from globalpayments.api.entities.enums import PaymentSchedule
+from globalpayments.api.entities.exceptions import ConfigurationException
+from globalpayments.api.gateways import PayPlanConnector, PorticoConnector
+from globalpayments.api.gateways.field_mapping import KEEP, Field, FieldMap
+from globalpayments.api.payment_methods import CreditCardData
+from tests.test_portico_response import CORPUS
+
+
+class Target(object):
+    kept = "unchanged"
+
+
+class FieldMapTests(unittest.TestCase):
+    def setUp(self):
+        self.fields = FieldMap(
+            Field("code", "RspCode", "IssuerRspCode", converter=str),
+            Field("status", "TxnStatus", ("Data", "TxnStatus")),
+            Field("kept", "Kept", default=KEEP),
+            Field("flag", "Flag", converter=lambda value: value == "true"),
+            default=None,
+        )
+
+    def test_sources_are_tried_in_order(self):
+        target = self.fields.apply(
+            Target(), {"IssuerRspCode": 5, "Data": {"TxnStatus": "A"}}
+        )
+
+        self.assertEqual("5", target.code)
+        self.assertEqual("A", target.status)
+        self.assertEqual("unchanged", target.kept)
+        self.assertIsNone(target.flag)
+
+    def test_subset_skips_other_fields(self):
+        target = self.fields.apply(
+            Target(), {"RspCode": "00", "TxnStatus": "A"}, only={"code"}
+        )
+
+        self.assertEqual("00", target.code)
+        self.assertFalse(hasattr(target, "status"))
+
+    def test_paths(self):
+        self.assertEqual(
+            (
+                ("RspCode",),
+                ("IssuerRspCode",),
+                ("TxnStatus",),
+                ("Data", "TxnStatus"),
+                ("Kept",),
+                ("Flag",),
+            ),
+            self.fields.paths,
+        )
+
+
+class ConnectorFieldMappingTests(unittest.TestCase):
+    def test_portico_response_fields_subset(self):
+        connector = PorticoConnector()
+        connector.response_fields = frozenset(["response_code", "token"])
+
+        result = connector._map_response(CORPUS["credit sale"], CreditCardData())
+
+        self.assertEqual("00", result.response_code)
+        self.assertEqual("supt_token", result.token)
+        self.assertEqual("12345A", result.authorization_code)
+        self.assertIsNone(result.avs_response_code)
+
+    def test_unknown_response_fields_are_rejected(self):
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.response_fields = ["response_code", "avs_code"]
+
+        with self.assertRaises(ConfigurationException):
+            config.validate()
+
+    def test_payplan_schedule(self):
+        schedule = PayPlanConnector()._hydrate_schedule(
+            {
+                "scheduleKey": "1",
+                "subtotalAmount": {"value": "1250", "currency": "USD"},
+                "processingDateInfo": "First",
+                "emailNotification": "Yes",
+            }
+        )
+
+        self.assertEqual("1", schedule.key)
+        self.assertEqual(12.5, schedule.amount)
+        self.assertEqual("USD", schedule.currency)
+        self.assertEqual(PaymentSchedule.FirstDayOfTheMonth, schedule.payment_schedule)
+        self.assertTrue(schedule.email_notification)
+        self.assertIsNone(schedule.has_started)
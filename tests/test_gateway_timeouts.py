@@ -0,0 +1,80 @@
+"""
+Test gateway timeout and deadline enforcement
+"""
+
+import socket
+import time
+import unittest
+
+from globalpayments.api.builders import ReportBuilder
+from globalpayments.api.entities.enums import ReportType
+from globalpayments.api.entities.exceptions import GatewayTimeoutException
+from globalpayments.api.gateways import PorticoConnector
+
+
+class StalledServer(object):
+    """
+    Accepts TCP connections but never answers
+    """
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.url = "http://127.0.0.1:{}".format(self.sock.getsockname()[1])
+
+    def close(self):
+        self.sock.close()
+
+
+class GatewayTimeoutTests(unittest.TestCase):
+    def setUp(self):
+        self.server = StalledServer()
+        self.connector = PorticoConnector()
+        self.connector.service_url = self.server.url
+        self.connector.timeout = 65000
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_read_timeout(self):
+        self.connector.read_timeout = 200
+
+        started = time.monotonic()
+        with self.assertRaises(GatewayTimeoutException):
+            self.connector.do_transaction(b"<request />")
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_deadline_caps_request(self):
+        builder = ReportBuilder(ReportType.Activity)
+        builder._set_deadline(200)
+
+        started = time.monotonic()
+        with self.assertRaises(GatewayTimeoutException):
+            self.connector.do_transaction(b"<request />", builder)
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_expired_deadline_fails_before_sending(self):
+        builder = ReportBuilder(ReportType.Activity)
+        builder.deadline = time.monotonic() - 1
+
+        with self.assertRaises(GatewayTimeoutException):
+            self.connector.do_transaction(b"<request />", builder)
+
+    def test_phase_timeouts_default_to_timeout(self):
+        self.connector.connect_timeout = 1000
+        self.assertEqual((1.0, 65.0, 65.0, 65.0), self.connector._get_timeout())
+
+
+class AsyncGatewayTimeoutTests(unittest.IsolatedAsyncioTestCase):
+    async def test_read_timeout(self):
+        server = StalledServer()
+        connector = PorticoConnector()
+        connector.service_url = server.url
+        connector.read_timeout = 200
+
+        try:
+            with self.assertRaises(GatewayTimeoutException):
+                await connector.do_transaction_async(b"<request />")
+        finally:
+            server.close()
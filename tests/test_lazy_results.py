@@ -0,0 +1,88 @@
+"""
+Test lazily mapped Portico results
+"""
+
+import unittest
+
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.portico_results import (
+    LazyTransaction,
+    LazyTransactionSummary,
+)
+from globalpayments.api.payment_methods import CreditCardData
+from tests.test_portico_response import CORPUS
+
+
+def public_fields(result):
+    return {
+        name: value for name, value in vars(result).items() if not name.startswith("_")
+    }
+
+
+def slot_fields(result):
+    return {name: getattr(result, name) for name in type(result).__slots__}
+
+
+class LazyTransactionTests(unittest.TestCase):
+    def setUp(self):
+        self.eager = PorticoConnector()
+        self.lazy = PorticoConnector()
+        self.lazy.lazy_responses = True
+
+    def test_fields_load_on_access(self):
+        result = self.lazy._map_response(CORPUS["credit sale"], CreditCardData())
+
+        self.assertIsInstance(result, LazyTransaction)
+        self.assertEqual({"response_values": {}}, public_fields(result))
+        self.assertEqual("00", result.response_code)
+        self.assertEqual("12345A", result.authorization_code)
+        self.assertNotIn("gift_card", vars(result))
+
+    def test_materialize_matches_eager_mapping(self):
+        for name, raw_response in CORPUS.items():
+            with self.subTest(name):
+                expected = self.eager._map_response(raw_response, CreditCardData())
+                result = self.lazy._map_response(raw_response, CreditCardData())
+
+                self.assertIs(result, result.materialize())
+                for field, value in public_fields(expected).items():
+                    if field in ("transaction_reference", "gift_card"):
+                        self.assertEqual(
+                            slot_fields(value), slot_fields(getattr(result, field))
+                        )
+                    elif field not in ("batch_summary", "debit_mac"):
+                        self.assertEqual(value, getattr(result, field), field)
+                self.assertIsNone(result._item)
+
+    def test_assignment_replaces_lazy_field(self):
+        result = self.lazy._map_response(CORPUS["credit sale"], None)
+        result.response_code = "XX"
+
+        self.assertEqual("XX", result.response_code)
+        self.assertIsNone(result.transaction_reference)
+
+    def test_response_fields_subset(self):
+        self.lazy.response_fields = frozenset(["token"])
+        result = self.lazy._map_response(CORPUS["credit sale"], None)
+
+        self.assertEqual("supt_token", result.token)
+        self.assertEqual("00", result.response_code)
+        self.assertIsNone(result.avs_response_code)
+
+
+class LazyTransactionSummaryTests(unittest.TestCase):
+    def test_summary(self):
+        connector = PorticoConnector()
+        connector.lazy_responses = True
+        item = {"GatewayRspCode": "0", "Status": "A", "GatewayTxnId": "1"}
+
+        summary = connector._hydrate_transaction_summary(item)
+
+        self.assertIsInstance(summary, LazyTransactionSummary)
+        self.assertEqual("00", summary.gateway_response_code)
+        self.assertEqual("A", summary.status)
+        self.assertIsNone(summary.amount)
+        self.assertEqual(
+            slot_fields(PorticoConnector()._hydrate_transaction_summary(item)),
+            slot_fields(summary.materialize()),
+        )
@@ -0,0 +1,96 @@
+"""
+Test the Portico SOAP envelope built from cached header bytes
+"""
+
+import unittest
+import xml.etree.cElementTree as et
+
+from globalpayments.api.gateways import PorticoConnector
+
+
+def legacy_envelope(connector, transaction, client_transaction_id=None):
+    """
+    Builds the envelope element by element, as the connector used to
+    """
+
+    envelope = et.Element(
+        "soap:Envelope", {"xmlns:soap": "http://schemas.xmlsoap.org/soap/envelope/"}
+    )
+    body = et.SubElement(envelope, "soap:Body")
+    request = et.SubElement(
+        body, "PosRequest", {"xmlns": "http://Hps.Exchange.PosGateway"}
+    )
+    version1 = et.SubElement(request, "Ver1.0")
+
+    header = et.SubElement(version1, "Header")
+    fields = (
+        ("SecretAPIKey", connector.secret_api_key),
+        ("SiteId", connector.site_id),
+        ("LicenseId", connector.license_id),
+        ("DeviceId", connector.device_id),
+        ("UserName", connector.username),
+        ("Password", connector.password),
+        ("DeveloperID", connector.developer_id),
+        ("VersionNbr", connector.version_number),
+        ("ClientTxnId", client_transaction_id),
+    )
+    for tag, value in fields:
+        if value is not None:
+            et.SubElement(header, tag).text = str(value)
+    et.SubElement(header, "SDKNameVersion").text = (
+        connector.sdkNameVersion or "python;version=0.0.0"
+    )
+
+    et.SubElement(version1, "Transaction").append(transaction)
+    return et.tostring(envelope)
+
+
+def credit_sale():
+    transaction = et.Element("CreditSale")
+    block1 = et.SubElement(transaction, "Block1")
+    et.SubElement(block1, "Amt").text = "10.00"
+    et.SubElement(block1, "CardHolderName").text = "Jöhn & <Doe>"
+    return transaction
+
+
+class PorticoEnvelopeTests(unittest.TestCase):
+    def setUp(self):
+        self.connector = PorticoConnector()
+        self.connector.site_id = 12345
+        self.connector.license_id = 54321
+        self.connector.device_id = 1
+        self.connector.username = "user&name"
+        self.connector.password = 'pa<ss>"word'
+        self.connector.developer_id = "002914"
+        self.connector.version_number = "3026"
+
+    def test_matches_element_tree_output(self):
+        for client_transaction_id in (None, "1234567890"):
+            self.assertEqual(
+                legacy_envelope(self.connector, credit_sale(), client_transaction_id),
+                self.connector._build_envelope(credit_sale(), client_transaction_id),
+            )
+
+    def test_secret_api_key_and_sdk_name(self):
+        connector = PorticoConnector()
+        connector.secret_api_key = "skapi_cert_ünïcode"
+        connector.sdkNameVersion = "php;version=1.0"
+
+        self.assertEqual(
+            legacy_envelope(connector, credit_sale(), 42),
+            connector._build_envelope(credit_sale(), 42),
+        )
+
+    def test_header_is_rendered_again_when_credentials_change(self):
+        first = self.connector._build_envelope(credit_sale())
+        self.assertIs(
+            self.connector._get_envelope_header()[0],
+            self.connector._get_envelope_header()[0],
+        )
+
+        self.connector.site_id = 99999
+        second = self.connector._build_envelope(credit_sale())
+
+        self.assertIn(b"<SiteId>12345</SiteId>", first)
+        self.assertIn(b"<SiteId>99999</SiteId>", second)
+        self.assertEqual(legacy_envelope(self.connector, credit_sale()), second)
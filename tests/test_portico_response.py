@@ -0,0 +1,161 @@
+"""
+Test the Portico response parser against xmltodict
+"""
+
+import enum
+import unittest
+from unittest import mock
+
+import xmltodict
+
+from globalpayments.api.entities.exceptions import GatewayException
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.portico_response import PorticoResponse, select
+from globalpayments.api.payment_methods import CreditCardData
+
+HEADER = (
+    "<Header><LicenseId>1</LicenseId><SiteId>1</SiteId><DeviceId>1</DeviceId>"
+    "<GatewayTxnId>1234567890</GatewayTxnId><GatewayRspCode>0</GatewayRspCode>"
+    "<GatewayRspMsg>Success</GatewayRspMsg>{}</Header>"
+)
+
+
+def envelope(transaction, header_extra=""):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+        '<soap:Body><PosResponse rootUrl="https://posgateway" '
+        'xmlns="http://Hps.Exchange.PosGateway">'
+        "<Ver1.0>{}{}</Ver1.0></PosResponse></soap:Body></soap:Envelope>".format(
+            HEADER.format(header_extra), transaction
+        )
+    ).encode()
+
+
+CORPUS = {
+    "credit sale": envelope(
+        "<Transaction><CreditSale><RspCode>00</RspCode><RspText>APPROVAL</RspText>"
+        "<AuthCode>12345A</AuthCode><AVSRsltCode>0</AVSRsltCode>"
+        "<AVSRsltText>AVS Not Requested.</AVSRsltText><CVVRsltCode>M</CVVRsltCode>"
+        "<CVVRsltText>Match.</CVVRsltText><RefNbr>123456789012</RefNbr>"
+        "<CardType>Visa</CardType><TxnDescriptor>A &amp; B</TxnDescriptor>"
+        "</CreditSale></Transaction>",
+        "<TokenData><TokenRspCode>0</TokenRspCode>"
+        "<TokenValue>supt_token</TokenValue></TokenData>",
+    ),
+    "void": envelope("<Transaction><CreditVoid /></Transaction>"),
+    "gift activate": envelope(
+        "<Transaction><GiftCardActivate><RspCode>0</RspCode>"
+        "<RspText>Success</RspText><BalanceAmt>10.00</BalanceAmt>"
+        "<CardData><CardNbr>5022440000000000098</CardNbr><Alias>9725550100</Alias>"
+        "<PIN>1234</PIN></CardData></GiftCardActivate></Transaction>"
+    ),
+    "batch close": envelope(
+        "<Transaction><BatchClose><BatchId>1</BatchId><TxnCnt>2</TxnCnt>"
+        "<TotalAmt>20.00</TotalAmt><BatchSeqNbr>3</BatchSeqNbr></BatchClose>"
+        "</Transaction>"
+    ),
+    "debit mac": envelope(
+        "<Transaction><DebitSale><RspCode>00</RspCode><DebitMac>"
+        "<TransactionCode>1</TransactionCode></DebitMac><MacKey>abc</MacKey>"
+        "<TraceNumber>42</TraceNumber></DebitSale></Transaction>"
+    ),
+    "pretty printed": envelope(
+        "\n  <Transaction>\n    <CreditAuth>\n      <RspCode>00</RspCode>\n"
+        "      <RspText>  APPROVAL  </RspText>\n      <AVSRsltText />\n"
+        "      <Amt currency='USD'>10.00</Amt>\n      <Tag>1</Tag>\n"
+        "      <Tag>2</Tag>\n    </CreditAuth>\n  </Transaction>\n"
+    ),
+}
+
+
+def legacy_parse(raw_response):
+    """
+    Extracts the header and transaction fields the way the connector
+    used to, with xmltodict
+    """
+
+    namespaces = {
+        "http://Hps.Exchange.PosGateway": None,
+        "http://schemas.xmlsoap.org/soap/envelope/": None,
+    }
+    root = xmltodict.parse(
+        raw_response, process_namespaces=True, namespaces=namespaces
+    )["Envelope"]["Body"]["PosResponse"]["Ver1.0"]
+    name, item = list(root["Transaction"].items())[0]
+    return root["Header"], name, item or {}
+
+
+def fields(value):
+    """
+    Gets the attributes of a mapped result and of the entities it holds
+    """
+
+    if isinstance(value, enum.Enum):
+        return value
+    names = getattr(type(value), "__slots__", None)
+    if names is None and hasattr(value, "__dict__"):
+        names = vars(value)
+    if names is None:
+        return value
+    return {name: fields(getattr(value, name)) for name in names}
+
+
+class PorticoResponseTests(unittest.TestCase):
+    def test_matches_xmltodict(self):
+        for name, raw_response in CORPUS.items():
+            with self.subTest(name):
+                header, transaction_name, item = legacy_parse(raw_response)
+                response = PorticoResponse.parse(raw_response)
+
+                self.assertEqual(header, response.header)
+                self.assertEqual(transaction_name, response.transaction_name)
+                self.assertEqual(item, response.transaction)
+
+    def test_selectors(self):
+        response = PorticoResponse.parse(
+            CORPUS["gift activate"],
+            select(("GatewayTxnId",)),
+            select(("BalanceAmt",), ("CardData", "PIN"), ("Missing",)),
+        )
+
+        self.assertEqual({"GatewayTxnId": "1234567890"}, response.header)
+        self.assertEqual("GiftCardActivate", response.transaction_name)
+        self.assertEqual(
+            {"BalanceAmt": "10.00", "CardData": {"PIN": "1234"}},
+            response.transaction,
+        )
+        self.assertEqual(
+            {"CardData": True, "RspCode": True},
+            select(("CardData", "PIN"), ("CardData",), ("RspCode",)),
+        )
+
+    def test_selected_fields_map_like_all_fields(self):
+        connector = PorticoConnector()
+        parse = PorticoResponse.parse
+        for name, raw_response in CORPUS.items():
+            with self.subTest(name):
+                result = connector._map_response(raw_response, CreditCardData())
+                with mock.patch.object(
+                    PorticoResponse,
+                    "parse",
+                    lambda raw_response, *selectors: parse(raw_response),
+                ):
+                    expected = connector._map_response(raw_response, CreditCardData())
+
+                self.assertEqual(fields(expected), fields(result))
+
+    def test_maps_transaction(self):
+        card = CreditCardData()
+        result = PorticoConnector()._map_response(CORPUS["credit sale"], card)
+
+        self.assertEqual("00", result.response_code)
+        self.assertEqual("APPROVAL", result.response_message)
+        self.assertEqual("A & B", result.transaction_descriptor)
+        self.assertEqual("1234567890", result.transaction_id)
+        self.assertEqual("12345A", result.authorization_code)
+        self.assertEqual("supt_token", result.token)
+
+    def test_missing_transaction_raises(self):
+        with self.assertRaises(GatewayException):
+            PorticoConnector()._map_response(envelope(""), CreditCardData())
@@ -0,0 +1,94 @@
+"""
+Test the Portico payment method serializer registry
+"""
+
+import unittest
+
+from globalpayments.api.builders import AuthorizationBuilder
+from globalpayments.api.entities.enums import PaymentMethodType, TransactionType
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.portico_serializers import (
+    get_payment_method_serializer,
+    register_payment_method_serializer,
+    serialize_credit_card,
+    serialize_payment_method,
+)
+from globalpayments.api.payment_methods import CreditCardData, DebitTrackData
+
+
+class StoredCard(CreditCardData):
+    pass
+
+
+class DuckTrack(object):
+    payment_method_type = PaymentMethodType.Debit
+    is_track_data = True
+    value = "%B4012002000060016^VI TEST CREDIT^251210118039000000000396?"
+    pin_block = "32539F50C245A6A93D123412324000AA"
+
+
+def card(cls=CreditCardData):
+    result = cls()
+    result.number = "4111111111111111"
+    result.exp_month = "12"
+    result.exp_year = "2030"
+    return result
+
+
+class PaymentMethodSerializerTests(unittest.TestCase):
+    def setUp(self):
+        self.connector = PorticoConnector()
+        self.connector.secret_api_key = "skapi_cert_test"
+
+    def test_resolution(self):
+        self.assertIs(serialize_credit_card, get_payment_method_serializer(StoredCard))
+        self.assertIs(
+            serialize_payment_method, get_payment_method_serializer(DuckTrack)
+        )
+
+    def test_registered_serializer(self):
+        def serialize(connector, block1, builder):
+            block1.append(connector._hydrate_credential_on_file(builder))
+
+        self.assertIs(serialize_credit_card, get_payment_method_serializer(StoredCard))
+        register_payment_method_serializer(StoredCard, serialize)
+        try:
+            self.assertIs(serialize, get_payment_method_serializer(StoredCard))
+            request = self.connector._build_authorization(
+                AuthorizationBuilder(TransactionType.Sale, card(StoredCard))
+            )
+        finally:
+            register_payment_method_serializer(StoredCard, serialize_credit_card)
+
+        self.assertIn(b"<CardOnFileData />", request)
+        self.assertNotIn(b"<CardNbr>", request)
+
+    def test_attribute_fallback(self):
+        track = DebitTrackData()
+        track.value = DuckTrack.value
+        track.pin_block = DuckTrack.pin_block
+
+        self.assertEqual(
+            self.connector._build_authorization(
+                AuthorizationBuilder(TransactionType.Sale, track)
+            ),
+            self.connector._build_authorization(
+                AuthorizationBuilder(TransactionType.Sale, DuckTrack())
+            ),
+        )
+
+    def test_subclass_matches_class(self):
+        expected = self.connector._build_authorization(
+            AuthorizationBuilder(TransactionType.Sale, card())
+        )
+        self.assertEqual(
+            expected,
+            self.connector._build_authorization(
+                AuthorizationBuilder(TransactionType.Sale, card(StoredCard))
+            ),
+        )
+        self.assertIn(b"<CardNbr>4111111111111111</CardNbr>", expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Test the Portico transaction type table
+"""
+
+import unittest
+
+from globalpayments.api.builders import AuthorizationBuilder, ManagementBuilder
+from globalpayments.api.entities import RecurringPaymentMethod
+from globalpayments.api.entities.enums import (
+    PaymentMethodType,
+    TransactionModifier,
+    TransactionType,
+)
+from globalpayments.api.entities.exceptions import UnsupportedTransactionException
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.payment_methods import (
+    CreditCardData,
+    DebitTrackData,
+    EBTCardData,
+    ECheck,
+    GiftCard,
+    TransactionReference,
+)
+
+
+def reference(payment_method_type):
+    result = TransactionReference()
+    result.payment_method_type = payment_method_type
+    return result
+
+
+class PorticoTransactionTypeTests(unittest.TestCase):
+    def assertMaps(self, expected, builder):
+        self.assertEqual(expected, PorticoConnector._map_transaction_type(builder))
+
+    def test_payment_methods(self):
+        for payment_method, expected in (
+            (CreditCardData(), "CreditSale"),
+            (DebitTrackData(), "DebitSale"),
+            (EBTCardData(), "EBTFSPurchase"),
+            (ECheck(), "CheckSale"),
+            (GiftCard(), "GiftCardSale"),
+        ):
+            self.assertMaps(
+                expected, AuthorizationBuilder(TransactionType.Sale, payment_method)
+            )
+
+    def test_modifiers(self):
+        card = CreditCardData()
+        for modifier, expected in (
+            (None, "CreditAuth"),
+            (TransactionModifier.NoModifier, "CreditAuth"),
+            (TransactionModifier.Incremental, "CreditIncrementalAuth"),
+            (TransactionModifier.Offline, "CreditOfflineAuth"),
+            (TransactionModifier.CashBack, "CreditAuth"),
+        ):
+            self.assertMaps(
+                expected,
+                AuthorizationBuilder(
+                    TransactionType.Auth, card
+                ).with_transaction_modifier(modifier),
+            )
+        self.assertMaps(
+            "EBTVoucherPurchase",
+            AuthorizationBuilder(
+                TransactionType.Sale, EBTCardData()
+            ).with_transaction_modifier(TransactionModifier.Voucher),
+        )
+
+    def test_type_only_transactions(self):
+        self.assertMaps("BatchClose", ManagementBuilder(TransactionType.BatchClose))
+        self.assertMaps(
+            "CreditCPCEdit",
+            ManagementBuilder(TransactionType.Edit).with_transaction_modifier(
+                TransactionModifier.LevelII
+            ),
+        )
+        self.assertMaps(
+            "CreditAccountVerify", ManagementBuilder(TransactionType.BenefitWithdrawal)
+        )
+
+    def test_recurring_sale(self):
+        payment_method = RecurringPaymentMethod()
+        self.assertMaps(
+            "RecurringBilling",
+            AuthorizationBuilder(TransactionType.Sale, payment_method),
+        )
+        payment_method.payment_type = "ACH"
+        self.assertMaps(
+            "CheckSale", AuthorizationBuilder(TransactionType.Sale, payment_method)
+        )
+
+    def test_unsupported(self):
+        with self.assertRaisesRegex(
+            UnsupportedTransactionException, "Void .* NoModifier .* Debit"
+        ):
+            PorticoConnector._map_transaction_type(
+                ManagementBuilder(TransactionType.Void)
+                .with_transaction_modifier(TransactionModifier.NoModifier)
+                .with_payment_method(reference(PaymentMethodType.Debit))
+            )
+        with self.assertRaises(UnsupportedTransactionException):
+            PorticoConnector._map_transaction_type(
+                AuthorizationBuilder(TransactionType.Sale)
+            )
+        with self.assertRaisesRegex(UnsupportedTransactionException, "DebitReturn"):
+            PorticoConnector._map_transaction_type(
+                ManagementBuilder(TransactionType.Refund).with_payment_method(
+                    reference(PaymentMethodType.Debit)
+                )
+            )
+        self.assertMaps(
+            "CreditReturn",
+            ManagementBuilder(TransactionType.Refund).with_payment_method(
+                reference(PaymentMethodType.Credit)
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Test streaming Portico reports
+"""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from globalpayments.api.builders import TransactionReportBuilder
+from globalpayments.api.entities.enums import ReportType
+from globalpayments.api.entities.exceptions import (
+    GatewayException,
+    RateLimitException,
+    UnsupportedTransactionException,
+)
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.connection_pool import ConnectionPool
+from globalpayments.api.gateways.portico_response import iter_report_items
+from globalpayments.api.gateways.traffic_limiter import TrafficLane, TrafficLimiter
+from tests.test_portico_response import envelope
+
+DETAILS = (
+    "<Details><GatewayTxnId>{0}</GatewayTxnId><TxnStatus>A</TxnStatus>"
+    "<ServiceName>CreditSale</ServiceName><Amt>{0}.25</Amt>"
+    "<MaskedCardNbr>411111******1111</MaskedCardNbr>"
+    "<TxnUtcDT>2026-01-01T00:00:0{0}</TxnUtcDT></Details>"
+)
+
+ACTIVITY = envelope(
+    "<Transaction><ReportActivity>{}</ReportActivity></Transaction>".format(
+        "".join(DETAILS.format(index) for index in range(1, 6))
+    )
+)
+
+FIND_TRANSACTIONS = envelope(
+    "<Transaction><FindTransactions>{}</FindTransactions></Transaction>".format(
+        "".join(
+            DETAILS.format(index)
+            .replace("<Details>", "<Transactions>")
+            .replace("</Details>", "</Transactions>")
+            for index in range(1, 4)
+        )
+    )
+)
+
+
+class ChunkedReportHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.connections.add(self.client_address)
+        body = self.server.body
+        self.send_response(self.server.status)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for start in range(0, len(body), 64):
+            chunk = body[start : start + 64]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+def values(summary):
+    return {name: getattr(summary, name) for name in type(summary).__slots__}
+
+
+class ReportStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ChunkedReportHandler)
+        self.server.daemon_threads = True
+        self.server.connections = set()
+        self.server.status = 200
+        self.server.body = ACTIVITY
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.connector = PorticoConnector()
+        self.connector.service_url = "http://127.0.0.1:{}/".format(
+            self.server.server_address[1]
+        )
+        self.connector.connection_pool = ConnectionPool()
+        self.connector.stream_chunk_size = 16
+
+    def tearDown(self):
+        self.connector.connection_pool.clear()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stream(self, report_type):
+        return self.connector.stream_report(TransactionReportBuilder(report_type))
+
+    def test_rows_match_report(self):
+        for report_type, body in (
+            (ReportType.Activity, ACTIVITY),
+            (ReportType.FindTransactions, FIND_TRANSACTIONS),
+        ):
+            self.server.body = body
+            expected = self.connector._map_report_response(body, report_type)
+
+            rows = list(self.stream(report_type))
+
+            self.assertEqual(list(map(values, expected)), list(map(values, rows)))
+
+    def test_abandoned_stream_releases_connection(self):
+        rows = self.stream(ReportType.Activity)
+        self.assertEqual("1", next(rows).transaction_id)
+        rows.close()
+
+        self.assertEqual(5, len(list(self.stream(ReportType.Activity))))
+        self.assertEqual(2, len(self.server.connections))
+        self.assertEqual(5, len(list(self.stream(ReportType.Activity))))
+        self.assertEqual(2, len(self.server.connections))
+
+    def test_stream_holds_lane_until_released(self):
+        self.connector.traffic_limiter = TrafficLimiter(
+            background=TrafficLane(max_in_flight=1), max_wait=0
+        )
+
+        rows = self.stream(ReportType.Activity)
+        next(rows)
+        with self.assertRaises(RateLimitException):
+            self.stream(ReportType.Activity)
+        rows.close()
+
+        self.assertEqual(5, len(list(self.stream(ReportType.Activity))))
+        self.assertEqual(5, len(list(self.stream(ReportType.Activity))))
+
+    def test_http_error(self):
+        self.server.status = 500
+        with self.assertRaises(GatewayException):
+            self.stream(ReportType.Activity)
+
+    def test_gateway_error(self):
+        self.server.body = envelope("").replace(
+            b"<GatewayRspCode>0</GatewayRspCode><GatewayRspMsg>Success",
+            b"<GatewayRspCode>-2</GatewayRspCode>"
+            b"<GatewayRspMsg>Authentication Error",
+        )
+        with self.assertRaises(GatewayException) as context:
+            list(self.stream(ReportType.Activity))
+        self.assertEqual("-2", context.exception.response_code)
+
+        # a missing Transaction element is an error too
+        self.server.body = envelope("")
+        with self.assertRaises(GatewayException):
+            list(self.stream(ReportType.Activity))
+
+        self.server.body = ACTIVITY
+        self.assertEqual(5, len(list(self.stream(ReportType.Activity))))
+
+    def test_unsupported_report(self):
+        with self.assertRaises(UnsupportedTransactionException):
+            self.stream(ReportType.TransactionDetail)
+
+    def test_only_report_rows_are_yielded(self):
+        body = envelope(
+            "<Transaction><ReportActivity><Header><Details>x</Details></Header>"
+            "<Details><Amt>1</Amt></Details><Details/></ReportActivity>"
+            "</Transaction>"
+        )
+        chunks = [body[index : index + 7] for index in range(0, len(body), 7)]
+
+        self.assertEqual(
+            [{"Amt": "1"}, None],
+            list(iter_report_items(chunks, "ReportActivity", "Details")),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Test splitting Activity reports into date windows
+"""
+
+import asyncio
+import datetime
+import re
+import unittest
+
+from globalpayments.api.builders import TransactionReportBuilder
+from globalpayments.api.entities import TransactionSummary, TransactionSummaryTable
+from globalpayments.api.entities.enums import ReportType
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.report_windows import ReportWindows
+from tests.test_portico_response import envelope
+
+START = datetime.datetime(2026, 1, 1)
+END = datetime.datetime(2026, 1, 2)
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+DETAILS = (
+    "<Details><GatewayTxnId>{0}</GatewayTxnId><Amt>1.00</Amt>"
+    "<TxnUtcDT>{1}</TxnUtcDT></Details>"
+)
+
+
+class FakeReports(object):
+    """
+    Answers Activity requests with the rows dated within the requested
+    window, bounds included
+    """
+
+    def __init__(self, dates):
+        self.dates = dates
+        self.windows = []
+
+    def __call__(self, request, builder=None):
+        window = [
+            datetime.datetime.strptime(value, DATE_FORMAT)
+            for value in re.findall(
+                r"<Rpt(?:Start|End)UtcDT>([^<]+)<", request.decode()
+            )
+        ]
+        self.windows.append(tuple(window))
+        start = window[0] if window else datetime.datetime.min
+        end = window[1] if len(window) > 1 else datetime.datetime.max
+        details = "".join(
+            DETAILS.format(index, date.strftime(DATE_FORMAT))
+            for index, date in enumerate(self.dates)
+            if start <= date <= end
+        )
+        return envelope(
+            "<Transaction><ReportActivity>{}</ReportActivity></Transaction>".format(
+                details
+            )
+        )
+
+
+class ReportWindowsTests(unittest.TestCase):
+    def plan(self, windows, rows=0):
+        planned = []
+        window = windows.next_window()
+        while window is not None:
+            planned.append(window)
+            windows.record(window, rows)
+            window = windows.next_window()
+        return planned
+
+    def test_windows_cover_range(self):
+        for rows in (0, 1, 100000):
+            planned = self.plan(ReportWindows(START, END, 4, 100), rows)
+
+            self.assertEqual(START, planned[0][0])
+            self.assertEqual(END, planned[-1][1])
+            for previous, window in zip(planned, planned[1:]):
+                self.assertEqual(previous[1], window[0])
+
+    def test_window_size_adapts_to_rows(self):
+        windows = ReportWindows(START, END, 4, rows_per_window=100)
+        first = windows.next_window()
+        self.assertEqual(datetime.timedelta(hours=1, minutes=30), first[1] - first[0])
+
+        windows.record(first, 600)
+        window = windows.next_window()
+        self.assertEqual(datetime.timedelta(minutes=15), window[1] - window[0])
+
+        #  the rate is taken over all the windows fetched so far
+        windows.record(window, 0)
+        window = windows.next_window()
+        self.assertEqual(datetime.timedelta(minutes=17.5), window[1] - window[0])
+
+        sparse = ReportWindows(START, END, 4, rows_per_window=100)
+        first = sparse.next_window()
+        sparse.record(first, 0)
+        window = sparse.next_window()
+        self.assertEqual(datetime.timedelta(hours=6), window[1] - window[0])
+
+    def test_merge(self):
+        rows = []
+        for transaction_id, date in (("1", "10:00"), ("2", "09:00"), (None, "11:00")):
+            row = TransactionSummary()
+            row.transaction_id = transaction_id
+            row.transaction_date = "2026-01-01T{}:00".format(date)
+            rows.append(row)
+
+        merged = ReportWindows.merge([rows[:2], rows[::2], [rows[2]]])
+
+        self.assertEqual([rows[1], rows[0], rows[2], rows[2]], merged)
+
+
+class WindowedReportTests(unittest.TestCase):
+    def setUp(self):
+        #  one row every 7 minutes, some of them on window bounds
+        self.dates = [
+            START + datetime.timedelta(minutes=7 * index) for index in range(206)
+        ]
+        self.connector = PorticoConnector()
+        self.builder = (
+            TransactionReportBuilder(ReportType.Activity)
+            .with_start_date(START)
+            .with_end_date(END)
+            .with_parallel_windows(3, rows_per_window=20)
+        )
+        self.expected = [str(index) for index in range(len(self.dates))]
+
+    def test_windows_are_merged(self):
+        reports = FakeReports(self.dates)
+        self.connector.do_transaction = reports
+
+        rows = self.connector.process_report(self.builder)
+
+        self.assertGreater(len(reports.windows), 3)
+        self.assertEqual(self.expected, [row.transaction_id for row in rows])
+
+    def test_windows_are_merged_async(self):
+        reports = FakeReports(self.dates)
+
+        async def do_transaction_async(request, builder=None):
+            await asyncio.sleep(0)
+            return reports(request, builder)
+
+        self.connector.do_transaction_async = do_transaction_async
+
+        rows = asyncio.run(self.connector.process_report_async(self.builder))
+
+        self.assertGreater(len(reports.windows), 3)
+        self.assertEqual(self.expected, [row.transaction_id for row in rows])
+
+    def test_columnar(self):
+        self.connector.do_transaction = FakeReports(self.dates)
+
+        table = self.connector.process_report(self.builder.with_columnar(True))
+
+        self.assertIsInstance(table, TransactionSummaryTable)
+        self.assertEqual(self.expected, table.column("transaction_id"))
+
+    def test_requires_date_range(self):
+        reports = FakeReports(self.dates)
+        self.connector.do_transaction = reports
+
+        self.builder.end_date = None
+        self.connector.process_report(self.builder)
+
+        self.assertEqual(1, len(reports.windows))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Test the gateway retry policy
+"""
+
+import unittest
+
+from globalpayments.api.builders import (
+    AuthorizationBuilder,
+    RecurringBuilder,
+    ReportBuilder,
+)
+from globalpayments.api.entities.enums import ReportType, TransactionType
+from globalpayments.api.entities.exceptions import (
+    GatewayException,
+    GatewayTimeoutException,
+)
+from globalpayments.api.gateways.gateway_response import GatewayResponse
+from globalpayments.api.gateways.retry_policy import RetryBudget, RetryPolicy
+
+
+def response(status_code):
+    result = GatewayResponse()
+    result.status_code = status_code
+    result.raw_response = b""
+    return result
+
+
+class FlakySend(object):
+    """
+    Raises or returns the given outcomes in order
+    """
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self):
+        outcome = self.outcomes[self.calls]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(base_delay=0)
+        self.sale = AuthorizationBuilder(TransactionType.Sale)
+        self.report = ReportBuilder(ReportType.Activity)
+
+    def test_classification(self):
+        self.assertTrue(self.policy.is_idempotent("POST", self.report))
+        self.assertTrue(
+            self.policy.is_idempotent("GET", RecurringBuilder(TransactionType.Fetch))
+        )
+        self.assertTrue(
+            self.policy.is_idempotent("POST", RecurringBuilder(TransactionType.Search))
+        )
+        self.assertFalse(self.policy.is_idempotent("POST", self.sale))
+        self.assertFalse(
+            self.policy.is_idempotent("POST", RecurringBuilder(TransactionType.Create))
+        )
+        self.assertTrue(self.policy.is_idempotent("GET"))
+
+    def test_sale_retries_connect_failures(self):
+        send = FlakySend(
+            GatewayException("refused", request_sent=False),
+            GatewayTimeoutException("connect timeout", request_sent=False),
+            response(200),
+        )
+
+        self.assertEqual(200, self.policy.execute(send, "POST", self.sale).status_code)
+        metrics = self.policy.metrics.snapshot()
+        self.assertEqual(3, metrics["attempts"])
+        self.assertEqual(2, metrics["retries"])
+        self.assertEqual(1, metrics["recovered"])
+
+    def test_sale_does_not_retry_after_sending(self):
+        send = FlakySend(GatewayTimeoutException("read timeout"), response(200))
+
+        with self.assertRaises(GatewayTimeoutException):
+            self.policy.execute(send, "POST", self.sale)
+        self.assertEqual(1, send.calls)
+
+        send = FlakySend(response(503), response(200))
+        self.assertEqual(503, self.policy.execute(send, "POST", self.sale).status_code)
+
+    def test_report_retries_transport_errors_and_statuses(self):
+        send = FlakySend(
+            GatewayException("connection reset"), response(503), response(200)
+        )
+
+        self.assertEqual(
+            200, self.policy.execute(send, "POST", self.report).status_code
+        )
+        self.assertEqual(3, send.calls)
+
+    def test_attempts_are_bounded(self):
+        send = FlakySend(*[GatewayException("connection reset")] * 5)
+
+        with self.assertRaises(GatewayException):
+            self.policy.execute(send, "POST", self.report)
+        self.assertEqual(3, send.calls)
+        self.assertEqual(1, self.policy.metrics.snapshot()["exhausted"])
+
+    def test_budget_limits_retries(self):
+        policy = RetryPolicy(base_delay=0, budget=RetryBudget(ratio=0, capacity=1))
+        send = FlakySend(*[GatewayException("connection reset")] * 5)
+
+        with self.assertRaises(GatewayException):
+            policy.execute(send, "POST", self.report)
+        self.assertEqual(2, send.calls)
+        self.assertEqual(1, policy.metrics.snapshot()["budget_exhausted"])
+
+
+class AsyncRetryPolicyTests(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_async(self):
+        policy = RetryPolicy(base_delay=0)
+        send = FlakySend(GatewayException("connection reset"), response(200))
+
+        async def send_async():
+            return send()
+
+        result = await policy.execute_async(
+            send_async, "POST", ReportBuilder(ReportType.Activity)
+        )
+        self.assertEqual(200, result.status_code)
+        self.assertEqual(2, send.calls)
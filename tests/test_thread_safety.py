@@ -0,0 +1,94 @@
+"""
+Test that connector, builder and container state is not shared
+"""
+
+import threading
+import unittest
+
+from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.builders import ReportBuilder
+from globalpayments.api.entities import Transaction
+from globalpayments.api.entities.address import CountryUtils
+from globalpayments.api.entities.enums import ReportType
+from globalpayments.api.gateways import PayPlanConnector, PorticoConnector
+from globalpayments.api.gateways.connection_pool import ConnectionPool
+
+
+class InstanceStateTests(unittest.TestCase):
+    def test_connector_headers_are_instance_local(self):
+        first = PayPlanConnector()
+        first.secret_api_key = "skapi_cert_first"
+        second = PayPlanConnector()
+        second.secret_api_key = "skapi_cert_second"
+
+        self.assertNotEqual(
+            first.headers["Authorization"], second.headers["Authorization"]
+        )
+        self.assertEqual({}, PorticoConnector().headers)
+
+    def test_report_search_criteria_are_instance_local(self):
+        first = ReportBuilder(ReportType.FindTransactions)
+        first.add_search_criteria("CardType", "Visa")
+
+        self.assertEqual({}, ReportBuilder(ReportType.FindTransactions).search_criteria)
+
+    def test_transaction_response_values_are_instance_local(self):
+        Transaction().response_values["RspCode"] = "00"
+
+        self.assertEqual({}, Transaction().response_values)
+
+    def test_country_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            CountryUtils.country_code_map_by_country["Atlantis"] = "XA"
+        self.assertEqual(
+            "US", CountryUtils.get_country_code_by_country("United States of America")
+        )
+        self.assertEqual("Canada", CountryUtils.get_country_by_country_code("CA"))
+
+    def test_pool_manager_is_created_once(self):
+        pool = ConnectionPool()
+        barrier = threading.Barrier(8)
+        managers = []
+
+        def get_manager():
+            barrier.wait()
+            managers.append(pool.manager)
+
+        threads = [threading.Thread(target=get_manager) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(set(map(id, managers))))
+
+
+class ServicesContainerTests(unittest.TestCase):
+    def test_concurrent_configure_and_get_client(self):
+        names = ["threaded-{}".format(index) for index in range(16)]
+        errors = []
+
+        def configure(name):
+            try:
+                config = PorticoConfig()
+                config.secret_api_key = "skapi_cert_test"
+                config.service_url = "https://cert.api2.heartlandportico.com"
+                ServicesContainer.configure(config, name)
+                for _ in range(100):
+                    if ServicesContainer.instance().get_client(name) is None:
+                        errors.append(name)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=configure, args=(name,)) for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        for name in names:
+            self.assertIsNotNone(ServicesContainer.instance().get_client(name))
+            self.assertIsNotNone(
+                ServicesContainer.instance().get_recurring_client(name)
+            )
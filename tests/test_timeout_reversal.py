@@ -0,0 +1,130 @@
+"""
+Test automatic reversal of timed out Portico authorizations
+"""
+
+import re
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.entities.exceptions import (
+    GatewayException,
+    GatewayTimeoutException,
+)
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.timeout_reversal import TimeoutReversalEngine
+from globalpayments.api.payment_methods import CreditCardData
+
+CREDIT_REVERSAL_RESPONSE = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+    b'<soap:Body><PosResponse xmlns="http://Hps.Exchange.PosGateway">'
+    b"<Ver1.0><Header><LicenseId>1</LicenseId><SiteId>1</SiteId><DeviceId>1</DeviceId>"
+    b"<GatewayTxnId>1234567891</GatewayTxnId><GatewayRspCode>0</GatewayRspCode>"
+    b"<GatewayRspMsg>Success</GatewayRspMsg></Header>"
+    b"<Transaction><CreditReversal><RspCode>00</RspCode><RspText>APPROVAL</RspText>"
+    b"</CreditReversal></Transaction></Ver1.0></PosResponse></soap:Body></soap:Envelope>"
+)
+
+
+class PorticoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(body)
+        if b"<CreditSale>" in body:
+            # answer after the client gave up
+            time.sleep(1)
+
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(CREDIT_REVERSAL_RESPONSE)))
+            self.end_headers()
+            self.wfile.write(CREDIT_REVERSAL_RESPONSE)
+        except ConnectionError:
+            # the client already gave up on the stalled sale
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class TimeoutReversalTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), PorticoHandler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.card = CreditCardData()
+        self.card.number = "4111111111111111"
+        self.card.exp_month = "12"
+        self.card.exp_year = "2025"
+        self.card.cvn = "123"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_timed_out_sale_is_reversed(self):
+        results = []
+        finished = threading.Event()
+
+        def callback(result):
+            results.append(result)
+            finished.set()
+
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.service_url = "http://127.0.0.1:{}".format(self.server.server_port)
+        config.read_timeout = 200
+        config.timeout_reversal_enabled = True
+        config.timeout_reversal_callback = callback
+        ServicesContainer.configure(config, "reversal")
+
+        with self.assertRaises(GatewayTimeoutException) as context:
+            self.card.charge(10).with_currency("USD").execute("reversal")
+
+        self.assertTrue(context.exception.request_sent)
+        self.assertTrue(finished.wait(5))
+
+        result = results[0]
+        self.assertTrue(result.reversed)
+        self.assertEqual(1, result.attempts)
+        self.assertEqual(10, result.amount)
+
+        sale, reversal = self.server.requests
+        client_txn_id = re.search(rb"<ClientTxnId>(\d+)</ClientTxnId>", sale).group(1)
+        self.assertEqual(result.client_transaction_id.encode(), client_txn_id)
+        self.assertIn(b"<CreditReversal>", reversal)
+        self.assertIn(b"<ClientTxnId>" + client_txn_id + b"</ClientTxnId>", reversal)
+        self.assertNotIn(b"<GatewayTxnId", reversal)
+
+    def test_connect_failure_is_not_reversed(self):
+        submitted = []
+
+        class RecordingEngine(TimeoutReversalEngine):
+            def submit(self, connector, builder):
+                submitted.append(builder)
+
+        connector = PorticoConnector()
+        connector.secret_api_key = "skapi_cert_test"
+        connector.service_url = "http://127.0.0.1:1"
+        connector.timeout = 1000
+        connector.timeout_reversal = RecordingEngine()
+
+        builder = self.card.charge(10).with_currency("USD")
+        with self.assertRaises(GatewayException) as context:
+            connector.process_authorization(builder)
+
+        self.assertNotIsInstance(context.exception, GatewayTimeoutException)
+        self.assertEqual(
+            "Error occurred while communicating with gateway.",
+            str(context.exception),
+        )
+        self.assertFalse(context.exception.request_sent)
+        self.assertEqual([], submitted)
+        self.assertIsNotNone(builder.client_transaction_id)
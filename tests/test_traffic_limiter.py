@@ -0,0 +1,112 @@
+"""
+Test client-side rate limits and bulkheads
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from globalpayments.api.builders import (
+    AuthorizationBuilder,
+    RecurringBuilder,
+    ReportBuilder,
+)
+from globalpayments.api.entities.enums import ReportType, TransactionType
+from globalpayments.api.entities.exceptions import RateLimitException
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.gateways.traffic_limiter import (
+    Bulkhead,
+    TokenBucket,
+    TrafficLane,
+    TrafficLimiter,
+)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0, bucket.reserve())
+        self.assertIsNone(bucket.reserve(timeout=0))
+        self.assertAlmostEqual(0.1, bucket.reserve(timeout=1), delta=0.02)
+
+
+class BulkheadTests(unittest.TestCase):
+    def test_rejects_when_full(self):
+        bulkhead = Bulkhead(1)
+        self.assertTrue(bulkhead.acquire(0))
+        self.assertFalse(bulkhead.acquire(0))
+        self.assertFalse(bulkhead.acquire(0.05))
+
+        bulkhead.release()
+        self.assertTrue(bulkhead.acquire(0))
+
+    def test_waiter_receives_released_slot(self):
+        bulkhead = Bulkhead(1)
+        bulkhead.acquire()
+        threading.Timer(0.05, bulkhead.release).start()
+
+        self.assertTrue(bulkhead.acquire(2))
+        self.assertEqual(1, bulkhead.in_flight)
+
+
+class AsyncBulkheadTests(unittest.IsolatedAsyncioTestCase):
+    async def test_waiter_receives_released_slot(self):
+        bulkhead = Bulkhead(1)
+        await bulkhead.acquire_async()
+        asyncio.get_running_loop().call_later(0.05, bulkhead.release)
+
+        self.assertTrue(await bulkhead.acquire_async(2))
+        self.assertFalse(await bulkhead.acquire_async(0.05))
+        self.assertEqual(1, bulkhead.in_flight)
+
+
+class TrafficLimiterTests(unittest.TestCase):
+    def test_background_work_uses_its_own_lane(self):
+        limiter = TrafficLimiter()
+        self.assertIs(
+            limiter.background, limiter.get_lane(ReportBuilder(ReportType.Activity))
+        )
+        self.assertIs(
+            limiter.background,
+            limiter.get_lane(RecurringBuilder(TransactionType.Search)),
+        )
+        self.assertIs(
+            limiter.interactive,
+            limiter.get_lane(AuthorizationBuilder(TransactionType.Sale)),
+        )
+        self.assertIs(limiter.interactive, limiter.get_lane())
+
+    def test_saturated_background_lane_does_not_block_interactive(self):
+        limiter = TrafficLimiter(
+            interactive=TrafficLane(max_in_flight=1),
+            background=TrafficLane(max_in_flight=1),
+            max_wait=0,
+        )
+        report = ReportBuilder(ReportType.Activity)
+        limiter.acquire(report)
+
+        with self.assertRaises(RateLimitException) as context:
+            limiter.acquire(report)
+        self.assertEqual("background", context.exception.lane)
+
+        lane = limiter.acquire(AuthorizationBuilder(TransactionType.Sale))
+        self.assertIs(limiter.interactive, lane)
+
+    def test_connector_rejects_over_limit(self):
+        connector = PorticoConnector()
+        connector.service_url = "http://127.0.0.1:1"
+        connector.traffic_limiter = TrafficLimiter(
+            interactive=TrafficLane(rate=1, burst=1), max_wait=0
+        )
+        connector.timeout = 1000
+
+        started = time.monotonic()
+        with self.assertRaises(Exception) as context:
+            connector.do_transaction(b"<request />")
+        self.assertNotIsInstance(context.exception, RateLimitException)
+
+        with self.assertRaises(RateLimitException):
+            connector.do_transaction(b"<request />")
+        self.assertLess(time.monotonic() - started, 5)
@@ -0,0 +1,130 @@
+"""
+Test the columnar report result
+"""
+
+import importlib.util
+import unittest
+from unittest import mock
+
+from globalpayments.api.entities import (
+    TransactionSummary,
+    TransactionSummaryRow,
+    TransactionSummaryTable,
+)
+from globalpayments.api.entities.enums import ReportType
+from globalpayments.api.entities.exceptions import ApiException, GatewayException
+from globalpayments.api.gateways import PorticoConnector
+from tests.test_portico_response import envelope
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+DETAILS = (
+    "<Details><GatewayTxnId>{0}</GatewayTxnId><TxnStatus>A</TxnStatus>"
+    "<ServiceName>CreditSale</ServiceName><Amt>{0}.25</Amt>"
+    "<SettlementAmt>0</SettlementAmt><RspCode>00</RspCode>"
+    "<MaskedCardNbr>411111******1111</MaskedCardNbr>"
+    "<TxnUtcDT>2026-01-01T00:00:0{0}</TxnUtcDT></Details>"
+)
+
+
+def summary(**fields):
+    result = TransactionSummary()
+    for name, value in fields.items():
+        setattr(result, name, value)
+    return result
+
+
+def values(row):
+    return {name: getattr(row, name) for name in TransactionSummary.__slots__}
+
+
+class TransactionSummaryTableTests(unittest.TestCase):
+    def setUp(self):
+        self.summaries = [
+            summary(amount="10.00", status="A", transaction_id="1"),
+            summary(amount="-1.05", settlement_amount="10", status="A"),
+            summary(amount="-0.00", auth_code="Zürich", status="R"),
+            summary(convenience_amount={"@currency": "USD", "#text": "1.00"}),
+            summary(),
+        ]
+        self.table = TransactionSummaryTable(self.summaries)
+
+    def test_rows_match_summaries(self):
+        self.assertEqual(len(self.summaries), len(self.table))
+        for expected, row in zip(self.summaries, self.table):
+            self.assertIsInstance(row, TransactionSummaryRow)
+            self.assertEqual(values(expected), values(row))
+            self.assertEqual(values(expected), values(row.to_summary()))
+
+    def test_views_share_storage(self):
+        view = self.table[1:-1]
+
+        self.assertEqual(3, len(view))
+        self.assertEqual("-1.05", view[0].amount)
+        self.assertEqual("Zürich", view[-2].auth_code)
+        self.assertEqual(["A", "R", None], view.column("status"))
+        self.assertEqual(["10.00", "-0.00"], [row.amount for row in self.table[:3:2]])
+        self.assertEqual(0, len(view[5:]))
+        with self.assertRaises(IndexError):
+            view[3]
+        with self.assertRaises(ApiException):
+            view.append(TransactionSummary())
+
+    def test_categories_widen(self):
+        table = TransactionSummaryTable(
+            summary(device_id=str(index)) for index in range(70000)
+        )
+
+        self.assertEqual("69999", table[-1].device_id)
+        self.assertEqual("255", table[255].device_id)
+
+    def test_columnar_report(self):
+        raw_response = envelope(
+            "<Transaction><ReportActivity>{}{}</ReportActivity></Transaction>".format(
+                DETAILS.format(1), DETAILS.format(2)
+            )
+        )
+        connector = PorticoConnector()
+
+        summaries = connector._map_report_response(raw_response, ReportType.Activity)
+        table = connector._map_report_response(
+            raw_response, ReportType.Activity, columnar=True
+        )
+
+        self.assertIsInstance(table, TransactionSummaryTable)
+        self.assertEqual([values(item) for item in summaries], list(map(values, table)))
+
+    def test_columnar_report_skips_document_tree(self):
+        raw_response = envelope(
+            "<Transaction><FindTransactions>{}</FindTransactions></Transaction>".format(
+                DETAILS.format(1).replace("Details>", "Transactions>")
+            )
+        )
+        connector = PorticoConnector()
+        summaries = connector._map_report_response(
+            raw_response, ReportType.FindTransactions
+        )
+
+        with mock.patch("xmltodict.parse", side_effect=AssertionError):
+            table = connector._map_report_response(
+                raw_response, ReportType.FindTransactions, columnar=True
+            )
+            with self.assertRaises(GatewayException):
+                connector._map_report_response(
+                    envelope(""), ReportType.Activity, columnar=True
+                )
+
+        self.assertEqual([values(item) for item in summaries], list(map(values, table)))
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_to_numpy(self):
+        rows = self.table.to_numpy()
+
+        self.assertEqual(10.0, rows["amount"][0])
+        self.assertEqual("A", rows["status"][1])
+        self.assertEqual("", rows["status"][4])
+
+    @unittest.skipIf(HAS_NUMPY, "NumPy is installed")
+    def test_to_numpy_requires_numpy(self):
+        with self.assertRaises(ApiException):
+            self.table.to_numpy()
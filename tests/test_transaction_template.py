@@ -0,0 +1,128 @@
+"""
+Test reusable authorization templates
+"""
+
+import asyncio
+import unittest
+
+from globalpayments.api import PorticoConfig, ServicesContainer
+from globalpayments.api.builders import AuthorizationBuilder, TransactionTemplate
+from globalpayments.api.entities import Address, ECommerceInfo
+from globalpayments.api.entities.enums import TransactionType
+from globalpayments.api.entities.exceptions import BuilderException
+from globalpayments.api.gateways import PorticoConnector
+from globalpayments.api.payment_methods import CreditCardData, CreditTrackData
+from tests.test_execute_async import CREDIT_SALE_RESPONSE
+
+
+def card(number="4111111111111111"):
+    result = CreditCardData()
+    result.number = number
+    result.exp_month = "12"
+    result.exp_year = "2030"
+    result.cvn = "123"
+    return result
+
+
+def address():
+    result = Address()
+    result.street_address_1 = "1 Main St"
+    result.city = "Springfield"
+    result.province = "NY"
+    result.postal_code = "12345"
+    return result
+
+
+def sale(payment_method=None, amount=None):
+    return (
+        AuthorizationBuilder(TransactionType.Sale, payment_method)
+        .with_amount(amount)
+        .with_currency("USD")
+        .with_allow_duplicates(True)
+        .with_address(address())
+        .with_ecommerce_info(ECommerceInfo())
+        .with_invoice_number("kiosk-12")
+        .with_dynamic_descriptor("KIOSK 12")
+    )
+
+
+class TransactionTemplateTests(unittest.TestCase):
+    def setUp(self):
+        self.connector = PorticoConnector()
+        self.connector.secret_api_key = "skapi_cert_test"
+
+    def request(self, template, payment_method, amount=None):
+        return self.connector._build_authorization(
+            template._create_checked(payment_method, amount, None)
+        )
+
+    def test_requests_match_builder(self):
+        template = TransactionTemplate(sale())
+        track = CreditTrackData()
+        track.value = "%B4012002000060016^VI TEST CREDIT^251210118039000000000396?"
+
+        for payment_method, amount in ((card(), 10), (card("5473500000000014"), 7)):
+            self.assertEqual(
+                self.connector._build_authorization(sale(payment_method, amount)),
+                self.request(template, payment_method, amount),
+            )
+        self.assertEqual(
+            self.connector._build_authorization(sale(track, 3)),
+            self.request(template, track, 3),
+        )
+        self.assertEqual(2, len(template.fragments))
+
+    def test_fields_are_frozen(self):
+        builder = sale(amount=5)
+        template = TransactionTemplate(builder)
+        expected = self.connector._build_authorization(sale(card(), 5))
+
+        builder.billing_address.city = "Elsewhere"
+        builder.with_currency("EUR")
+
+        self.assertEqual(expected, self.request(template, card()))
+        self.assertIsNone(builder.template)
+
+    def test_variable_fields_are_checked(self):
+        template = TransactionTemplate(sale())
+        with self.assertRaises(BuilderException):
+            template._create_checked(None, 10, None)
+        with self.assertRaises(BuilderException):
+            template._create_checked(card(), None, None)
+
+        verify = TransactionTemplate(AuthorizationBuilder(TransactionType.Verify))
+        self.assertIsNone(verify._create_checked(card(), None, None).amount)
+
+    def test_constant_fields_are_validated(self):
+        with self.assertRaises(BuilderException):
+            TransactionTemplate(AuthorizationBuilder(TransactionType.Sale))
+
+    def test_execute(self):
+        config = PorticoConfig()
+        config.secret_api_key = "skapi_cert_test"
+        config.service_url = "https://cert.api2.heartlandportico.com"
+        ServicesContainer.configure(config, "template")
+        client = ServicesContainer.instance().get_client("template")
+        requests = []
+
+        def do_transaction(request, builder=None):
+            requests.append(request)
+            return CREDIT_SALE_RESPONSE
+
+        async def do_transaction_async(request, builder=None):
+            return do_transaction(request, builder)
+
+        client.do_transaction = do_transaction
+        client.do_transaction_async = do_transaction_async
+        template = TransactionTemplate(sale())
+
+        response = template.execute(card(), 10, "template")
+        self.assertEqual("00", response.response_code)
+        response = asyncio.run(template.execute_async(card(), 12, "template"))
+        self.assertEqual("00", response.response_code)
+        self.assertIn(b"<Amt>12</Amt>", requests[1])
+        self.assertIn(b"<TxnDescriptor>KIOSK 12</TxnDescriptor>", requests[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,518 @@
+"""
+Test the direct XML writer against ElementTree serialization
+"""
+
+import json
+import os
+import unittest
+import xml.etree.cElementTree as et
+from unittest import mock
+
+from globalpayments.api.builders import (
+    AuthorizationBuilder,
+    ManagementBuilder,
+    RecurringBuilder,
+    TransactionTemplate,
+)
+from globalpayments.api.entities import (
+    Address,
+    Customer,
+    ECommerceInfo,
+    EncryptionData,
+    RecurringPaymentMethod,
+    ThreeDSecure,
+    Transaction,
+)
+from globalpayments.api.entities.enums import (
+    AccountType,
+    CheckType,
+    EntryMethod,
+    PaymentMethodType,
+    SecCode,
+    StoredCredentialInitiator,
+    TaxType,
+    ThreeDSecureVersion,
+    TransactionModifier,
+    TransactionType,
+)
+from globalpayments.api.gateways import PorticoConnector, RealexConnector
+from globalpayments.api.payment_methods import (
+    CreditCardData,
+    CreditTrackData,
+    DebitTrackData,
+    EBTCardData,
+    ECheck,
+    GiftCard,
+    TransactionReference,
+)
+from globalpayments.api.services import ReportingService
+from globalpayments.api.utils.xml_writer import XmlWriter, raw_element, tostring
+
+#  Portico requests of the corpus, as serialized from ElementTree trees
+GOLDEN_PORTICO_REQUESTS = os.path.join(
+    os.path.dirname(__file__), "data", "portico_requests.json"
+)
+
+
+class Captured(Exception):
+    pass
+
+
+class RecordingMixin(object):
+    def do_transaction(self, request, builder=None):
+        self.requests.append(request)
+        raise Captured()
+
+
+class RecordingPorticoConnector(RecordingMixin, PorticoConnector):
+    pass
+
+
+class RecordingRealexConnector(RecordingMixin, RealexConnector):
+    pass
+
+
+def portico_corpus():
+    card = CreditCardData()
+    card.number = "4111111111111111"
+    card.exp_month = "12"
+    card.exp_year = "2025"
+    card.cvn = "123"
+    card.card_holder_name = "Jöhn & <Doe>"
+
+    track = CreditTrackData()
+    track.value = "%B4012002000060016^VI TEST CREDIT^251210118039000000000396?"
+    track.entry_method = EntryMethod.Swipe
+
+    debit = DebitTrackData()
+    debit.value = "%B4012002000060016^VI TEST CREDIT^251210118039000000000396?"
+    debit.pin_block = "32539F50C245A6A93D123412324000AA"
+    debit.entry_method = EntryMethod.Swipe
+
+    ebt = EBTCardData()
+    ebt.number = "4012002000060016"
+    ebt.exp_month = "12"
+    ebt.exp_year = "2025"
+    ebt.pin_block = "32539F50C245A6A93D123412324000AA"
+
+    gift = GiftCard()
+    gift.number = "5022440000000000098"
+
+    check = ECheck()
+    check.account_number = "24413815"
+    check.routing_number = "490000018"
+    check.check_type = CheckType.Personal
+    check.sec_code = SecCode.PPD
+    check.account_type = AccountType.Checking
+    check.check_holder_name = "John Doe"
+
+    address = Address()
+    address.street_address_1 = "6860 Dallas Pkwy"
+    address.postal_code = "75024"
+
+    reference = Transaction.from_id("1234567890")
+
+    return (
+        [
+            ("credit auth", "process_authorization", card.authorize(10)),
+            ("credit sale", "process_authorization", card.charge(10)),
+            (
+                "credit sale with address",
+                "process_authorization",
+                card.charge(10).with_address(address).with_invoice_number("INV&1"),
+            ),
+            ("credit verify", "process_authorization", card.verify()),
+            ("credit refund", "process_authorization", card.refund(10)),
+            ("credit balance", "process_authorization", card.balance_inquiry()),
+            (
+                "credit tokenize",
+                "process_authorization",
+                card.verify().with_request_multi_use_token(True),
+            ),
+            ("credit track sale", "process_authorization", track.charge(10)),
+            ("credit track auth", "process_authorization", track.authorize(10)),
+            ("debit sale", "process_authorization", debit.charge(10)),
+            ("debit refund", "process_authorization", debit.refund(10)),
+            ("debit add value", "process_authorization", debit.add_value(10)),
+            ("ebt balance", "process_authorization", ebt.balance_inquiry()),
+            ("ebt sale", "process_authorization", ebt.charge(10)),
+            ("ebt refund", "process_authorization", ebt.refund(10)),
+            ("gift activate", "process_authorization", gift.activate(10)),
+            ("gift add value", "process_authorization", gift.add_value(10)),
+            ("gift balance", "process_authorization", gift.balance_inquiry()),
+            ("gift sale", "process_authorization", gift.charge(10)),
+            ("gift alias", "process_authorization", gift.add_alias("9725550100")),
+            ("gift rewards", "process_authorization", gift.rewards(10)),
+            (
+                "check sale",
+                "process_authorization",
+                check.charge(10).with_address(address),
+            ),
+            ("capture", "manage_transaction", reference.capture(10)),
+            ("void", "manage_transaction", reference.void()),
+            ("reversal", "manage_transaction", reference.reverse(10)),
+        ]
+        + credit_corpus()
+        + [
+            ("report activity", "process_report", ReportingService.activity()),
+            (
+                "report detail",
+                "process_report",
+                ReportingService.transaction_detail("1234567890"),
+            ),
+        ]
+    )
+
+
+def credit_corpus():
+    """
+    Variants of the CreditSale and CreditAuth requests and of the
+    management requests
+    """
+
+    def card():
+        result = CreditCardData()
+        result.number = "5473 5000 0000 0014"
+        result.exp_month = 12
+        result.exp_year = 2030
+        result.cvn = "123"
+        return result
+
+    address = Address()
+    address.street_address_1 = "1 Main St & Co"
+    address.city = "Zürich"
+    address.state = "NY"
+    address.postal_code = "12345"
+
+    ecommerce = ECommerceInfo()
+    ecommerce.ship_day = 9
+    ecommerce.ship_month = 4
+
+    token = card()
+    token.token = "supt_token"
+    token.exp_month = "12"
+    token.exp_year = "2030"
+
+    present = card()
+    present.card_present = True
+    present.reader_present = True
+
+    secure_ecommerce = card()
+    secure_ecommerce.three_d_secure = ECommerceInfo()
+    secure_ecommerce.three_d_secure.payment_data_source = "ApplePay"
+    secure_ecommerce.three_d_secure.cavv = "AAACBllleHchZTBWIGV4AAAAAAA="
+    secure_ecommerce.three_d_secure.eci = "5"
+
+    secure_3d = card()
+    secure_3d.three_d_secure = ThreeDSecure()
+    secure_3d.three_d_secure.version = ThreeDSecureVersion.Two
+    secure_3d.three_d_secure.cavv = "AAACBllleHchZTBWIGV4AAAAAAA="
+    secure_3d.three_d_secure.xid = "0f8c3b0f-3c58-4d0b-8bc4-d4e2d5d6d1b1"
+    secure_3d.three_d_secure.eci = 5
+
+    encrypted = card()
+    encrypted.encryption_data = EncryptionData.version_2("ktb", "2")
+    encrypted.encryption_data.ksn = "ksn"
+
+    stored = RecurringPaymentMethod("customer-1", "card-1")
+    stored.payment_method = card()
+
+    template = TransactionTemplate(
+        AuthorizationBuilder(TransactionType.Sale)
+        .with_currency("USD")
+        .with_allow_duplicates(True)
+        .with_address(address)
+        .with_ecommerce_info(ecommerce)
+        .with_invoice_number("kiosk-12")
+        .with_dynamic_descriptor("KIOSK 12")
+    )
+
+    reference = Transaction.from_id("1234567890")
+    by_client_id = TransactionReference()
+    by_client_id.client_transaction_id = "client-1"
+    by_client_id.payment_method_type = PaymentMethodType.Credit
+
+    return [
+        ("credit sale, number only", "process_authorization", card().charge()),
+        (
+            "credit sale with amounts",
+            "process_authorization",
+            card()
+            .charge(10.5)
+            .with_gratuity(1)
+            .with_convenience_amt(2)
+            .with_shipping_amt(3)
+            .with_allow_duplicates(True)
+            .with_allow_partial_auth(True),
+        ),
+        (
+            "credit sale with details",
+            "process_authorization",
+            card()
+            .charge(10)
+            .with_address(address)
+            .with_customer_id("customer & 1")
+            .with_description("<description>")
+            .with_invoice_number("INV-1")
+            .with_ecommerce_info(ecommerce)
+            .with_dynamic_descriptor("DESCRIPTOR")
+            .with_client_transaction_id("client-1"),
+        ),
+        (
+            "credit sale, token",
+            "process_authorization",
+            token.charge(10).with_request_multi_use_token(True),
+        ),
+        ("credit sale, card present", "process_authorization", present.charge(10)),
+        (
+            "credit sale, secure ecommerce",
+            "process_authorization",
+            secure_ecommerce.charge(10),
+        ),
+        ("credit sale, 3DS 2", "process_authorization", secure_3d.charge(10)),
+        ("credit sale, encrypted", "process_authorization", encrypted.charge(10)),
+        (
+            "credit sale, stored credential",
+            "process_authorization",
+            card()
+            .charge(10)
+            .with_card_brand_storage(StoredCredentialInitiator.Merchant, "brand-1"),
+        ),
+        (
+            "credit sale, recurring",
+            "process_authorization",
+            card()
+            .charge(10)
+            .with_transaction_modifier(TransactionModifier.Recurring)
+            .with_schedule_id("schedule-1")
+            .with_one_time_payment(True),
+        ),
+        (
+            "credit sale, level II",
+            "process_authorization",
+            card().charge(10).with_commercial_request(True),
+        ),
+        (
+            "credit sale, cash back",
+            "process_authorization",
+            card().charge(15).with_cash_back(5),
+        ),
+        (
+            "credit auth, offline",
+            "process_authorization",
+            card()
+            .authorize(10)
+            .with_transaction_modifier(TransactionModifier.Offline)
+            .with_offline_auth_code("12345A"),
+        ),
+        (
+            "credit auth, incremental",
+            "process_authorization",
+            card()
+            .authorize(10)
+            .with_transaction_modifier(TransactionModifier.Incremental),
+        ),
+        (
+            "credit sale, template",
+            "process_authorization",
+            template._create_checked(card(), 10, None),
+        ),
+        (
+            "credit sale, template again",
+            "process_authorization",
+            template._create_checked(token, 11, None),
+        ),
+        ("stored card sale", "process_authorization", stored.charge(10)),
+        (
+            "refund by client transaction id",
+            "manage_transaction",
+            ManagementBuilder(TransactionType.Refund, by_client_id).with_amount(10),
+        ),
+        (
+            "reversal by client transaction id",
+            "manage_transaction",
+            ManagementBuilder(TransactionType.Reversal, by_client_id).with_amount(10),
+        ),
+        (
+            "capture with gratuity",
+            "manage_transaction",
+            reference.capture(10).with_auth_amount(12).with_gratuity(2),
+        ),
+        (
+            "level II edit",
+            "manage_transaction",
+            reference.edit()
+            .with_po_number("PO&1")
+            .with_tax_type(TaxType.SalesTax)
+            .with_tax_amount(1),
+        ),
+        (
+            "token update",
+            "manage_transaction",
+            ManagementBuilder(TransactionType.TokenUpdate, token),
+        ),
+        (
+            "token delete",
+            "manage_transaction",
+            ManagementBuilder(TransactionType.TokenDelete, token),
+        ),
+        (
+            "batch close",
+            "manage_transaction",
+            ManagementBuilder(TransactionType.BatchClose),
+        ),
+    ]
+
+
+def realex_corpus():
+    card = CreditCardData()
+    card.number = "4263970000005262"
+    card.exp_month = "05"
+    card.exp_year = "2025"
+    card.cvn = "123"
+    card.card_holder_name = "James Mason"
+
+    customer = Customer()
+    customer.key = "customer-1"
+    customer.first_name = "James"
+    customer.last_name = "Mason"
+    customer.address = Address()
+    customer.address.street_address_1 = "Flat 123"
+    customer.address.city = "Halifax"
+    customer.address.postal_code = "W6 9HR"
+    customer.address.country = "United Kingdom"
+    customer.email = "test@example.com"
+
+    payment_method = RecurringPaymentMethod("customer-1", "card-1")
+    payment_method.payment_method = card
+
+    reference = Transaction.from_id("1234567890", "order-1")
+
+    return [
+        ("auth", "process_authorization", card.authorize(10).with_currency("EUR")),
+        ("sale", "process_authorization", card.charge(10).with_currency("EUR")),
+        ("verify", "process_authorization", card.verify()),
+        ("refund", "process_authorization", card.refund(10).with_currency("EUR")),
+        (
+            "stored card sale",
+            "process_authorization",
+            payment_method.charge(10).with_currency("EUR"),
+        ),
+        ("capture", "manage_transaction", reference.capture(10)),
+        ("void", "manage_transaction", reference.void()),
+        (
+            "rebate",
+            "manage_transaction",
+            reference.refund(10).with_currency("EUR"),
+        ),
+        (
+            "create payer",
+            "process_recurring",
+            RecurringBuilder(TransactionType.Create, customer),
+        ),
+        (
+            "create card",
+            "process_recurring",
+            RecurringBuilder(TransactionType.Create, payment_method),
+        ),
+    ]
+
+
+class XmlWriterTests(unittest.TestCase):
+    def assertSameAsElementTree(self, element):
+        self.assertEqual(et.tostring(element), tostring(element))
+
+    def test_escaping_and_empty_elements(self):
+        root = et.Element("request", {"type": 'a&b<c>"d"', "ws": "\r\n\t"})
+        et.SubElement(root, "text").text = "Jöhn & <Doe> 'quoted'"
+        et.SubElement(root, "empty")
+        et.SubElement(root, "blank").text = ""
+        et.SubElement(root, "tailed").tail = " & tail"
+        self.assertSameAsElementTree(root)
+
+    def test_falls_back_for_qualified_names_and_comments(self):
+        root = et.Element("{http://example.com}request")
+        root.append(et.Comment("comment"))
+        self.assertSameAsElementTree(root)
+
+    def test_writes_elements_directly(self):
+        writer = XmlWriter()
+        writer.start("request", {"type": "auth"})
+        writer.element("amount", 10, {"currency": "EUR"})
+        writer.element("empty")
+        writer.start("closed", {"id": "1"})
+        writer.end("closed")
+        writer.end("request")
+
+        expected = et.Element("request", {"type": "auth"})
+        et.SubElement(expected, "amount", {"currency": "EUR"}).text = "10"
+        et.SubElement(expected, "empty")
+        et.SubElement(expected, "closed", {"id": "1"})
+        self.assertEqual(et.tostring(expected), writer.getvalue())
+
+    def test_writes_raw_elements_as_is(self):
+        root = et.Element("request")
+        et.SubElement(root, "amount").text = "10"
+        root.append(raw_element(b"<currency>EUR</currency><empty />"))
+        et.SubElement(root, "last")
+
+        self.assertEqual(
+            b"<request><amount>10</amount><currency>EUR</currency><empty />"
+            b"<last /></request>",
+            tostring(root),
+        )
+
+
+class XmlWriterCorpusTests(unittest.TestCase):
+    """
+    Serializes every request the connectors build for the corpus and
+    compares the bytes with ElementTree's, or with the Portico requests
+    recorded in `tests/data/portico_requests.json`
+    """
+
+    def run_corpus(self, connector, corpus):
+        requests = {}
+        for name, method, builder in corpus:
+            with self.subTest(name):
+                elements = []
+                tree = XmlWriter.tree
+
+                def record(writer, element):
+                    elements.append(element)
+                    tree(writer, element)
+
+                connector.requests = []
+                with mock.patch.object(XmlWriter, "tree", record):
+                    with self.assertRaises(Captured):
+                        getattr(connector, method)(builder)
+
+                for element in elements:
+                    if all(child.tag is not raw_element for child in element.iter()):
+                        expected = et.tostring(element)
+                        self.assertEqual(expected, tostring(element))
+                        self.assertIn(expected, connector.requests[0])
+                requests[name] = connector.requests[0]
+        return requests
+
+    def test_portico_requests(self):
+        connector = RecordingPorticoConnector()
+        connector.secret_api_key = "skapi_cert_test"
+        connector.sdkNameVersion = "python;version=corpus"
+        with open(GOLDEN_PORTICO_REQUESTS, encoding="ascii") as golden:
+            expected = json.load(golden)
+
+        requests = self.run_corpus(connector, portico_corpus())
+
+        self.assertEqual(set(expected), set(requests))
+        for name, request in requests.items():
+            with self.subTest(name):
+                self.assertEqual(expected[name], request.decode("ascii"))
+
+    def test_realex_requests(self):
+        connector = RecordingRealexConnector()
+        connector.merchant_id = "merchant"
+        connector.account_id = "api"
+        connector.shared_secret = "secret"
+        connector.rebate_password = "rebate"
+        connector.refund_password = "refund"
+        self.run_corpus(connector, realex_corpus())